@@ -0,0 +1,124 @@
+"""
+Benchmark full document inventory retrieval strategies.
+
+Compares ``get_documents`` (one large response), sequential iteration over
+``/documents/paginated`` and the concurrent ``get_document_inventory`` against an
+in-process mock LightRAG server with simulated network latency.
+
+Usage:
+    python benchmarks/bench_document_inventory.py [--documents 20000] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+import httpx
+
+from daniel_lightrag_mcp.client import LightRAGClient
+
+
+def build_documents(count: int) -> list:
+    """Build synthetic document records shaped like LightRAG's document status entries."""
+    statuses = ["processed", "processed", "processed", "pending", "failed"]
+    return [
+        {
+            "id": f"doc-{i:08d}",
+            "status": statuses[i % len(statuses)],
+            "content_summary": f"Summary of document {i} " * 4,
+            "content_length": 1000 + i,
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "file_path": f"doc_{i}.txt",
+        }
+        for i in range(count)
+    ]
+
+
+def build_transport(documents: list, latency: float, per_doc_latency: float) -> httpx.MockTransport:
+    """Create a mock transport serving /documents and /documents/paginated."""
+    by_status = {}
+    for doc in documents:
+        by_status.setdefault(doc["status"], []).append(doc)
+    status_counts = {status: len(docs) for status, docs in by_status.items()}
+    status_counts["all"] = len(documents)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/documents":
+            await asyncio.sleep(latency + per_doc_latency * len(documents))
+            return httpx.Response(200, json={"statuses": by_status})
+        if request.url.path == "/documents/paginated":
+            body = json.loads(request.content)
+            page, page_size = body["page"], body["page_size"]
+            total_pages = max(1, (len(documents) + page_size - 1) // page_size)
+            chunk = documents[(page - 1) * page_size:page * page_size]
+            await asyncio.sleep(latency + per_doc_latency * len(chunk))
+            return httpx.Response(200, json={
+                "documents": chunk,
+                "pagination": {
+                    "page": page,
+                    "page_size": page_size,
+                    "total_count": len(documents),
+                    "total_pages": total_pages,
+                    "has_next": page < total_pages,
+                    "has_prev": page > 1,
+                },
+                "status_counts": status_counts,
+            })
+        return httpx.Response(404, json={"detail": "Not Found"})
+
+    return httpx.MockTransport(handler)
+
+
+async def run(document_count: int, latency: float, per_doc_latency: float, concurrency: int) -> None:
+    documents = build_documents(document_count)
+    client = LightRAGClient(base_url="http://lightrag.bench")
+    await client.client.aclose()
+    client.client = httpx.AsyncClient(transport=build_transport(documents, latency, per_doc_latency))
+
+    async def full_list():
+        result = await client.get_documents()
+        return sum(len(docs) for docs in result.statuses.values())
+
+    async def sequential():
+        return len([doc async for doc in client.iter_documents(page_size=100, prefetch=0)])
+
+    async def prefetched():
+        return len([doc async for doc in client.iter_documents(page_size=100, prefetch=2)])
+
+    async def inventory():
+        result = await client.get_document_inventory(page_size=100, concurrency=concurrency)
+        return len(result.documents)
+
+    print(f"{document_count} documents, {latency * 1000:.0f} ms latency per request")
+    for name, strategy in [
+        ("get_documents", full_list),
+        ("paginated (sequential)", sequential),
+        ("paginated (prefetch=2)", prefetched),
+        (f"get_document_inventory (concurrency={concurrency})", inventory),
+    ]:
+        started = time.perf_counter()
+        count = await strategy()
+        elapsed = time.perf_counter() - started
+        print(f"  {name:<45} {elapsed * 1000:9.1f} ms  ({count} documents)")
+
+    async with client:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=20000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--per-doc-us", type=float, default=5.0, help="Simulated server cost per document")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.documents, args.latency_ms / 1000, args.per_doc_us / 1e6, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark event-loop lag while a large tool result is serialized.
+
+A probe task sleeps for 1 ms at a time and records how late each wake-up is,
+which is how long other tool calls would have waited. The benchmark compares:
+
+- ``before``: ``model_dump()`` plus encoding on the event loop, as tool results
+  used to be serialized;
+- ``inline``: ``_create_success_response`` on the event loop;
+- ``offloaded``: ``_create_success_response_async``, which serializes results
+  above ``LIGHTRAG_SERIALIZE_OFFLOAD_ITEMS`` in a worker thread.
+
+Usage:
+    python benchmarks/bench_event_loop_lag.py [--sizes 1000 10000 50000] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+from daniel_lightrag_mcp.codec import get_codec
+from daniel_lightrag_mcp.models import GraphResponse
+from daniel_lightrag_mcp.server import _create_success_response, _create_success_response_async
+
+sys.path.insert(0, os.path.dirname(__file__))
+from bench_response_parsing import build_graph  # noqa: E402
+
+PROBE_INTERVAL = 0.001
+
+
+async def probe(lags: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - started - PROBE_INTERVAL)
+
+
+async def measure(serialize) -> tuple:
+    """Return (elapsed, max lag, p99 lag) in seconds while ``serialize`` runs."""
+    lags: list = []
+    stop = asyncio.Event()
+    task = asyncio.create_task(probe(lags, stop))
+    await asyncio.sleep(0.02)
+    lags.clear()
+    started = time.perf_counter()
+    await serialize()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await task
+    lags.sort()
+    return elapsed, lags[-1], lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+
+
+async def run(sizes: list, repeat: int) -> None:
+    codec = get_codec()
+
+    async def before(result):
+        repr(result)
+        codec.dumps(result.model_dump())
+
+    async def inline(result):
+        _create_success_response(result, "get_knowledge_graph")
+
+    async def offloaded(result):
+        await _create_success_response_async(result, "get_knowledge_graph")
+
+    print(f"codec: {codec.name}")
+    print(f"{'nodes':>8} {'mode':<10} {'elapsed':>11} {'max lag':>11} {'p99 lag':>11}")
+    for count in sizes:
+        result = GraphResponse(**build_graph(count))
+        for name, serialize in (("before", before), ("inline", inline), ("offloaded", offloaded)):
+            runs = [await measure(lambda: serialize(result)) for _ in range(repeat)]
+            elapsed, max_lag, p99_lag = (statistics.median(column) for column in zip(*runs))
+            print(
+                f"{count:>8} {name:<10} {elapsed * 1000:>8.1f} ms {max_lag * 1000:>8.1f} ms "
+                f"{p99_lag * 1000:>8.1f} ms"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # The server logs every response at INFO; keep the benchmark output readable
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark JSON encoding and decoding of large LightRAG payloads per codec.
+
+Compares every installed backend of ``daniel_lightrag_mcp.codec`` (selected at
+runtime with ``LIGHTRAG_JSON_CODEC``) on synthetic ``/graphs`` and
+``/documents/paginated`` bodies, for compact and indented output.
+
+Usage:
+    python benchmarks/bench_json_codec.py [--sizes 1000 10000 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from daniel_lightrag_mcp import codec as codec_module
+from daniel_lightrag_mcp.codec import JSONCodec
+
+sys.path.insert(0, os.path.dirname(__file__))
+from bench_response_parsing import build_documents, build_graph  # noqa: E402
+
+
+def available_codecs() -> list:
+    names = ["json"]
+    names += [name for name in ("orjson", "msgspec") if getattr(codec_module, name) is not None]
+    return [JSONCodec(name) for name in names]
+
+
+def best_of(repeat: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    print(f"{'payload':<10} {'items':>8} {'codec':<8} {'size':>10} {'dumps':>11} {'indent':>11} {'loads':>11}")
+    for count in args.sizes:
+        documents = build_documents(count)
+        payloads = [
+            ("graph", build_graph(count)),
+            ("documents", {"documents": documents, "pagination": {"page": 1, "total_count": count}}),
+        ]
+        for name, data in payloads:
+            encoded = codecs[0].dumps_bytes(data)
+            for codec in codecs:
+                dumps = best_of(args.repeat, codec.dumps, data)
+                indent = best_of(args.repeat, codec.dumps, data, True)
+                loads = best_of(args.repeat, codec.loads, encoded)
+                print(
+                    f"{name:<10} {count:>8} {codec.name:<8} {len(encoded) / 1e6:>7.1f} MB "
+                    f"{dumps * 1000:>8.1f} ms {indent * 1000:>8.1f} ms {loads * 1000:>8.1f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
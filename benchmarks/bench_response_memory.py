@@ -0,0 +1,74 @@
+"""
+Benchmark peak memory while a large tool result is serialized.
+
+Uses ``tracemalloc`` to compare the peak Python allocations of:
+
+- ``before``: ``repr()`` for the log, ``model_dump()``, a formatted log copy of
+  the dump, then encoding, as tool results used to be serialized;
+- ``model_dump``: ``model_dump()`` plus encoding, without the log copies;
+- ``iterencode``: ``_create_success_response``, which encodes large results in
+  pieces straight from the model.
+
+Usage:
+    python benchmarks/bench_response_memory.py [--sizes 10000 50000] [--indent]
+"""
+
+import argparse
+import gc
+import logging
+import os
+import sys
+import tracemalloc
+
+from daniel_lightrag_mcp.codec import get_codec
+from daniel_lightrag_mcp.models import GraphResponse
+from daniel_lightrag_mcp.server import _create_success_response
+
+sys.path.insert(0, os.path.dirname(__file__))
+from bench_response_parsing import build_graph  # noqa: E402
+
+
+def peak_mb(serialize, result) -> tuple:
+    """Return (peak allocated MB, output MB) for one call of ``serialize``."""
+    gc.collect()
+    tracemalloc.start()
+    output = serialize(result)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6, len(output) / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--indent", action="store_true", help="measure indented output")
+    args = parser.parse_args()
+
+    # The server logs every response at INFO; keep the benchmark output readable
+    logging.disable(logging.INFO)
+    codec = get_codec()
+    compact = not args.indent
+
+    def before(result):
+        log_copies = [repr(result)]
+        data = result.model_dump()
+        log_copies.append(f"{data}")
+        return codec.dumps(data, indent=args.indent)
+
+    def model_dump(result):
+        return codec.dumps(result.model_dump(), indent=args.indent)
+
+    def iterencode(result):
+        return _create_success_response(result, "get_knowledge_graph", compact=compact)["content"][0]["text"]
+
+    print(f"codec: {codec.name}, indent: {args.indent}")
+    print(f"{'nodes':>8} {'mode':<11} {'output':>10} {'peak':>10}")
+    for count in args.sizes:
+        result = GraphResponse(**build_graph(count))
+        for name, serialize in (("before", before), ("model_dump", model_dump), ("iterencode", iterencode)):
+            peak, output = peak_mb(serialize, result)
+            print(f"{count:>8} {name:<11} {output:>7.1f} MB {peak:>7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
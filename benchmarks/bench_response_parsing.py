@@ -0,0 +1,112 @@
+"""
+Benchmark validated vs trusted parsing of large LightRAG responses.
+
+Compares ``Model(**data)`` (full Pydantic validation) with ``parse_trusted``
+(top-level validation only) on synthetic ``/graphs``, ``/graph/label/list``,
+``/documents`` and ``/documents/paginated`` bodies. With
+``LIGHTRAG_TRUSTED_RESPONSES`` set, the client only routes graph and label
+responses through ``parse_trusted``; the document payloads are measured to show
+why they are not.
+
+Usage:
+    python benchmarks/bench_response_parsing.py [--sizes 1000 10000 100000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from daniel_lightrag_mcp.fast_parse import parse_trusted
+from daniel_lightrag_mcp.models import DocumentsResponse, GraphResponse, LabelsResponse, PaginatedDocsResponse
+
+
+def build_graph(count: int) -> dict:
+    """Build a graph body shaped like LightRAG's /graphs response."""
+    nodes = [
+        {
+            "id": f"Entity {i}",
+            "labels": [f"Entity {i}"],
+            "properties": {
+                "entity_id": f"Entity {i}",
+                "entity_type": ["organization", "person", "concept"][i % 3],
+                "description": f"Description of entity {i}. " * 3,
+                "source_id": f"chunk-{i % 500:04d}",
+                "file_path": f"doc_{i % 100}.txt",
+            },
+        }
+        for i in range(count)
+    ]
+    edges = [
+        {
+            "id": f"Entity {i}-Entity {(i * 7 + 1) % count}",
+            "type": "DIRECTED",
+            "source": f"Entity {i}",
+            "target": f"Entity {(i * 7 + 1) % count}",
+            "properties": {"weight": 1.0 + i % 5, "description": f"Relation {i}", "keywords": "related"},
+        }
+        for i in range(count)
+    ]
+    return {"nodes": nodes, "edges": edges, "is_truncated": False}
+
+
+def build_documents(count: int) -> list:
+    statuses = ["processed", "processed", "processed", "pending", "failed"]
+    return [
+        {
+            "id": f"doc-{i:08d}",
+            "status": statuses[i % len(statuses)],
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "metadata": {"file_path": f"doc_{i}.txt", "content_length": 1000 + i},
+        }
+        for i in range(count)
+    ]
+
+
+def build_payloads(count: int) -> list:
+    documents = build_documents(count)
+    by_status = {}
+    for document in documents:
+        by_status.setdefault(document["status"], []).append(document)
+    paginated = {
+        "documents": documents,
+        "pagination": {
+            "page": 1, "page_size": count, "total_count": count,
+            "total_pages": 1, "has_next": False, "has_prev": False,
+        },
+    }
+    return [
+        ("GraphResponse", GraphResponse, build_graph(count)),
+        ("LabelsResponse", LabelsResponse, {"entity_labels": [f"Entity {i}" for i in range(count)]}),
+        ("DocumentsResponse", DocumentsResponse, {"statuses": by_status}),
+        ("PaginatedDocsResponse", PaginatedDocsResponse, paginated),
+    ]
+
+
+def best_of(repeat: int, parse, model, data) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse(model, data)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'payload':<22} {'items':>8} {'validated':>12} {'trusted':>12} {'speedup':>8}")
+    for count in args.sizes:
+        for name, model, data in build_payloads(count):
+            validated = best_of(args.repeat, lambda model, data: model(**data), model, data)
+            trusted = best_of(args.repeat, parse_trusted, model, data)
+            print(
+                f"{name:<22} {count:>8} {validated * 1000:>9.1f} ms {trusted * 1000:>9.1f} ms "
+                f"{validated / trusted if trusted else float('inf'):>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -43,10 +43,15 @@ __all__ = [
     "DocumentInfo",
     "DocumentsResponse",
     "PaginatedDocsResponse",
+    "DocumentInventoryResponse",
+    "DocumentMirrorResponse",
     "DeleteDocByIdResponse",
+    "DocumentDeletionOutcome",
+    "BatchDeleteResponse",
     "ClearDocumentsResponse",
     "PipelineStatusResponse",
     "TrackStatusResponse",
+    "TrackWaitResponse",
     "StatusCountsResponse",
     "ClearCacheResponse",
     "DeletionResult",
@@ -56,9 +61,28 @@ __all__ = [
     "RelationInfo",
     "GraphResponse",
     "LabelsResponse",
+    "LabelMatch",
+    "LabelSearchResponse",
+    "DuplicatePair",
+    "DuplicateGroup",
+    "DuplicateEntitiesResponse",
+    "GraphNeighborsResponse",
+    "GraphDeltaResponse",
+    "GraphDegreeResponse",
+    "GraphEdgeLookupResponse",
+    "GraphDegreeStats",
+    "GraphComponentStats",
+    "GraphPageRankStats",
+    "GraphStatsResponse",
     "EntityExistsResponse",
+    "EntitiesExistResponse",
     "EntityUpdateResponse",
     "RelationUpdateResponse",
+    "BulkUpdateItemResult",
+    "BulkUpdateResponse",
+    "EntityFlushResponse",
+    "PagedResultResponse",
+    "SpilledResultResponse",
     "HealthResponse",
     "AuthStatusResponse",
     "LoginResponse",
@@ -5,7 +5,9 @@ LightRAG API client for MCP server integration.
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, AsyncGenerator
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, AsyncGenerator, Tuple, Type, TypeVar, Union
 import httpx
 from .models import (
     # Request models
@@ -17,8 +19,16 @@ from .models import (
     DeleteDocByIdResponse, ClearDocumentsResponse, PipelineStatusResponse, TrackStatusResponse,
     StatusCountsResponse, ClearCacheResponse, DeletionResult, QueryResponse, GraphResponse,
     LabelsResponse, EntityExistsResponse, EntityUpdateResponse, RelationUpdateResponse,
-    HealthResponse, TextDocument
+    HealthResponse, TextDocument, TrackWaitResponse, DocumentInfo, DocumentInventoryResponse,
+    DocumentDeletionOutcome, BatchDeleteResponse, EntitiesExistResponse, BulkUpdateItemResult,
+    BulkUpdateResponse, EntityFlushResponse, GraphDeltaResponse
 )
+from .compact_graph import CompactGraph
+from .graph_delta import GraphSnapshotStore
+from .json_stream import JSONStreamParser, StreamEvent
+from .fast_parse import parse_trusted
+from .codec import get_codec
+from .multipart import MultipartFileBody, file_info_async
 
 
 # Custom Exception Hierarchy
@@ -71,15 +81,66 @@ class LightRAGServerError(LightRAGError):
     pass
 
 
+# Document statuses after which LightRAG does no further work on a document
+TERMINAL_DOC_STATUSES = ("processed", "failed")
+
+# Deletion statuses LightRAG returns when it did not accept a delete request
+REJECTED_DELETE_STATUSES = ("busy", "not_allowed", "fail", "failed", "error")
+
+ModelT = TypeVar("ModelT")
+
+# Bytes read per chunk when parsing large response bodies incrementally
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
 class LightRAGClient:
     """Client for interacting with LightRAG API."""
     
-    def __init__(self, base_url: str = "http://localhost:9621", api_key: Optional[str] = None, timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:9621",
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+        entity_cache_ttl: float = 60.0,
+        entity_cache_size: int = 10000,
+        write_combine_window: float = 0.0,
+        edit_state_ttl: float = 0.0,
+        trusted_responses: bool = False,
+        json_codec: Optional[str] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self.entity_cache_ttl = entity_cache_ttl
+        self.entity_cache_size = entity_cache_size
+        self.write_combine_window = write_combine_window
+        self.edit_state_ttl = edit_state_ttl
+        # Skip element-level validation of large graph and document responses
+        self.trusted_responses = trusted_responses
+        # JSON backend for response bodies; None uses the shared default (LIGHTRAG_JSON_CODEC)
+        self.codec = get_codec(json_codec)
         self.logger = logging.getLogger(__name__)
         
+        # entity name -> (exists, monotonic time the answer was recorded), least recently used first
+        self._entity_exists_cache: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+        
+        # Write-combining state: entity name -> {"entity_id", "updated_data", "edits"}
+        self._pending_entity_edits: Dict[str, Dict[str, Any]] = {}
+        self._entity_flush_timers: Dict[str, "asyncio.Task[None]"] = {}
+        # entity name -> (lock, number of flushes holding or waiting on it)
+        self._entity_flush_locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+        self._write_combine_errors: List[str] = []
+        
+        # Last-known properties used to drop no-op edits: key -> (properties, monotonic time)
+        self._entity_state: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._relation_state: Dict[Tuple[str, str], Tuple[Dict[str, Any], float]] = {}
+        
+        # Bumped whenever this client changes (or may have changed) the graph
+        self.graph_generation = 0
+        
+        # Recent graph fingerprints per (label, max_depth, max_nodes), for delta requests
+        self._graph_snapshots = GraphSnapshotStore()
+        
         headers = {}
         if api_key:
             headers["X-API-Key"] = api_key
@@ -95,7 +156,14 @@ class LightRAGClient:
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        try:
+            if self._pending_entity_edits or self._write_combine_errors:
+                self.logger.info(f"Flushing {len(self._pending_entity_edits)} buffered entity edits before closing")
+                result = await self.flush_entity_edits()
+                for error in result.errors:
+                    self.logger.error(f"Buffered entity edit lost on close: {error}")
+        finally:
+            await self.client.aclose()
     
     def _map_http_error(self, status_code: int, response_text: str, response_data: Optional[Dict[str, Any]] = None) -> LightRAGError:
         """Map HTTP status codes to appropriate exception types."""
@@ -105,7 +173,7 @@ class LightRAGClient:
         parsed_data = response_data or {}
         if response_text:
             try:
-                parsed_data = json.loads(response_text)
+                parsed_data = self.codec.loads(response_text)
                 if isinstance(parsed_data, dict) and "detail" in parsed_data:
                     error_message = f"HTTP {status_code}: {parsed_data['detail']}"
                 elif isinstance(parsed_data, dict) and "message" in parsed_data:
@@ -133,21 +201,36 @@ class LightRAGClient:
         else:
             return LightRAGAPIError(error_message, status_code, parsed_data)
     
+    def _parse_large_response(self, model: Type[ModelT], response_data: Dict[str, Any]) -> ModelT:
+        """Build a model for a potentially large response, on the trusted fast path if enabled.
+        
+        Only worth it for untyped element lists (graph nodes and edges); typed lists such as
+        labels or ``DocumentInfo`` items measured no faster, or slower, on the trusted path.
+        """
+        if self.trusted_responses:
+            return parse_trusted(model, response_data)
+        return model(**response_data)
+    
     async def _make_request(
         self, 
         method: str, 
         endpoint: str, 
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-        files: Optional[Dict[str, Any]] = None
+        files: Optional[Dict[str, Any]] = None,
+        content: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
-        """Make HTTP request to LightRAG API."""
+        """Make HTTP request to LightRAG API.
+
+        ``content`` is a raw (possibly async-iterable) request body, sent with ``headers``.
+        """
         url = f"{self.base_url}{endpoint}"
         
         # Log request details
         self.logger.debug(f"Making {method} request to {url}")
-        if data:
-            self.logger.debug(f"Request data: {json.dumps(data, indent=2)}")
+        if data and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Request data: {self.codec.dumps(data, indent=True)}")
         if params:
             self.logger.debug(f"Request params: {params}")
         
@@ -157,6 +240,8 @@ class LightRAGClient:
             elif method.upper() == "POST":
                 if files:
                     response = await self.client.post(url, data=data, files=files)
+                elif content is not None:
+                    response = await self.client.post(url, content=content, headers=headers)
                 else:
                     response = await self.client.post(url, json=data)
             elif method.upper() == "DELETE":
@@ -180,8 +265,9 @@ class LightRAGClient:
             response.raise_for_status()
             
             try:
-                response_data = response.json()
-                self.logger.debug(f"Response data: {json.dumps(response_data, indent=2)}")
+                response_data = self.codec.loads(response.content)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Response data: {self.codec.dumps(response_data, indent=True)}")
                 self.logger.info(f"Successfully completed {method} request to {endpoint}")
                 return response_data
             except json.JSONDecodeError as json_err:
@@ -220,8 +306,8 @@ class LightRAGClient:
         
         # Log streaming request details
         self.logger.debug(f"Making streaming {method} request to {url}")
-        if data:
-            self.logger.debug(f"Streaming request data: {json.dumps(data, indent=2)}")
+        if data and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Streaming request data: {self.codec.dumps(data, indent=True)}")
         
         try:
             async with self.client.stream(method, url, json=data) as response:
@@ -257,6 +343,61 @@ class LightRAGClient:
             self.logger.error(error_msg)
             raise LightRAGError(error_msg)
     
+    async def _stream_json(
+        self,
+        method: str,
+        endpoint: str,
+        stream_paths: List[Tuple[str, ...]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """Make an HTTP request and parse its JSON body incrementally as it downloads.
+        
+        Elements of the arrays at ``stream_paths`` are yielded one at a time (see
+        :class:`JSONStreamParser`), so the full body is never held in memory.
+        """
+        url = f"{self.base_url}{endpoint}"
+        self.logger.debug(f"Making streaming {method} request to {url}")
+        if params:
+            self.logger.debug(f"Request params: {params}")
+        
+        parser = JSONStreamParser(stream_paths, loads=self.codec.loads)
+        received = 0
+        try:
+            async with self.client.stream(method, url, params=params) as response:
+                self.logger.debug(f"Streaming response status: {response.status_code}")
+                if response.status_code >= 400:
+                    # The error body is needed for the error message
+                    await response.aread()
+                response.raise_for_status()
+                
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    received += len(chunk)
+                    for event in parser.feed(chunk):
+                        yield event
+                for event in parser.close():
+                    yield event
+            
+            self.logger.info(f"Successfully completed streaming {method} request to {endpoint}, parsed {received} bytes")
+        
+        except json.JSONDecodeError as json_err:
+            self.logger.error(f"Failed to parse streamed JSON response: {json_err.msg} at byte {received}")
+            raise LightRAGAPIError(f"Invalid JSON response from server: {json_err.msg}")
+        except httpx.HTTPStatusError as e:
+            self.logger.error(f"HTTP error {e.response.status_code} for streaming {method} {url}: {e.response.text}")
+            raise self._map_http_error(e.response.status_code, e.response.text)
+        except httpx.ConnectError as e:
+            error_msg = f"Connection failed for streaming request to {url}: {str(e)}"
+            self.logger.error(error_msg)
+            raise LightRAGConnectionError(error_msg)
+        except httpx.TimeoutException as e:
+            error_msg = f"Request timeout for streaming {method} {url}: {str(e)}"
+            self.logger.error(error_msg)
+            raise LightRAGTimeoutError(error_msg)
+        except httpx.RequestError as e:
+            error_msg = f"Request failed for streaming {method} {url}: {str(e)}"
+            self.logger.error(error_msg)
+            raise LightRAGConnectionError(error_msg)
+    
     # Document Management Methods (8 methods)
     
     async def insert_text(self, text: str, title: Optional[str] = None) -> InsertResponse:
@@ -267,6 +408,8 @@ class LightRAGClient:
             file_source = f"{title}.txt" if title else "text_input.txt"
             request_data = InsertTextRequest(text=text, file_source=file_source)
             response_data = await self._make_request("POST", "/documents/text", request_data.model_dump())
+            # Ingestion merges new descriptions into existing entities and relations
+            self.invalidate_graph_state()
             result = InsertResponse(**response_data)
             self.logger.info(f"Successfully inserted text document with ID: {result.id}")
             return result
@@ -299,28 +442,29 @@ class LightRAGClient:
         
         request_data = InsertTextsRequest(texts=text_strings, file_sources=file_sources)
         response_data = await self._make_request("POST", "/documents/texts", request_data.model_dump())
+        self.invalidate_graph_state()
         return InsertResponse(**response_data)
     
     async def upload_document(self, file_path: str) -> UploadResponse:
         """Upload a document file to LightRAG."""
         self.logger.info(f"Uploading document file: {file_path}")
         try:
-            # Validate file exists and is readable
-            import os
-            if not os.path.exists(file_path):
+            # Check and read the file in worker threads; it may be on a slow (network) filesystem
+            info = await file_info_async(file_path)
+            if not info.exists:
                 raise FileNotFoundError(f"File does not exist: {file_path}")
-            if not os.access(file_path, os.R_OK):
+            if not info.readable:
                 raise PermissionError(f"File is not readable: {file_path}")
+            self.logger.debug(f"File size: {info.size} bytes")
             
-            file_size = os.path.getsize(file_path)
-            self.logger.debug(f"File size: {file_size} bytes")
-            
-            with open(file_path, 'rb') as f:
-                files = {"file": (os.path.basename(file_path), f, "application/octet-stream")}
-                response_data = await self._make_request("POST", "/documents/upload", files=files)
-                result = UploadResponse(**response_data)
-                self.logger.info(f"Successfully uploaded document: {file_path} ({file_size} bytes) - Track ID: {result.track_id}")
-                return result
+            body = MultipartFileBody(file_path, info.size)
+            response_data = await self._make_request(
+                "POST", "/documents/upload", content=body, headers=body.headers
+            )
+            self.invalidate_graph_state()
+            result = UploadResponse(**response_data)
+            self.logger.info(f"Successfully uploaded document: {file_path} ({info.size} bytes) - Track ID: {result.track_id}")
+            return result
         except FileNotFoundError as e:
             error_msg = f"File not found: {file_path}"
             self.logger.error(error_msg)
@@ -336,9 +480,37 @@ class LightRAGClient:
                 raise
             raise LightRAGError(error_msg)
     
+    async def insert_text_and_wait(
+        self,
+        text: str,
+        title: Optional[str] = None,
+        timeout: float = 120.0,
+        poll_interval: float = 0.5,
+    ) -> TrackWaitResponse:
+        """Insert text and wait until LightRAG has finished processing it."""
+        started = time.monotonic()
+        result = await self.insert_text(text, title=title)
+        if not result.track_id:
+            raise LightRAGAPIError("Insert response did not include a track ID to wait on")
+        return await self._wait_for_track(result.track_id, started, started + timeout, poll_interval)
+    
+    async def upload_document_and_wait(
+        self,
+        file_path: str,
+        timeout: float = 120.0,
+        poll_interval: float = 0.5,
+    ) -> TrackWaitResponse:
+        """Upload a document file and wait until LightRAG has finished processing it."""
+        started = time.monotonic()
+        result = await self.upload_document(file_path)
+        if not result.track_id:
+            raise LightRAGAPIError(f"Upload response for {file_path} did not include a track ID to wait on")
+        return await self._wait_for_track(result.track_id, started, started + timeout, poll_interval)
+    
     async def scan_documents(self) -> ScanResponse:
         """Scan for new documents in LightRAG."""
         response_data = await self._make_request("POST", "/documents/scan")
+        self.invalidate_graph_state()
         return ScanResponse(**response_data)
     
     async def get_documents(self) -> DocumentsResponse:
@@ -346,21 +518,218 @@ class LightRAGClient:
         response_data = await self._make_request("GET", "/documents")
         return DocumentsResponse(**response_data)
     
+    async def stream_documents(self) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream all documents from ``/documents`` without buffering the whole response.
+        
+        Documents are yielded as raw dicts as soon as each is parsed, with a
+        ``status`` key naming the status group they were listed under.
+        """
+        async for event in self._stream_json("GET", "/documents", [("statuses", "*")]):
+            if event.item and isinstance(event.value, dict):
+                yield {"status": event.path[1], **event.value}
+    
     async def get_documents_paginated(self, page: int = 1, page_size: int = 10, status_filter: Optional[str] = None) -> PaginatedDocsResponse:
         """Retrieve documents with pagination from LightRAG."""
         request_data = DocumentsRequest(page=page, page_size=page_size, status_filter=status_filter)
         response_data = await self._make_request("POST", "/documents/paginated", request_data.model_dump())
         return PaginatedDocsResponse(**response_data)
     
+    async def iter_documents(
+        self,
+        page_size: int = 100,
+        status_filter: Optional[str] = None,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+    ) -> AsyncGenerator[DocumentInfo, None]:
+        """Iterate over all documents across pages, fetching upcoming pages in the background.
+        
+        ``prefetch`` is the number of pages requested ahead of the page being consumed
+        (0 fetches strictly one page at a time). Iteration stops after ``max_items``
+        documents, or when the caller stops consuming; outstanding page requests are
+        cancelled in both cases.
+        """
+        if prefetch < 0:
+            raise LightRAGValidationError("Prefetch depth cannot be negative")
+        if max_items is not None and max_items < 0:
+            raise LightRAGValidationError("max_items cannot be negative")
+        
+        pending: Dict[int, "asyncio.Task[PaginatedDocsResponse]"] = {}
+        
+        def schedule(page_number: int) -> None:
+            if page_number not in pending:
+                pending[page_number] = asyncio.ensure_future(
+                    self.get_documents_paginated(page_number, page_size, status_filter)
+                )
+        
+        page = 1
+        yielded = 0
+        try:
+            if max_items == 0:
+                return
+            schedule(page)
+            while True:
+                result = await pending.pop(page)
+                pagination = result.pagination
+                if pagination.has_next:
+                    for ahead in range(page + 1, min(page + prefetch, pagination.total_pages) + 1):
+                        schedule(ahead)
+                self.logger.debug(f"Iterating documents page {page}/{pagination.total_pages} ({len(pending)} pages prefetched)")
+                
+                for document in result.documents:
+                    yield document
+                    yielded += 1
+                    if max_items is not None and yielded >= max_items:
+                        return
+                
+                if not pagination.has_next or not result.documents:
+                    return
+                page += 1
+                schedule(page)
+        finally:
+            for task in pending.values():
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending.values(), return_exceptions=True)
+    
+    async def get_document_inventory(
+        self,
+        page_size: int = 100,
+        status_filter: Optional[str] = None,
+        concurrency: int = 8,
+    ) -> DocumentInventoryResponse:
+        """Fetch the complete document list by requesting all pages concurrently.
+        
+        Page 1 is fetched first to learn the total page count; the remaining pages are
+        then requested with at most ``concurrency`` requests in flight.
+        """
+        if concurrency < 1:
+            raise LightRAGValidationError("Concurrency must be at least 1")
+        
+        first = await self.get_documents_paginated(1, page_size, status_filter)
+        total_pages = first.pagination.total_pages
+        self.logger.info(f"Fetching document inventory: {first.pagination.total_count} documents over {total_pages} pages")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_page(page: int) -> PaginatedDocsResponse:
+            async with semaphore:
+                return await self.get_documents_paginated(page, page_size, status_filter)
+        
+        tasks = [asyncio.ensure_future(fetch_page(page)) for page in range(2, total_pages + 1)]
+        try:
+            pages = [first] + list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        # Documents can move between pages while the fetch is in progress
+        documents: Dict[str, DocumentInfo] = {}
+        for page in pages:
+            for document in page.documents:
+                documents.setdefault(document.id, document)
+        
+        return DocumentInventoryResponse(
+            documents=list(documents.values()),
+            total_count=first.pagination.total_count,
+            pages_fetched=len(pages),
+            status_counts=first.status_counts,
+        )
+    
     async def delete_document(self, document_id: str) -> DeleteDocByIdResponse:
         """Delete a document by ID from LightRAG."""
         request_data = DeleteDocRequest(doc_ids=[document_id])
         response_data = await self._make_request("DELETE", "/documents/delete_document", request_data.model_dump())
+        # Deleting documents removes their entities, so every cached existence answer may be wrong
+        self.invalidate_entity_cache()
+        self.invalidate_graph_state()
         return DeleteDocByIdResponse(**response_data)
     
+    async def delete_documents(
+        self,
+        document_ids: Optional[List[str]] = None,
+        status_filter: Optional[str] = None,
+        chunk_size: int = 100,
+        concurrency: int = 1,
+        busy_timeout: float = 120.0,
+        poll_interval: float = 0.5,
+    ) -> BatchDeleteResponse:
+        """Delete many documents using the multi-ID delete endpoint.
+        
+        IDs are given explicitly or selected by ``status_filter``. They are deduplicated
+        and split into chunks of ``chunk_size`` per request. LightRAG deletes in a single
+        background pipeline, so by default chunks are sent one at a time: before each
+        chunk after the first, and whenever a chunk is rejected because the pipeline is
+        busy, the pipeline status is polled until it is idle. A chunk is reported as busy
+        only if the pipeline stays busy for ``busy_timeout`` seconds.
+        """
+        if (document_ids is None) == (status_filter is None):
+            raise LightRAGValidationError("Provide either document_ids or status_filter")
+        if chunk_size < 1:
+            raise LightRAGValidationError("Chunk size must be at least 1")
+        if concurrency < 1:
+            raise LightRAGValidationError("Concurrency must be at least 1")
+        
+        if status_filter is not None:
+            inventory = await self.get_document_inventory(status_filter=status_filter)
+            document_ids = [document.id for document in inventory.documents]
+        ids = list(dict.fromkeys(doc_id for doc_id in document_ids if doc_id))
+        chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        self.logger.warning(f"Deleting {len(ids)} documents in {len(chunks)} requests")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        requests_made = 0
+        
+        async def delete_chunk(index: int, chunk: List[str]) -> List[DocumentDeletionOutcome]:
+            nonlocal requests_made
+            async with semaphore:
+                deadline = time.monotonic() + busy_timeout
+                # The previous chunk's deletion is still running in the background
+                if index > 0:
+                    await self._wait_for_pipeline_idle(deadline, poll_interval)
+                while True:
+                    requests_made += 1
+                    try:
+                        request_data = DeleteDocRequest(doc_ids=chunk)
+                        response_data = await self._make_request("DELETE", "/documents/delete_document", request_data.model_dump())
+                        result = DeleteDocByIdResponse(**response_data)
+                    except Exception as e:
+                        self.logger.error(f"Failed to delete chunk of {len(chunk)} documents: {e}")
+                        return [
+                            DocumentDeletionOutcome(doc_id=doc_id, success=False, status="error", message=str(e))
+                            for doc_id in chunk
+                        ]
+                    if result.status.lower() != "busy":
+                        break
+                    self.logger.info(f"Pipeline busy, waiting for it to finish before retrying delete of {len(chunk)} documents")
+                    if not await self._wait_for_pipeline_idle(deadline, poll_interval):
+                        break
+                success = result.status.lower() not in REJECTED_DELETE_STATUSES
+                return [
+                    DocumentDeletionOutcome(doc_id=doc_id, success=success, status=result.status, message=result.message)
+                    for doc_id in chunk
+                ]
+        
+        outcomes = await asyncio.gather(*(delete_chunk(index, chunk) for index, chunk in enumerate(chunks)))
+        results = [outcome for chunk_outcomes in outcomes for outcome in chunk_outcomes]
+        succeeded = sum(1 for outcome in results if outcome.success)
+        if succeeded:
+            self.invalidate_entity_cache()
+            self.invalidate_graph_state()
+        return BatchDeleteResponse(
+            requested=len(ids),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            requests_made=requests_made,
+            results=results,
+        )
+    
     async def clear_documents(self) -> ClearDocumentsResponse:
         """Clear all documents from LightRAG."""
         response_data = await self._make_request("DELETE", "/documents")
+        self.invalidate_entity_cache()
+        self.invalidate_graph_state()
         return ClearDocumentsResponse(**response_data)
     
     # Query Methods (2 methods)
@@ -377,6 +746,7 @@ class LightRAGClient:
         if mode not in valid_modes:
             raise LightRAGValidationError(f"Invalid query mode '{mode}'. Must be one of: {valid_modes}")
         
+        await self._flush_before_read()
         try:
             request_data = QueryRequest(query=query, mode=mode, only_need_context=only_need_context)
             response_data = await self._make_request("POST", "/query", request_data.model_dump())
@@ -403,6 +773,7 @@ class LightRAGClient:
         
         self.logger.info(f"Starting streaming query with mode '{mode}': {query[:100]}{'...' if len(query) > 100 else ''}")
         
+        await self._flush_before_read()
         try:
             request_data = QueryRequest(query=query, mode=mode, only_need_context=only_need_context, stream=True)
             async for chunk in self._stream_request("POST", "/query/stream", request_data.model_dump()):
@@ -415,34 +786,380 @@ class LightRAGClient:
     
     # Knowledge Graph Methods (8 methods)
     
-    async def get_knowledge_graph(self, label: str = "*") -> GraphResponse:
-        """Retrieve the knowledge graph from LightRAG."""
-        params = {"label": label}
+    async def get_knowledge_graph(
+        self,
+        label: str = "*",
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+    ) -> GraphResponse:
+        """Retrieve the knowledge graph from LightRAG.
+        
+        ``label`` selects the subgraph around one entity (``"*"`` for the whole graph),
+        ``max_depth`` limits how many hops from it are followed and ``max_nodes`` caps
+        the number of nodes returned. Unset limits use the server defaults.
+        """
+        params = self._graph_params(label, max_depth, max_nodes)
+        await self._flush_before_read()
         response_data = await self._make_request("GET", "/graphs", params=params)
-        return GraphResponse(**response_data)
+        graph = self._parse_large_response(GraphResponse, response_data)
+        self._remember_graph_state(graph)
+        return graph
+    
+    async def get_knowledge_graph_delta(
+        self,
+        since_version: Optional[int] = None,
+        label: str = "*",
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+    ) -> GraphDeltaResponse:
+        """Fetch the graph and return only what changed since an earlier snapshot version.
+        
+        Each call records the fetched graph as a new snapshot version (or reuses the
+        latest one if nothing changed). Without ``since_version`` the whole graph is
+        returned as added, together with the version to diff against next time.
+        """
+        graph = await self.get_knowledge_graph(label=label, max_depth=max_depth, max_nodes=max_nodes)
+        delta = self._graph_snapshots.diff((label, max_depth, max_nodes), graph, since_version)
+        self.logger.info(
+            f"Graph delta since version {since_version} -> {delta.version}: "
+            f"{len(delta.added_nodes)} added, {len(delta.changed_nodes)} changed, "
+            f"{len(delta.removed_node_ids)} removed nodes"
+        )
+        return delta
+    
+    async def stream_knowledge_graph(
+        self,
+        label: str = "*",
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+    ) -> AsyncGenerator[Tuple[str, Any], None]:
+        """Stream the knowledge graph from ``/graphs`` without buffering the whole response.
+        
+        Takes the same arguments as :meth:`get_knowledge_graph`. Yields ``("nodes", node)``
+        and ``("edges", edge)`` pairs as each element is parsed, and other top-level
+        fields such as ``("is_truncated", False)`` when they are reached.
+        """
+        params = self._graph_params(label, max_depth, max_nodes)
+        await self._flush_before_read()
+        async for event in self._stream_json("GET", "/graphs", [("nodes",), ("edges",)], params=params):
+            yield event.path[0], event.value
+    
+    async def get_knowledge_graph_compact(
+        self,
+        label: str = "*",
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        include_properties: bool = True,
+    ) -> CompactGraph:
+        """Retrieve the knowledge graph into a columnar :class:`CompactGraph`.
+        
+        Takes the same arguments as :meth:`get_knowledge_graph`. Use it for large graphs
+        whose per-element dicts would be too expensive to keep around. The response is
+        parsed as it downloads, so only the compact form is ever held in full. Without
+        ``include_properties`` only IDs, endpoints, types and weights are kept.
+        """
+        graph = CompactGraph(include_properties=include_properties)
+        async for key, value in self.stream_knowledge_graph(label=label, max_depth=max_depth, max_nodes=max_nodes):
+            if key == "nodes" and isinstance(value, dict):
+                graph.add_node(value)
+            elif key == "edges" and isinstance(value, dict):
+                graph.add_edge(value)
+            elif key == "is_truncated":
+                graph.is_truncated = bool(value)
+        return graph
+    
+    @staticmethod
+    def _graph_params(label: str, max_depth: Optional[int], max_nodes: Optional[int]) -> Dict[str, Any]:
+        if not label or not label.strip():
+            raise LightRAGValidationError("Label cannot be empty")
+        if max_depth is not None and max_depth < 1:
+            raise LightRAGValidationError("max_depth must be at least 1")
+        if max_nodes is not None and max_nodes < 1:
+            raise LightRAGValidationError("max_nodes must be at least 1")
+        
+        params: Dict[str, Any] = {"label": label}
+        if max_depth is not None:
+            params["max_depth"] = max_depth
+        if max_nodes is not None:
+            params["max_nodes"] = max_nodes
+        return params
     
     async def get_graph_labels(self) -> LabelsResponse:
         """Get labels for entities and relations in the knowledge graph."""
+        await self._flush_before_read()
         response_data = await self._make_request("GET", "/graph/label/list")
-        # Server returns a list, but our model expects a dict with labels field
+        # Server returns a plain list of entity labels
         if isinstance(response_data, list):
-            response_data = {"labels": response_data}
+            response_data = {"entity_labels": response_data}
         return LabelsResponse(**response_data)
     
     async def check_entity_exists(self, entity_name: str) -> EntityExistsResponse:
         """Check if an entity exists in the knowledge graph."""
+        if entity_name in self._pending_entity_edits:
+            await self._flush_entity(entity_name)
         params = {"name": entity_name}
         response_data = await self._make_request("GET", "/graph/entity/exists", params=params)
-        return EntityExistsResponse(**response_data)
+        result = EntityExistsResponse(**response_data)
+        self._cache_entity_exists(entity_name, result.exists)
+        return result
+    
+    def _cache_entity_exists(self, entity_name: str, exists: bool) -> None:
+        self._entity_exists_cache[entity_name] = (exists, time.monotonic())
+        self._entity_exists_cache.move_to_end(entity_name)
+        while len(self._entity_exists_cache) > self.entity_cache_size:
+            self._entity_exists_cache.popitem(last=False)
+    
+    async def check_entities_exist(
+        self,
+        entity_names: List[str],
+        concurrency: int = 8,
+        use_cache: bool = True,
+    ) -> EntitiesExistResponse:
+        """Check many entity names at once.
+        
+        Names are deduplicated, answered from the existence cache when a fresh entry is
+        available, and the rest are checked upstream with at most ``concurrency``
+        requests in flight.
+        """
+        if concurrency < 1:
+            raise LightRAGValidationError("Concurrency must be at least 1")
+        
+        names = list(dict.fromkeys(name for name in entity_names if name and name.strip()))
+        results: Dict[str, bool] = {}
+        to_check: List[str] = []
+        now = time.monotonic()
+        for name in names:
+            cached = self._entity_exists_cache.get(name) if use_cache else None
+            if cached is not None and now - cached[1] < self.entity_cache_ttl:
+                results[name] = cached[0]
+                self._entity_exists_cache.move_to_end(name)
+            else:
+                if cached is not None:
+                    del self._entity_exists_cache[name]
+                to_check.append(name)
+        cache_hits = len(results)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def check(name: str) -> bool:
+            async with semaphore:
+                return (await self.check_entity_exists(name)).exists
+        
+        checked = await asyncio.gather(*(check(name) for name in to_check))
+        results.update(zip(to_check, checked))
+        self.logger.info(f"Checked {len(names)} entity names: {cache_hits} from cache, {len(to_check)} upstream")
+        
+        return EntitiesExistResponse(
+            # Preserve the caller's order
+            results={name: results[name] for name in names},
+            cache_hits=cache_hits,
+            requests_made=len(to_check),
+        )
+    
+    def invalidate_entity_cache(self, *entity_names: str) -> None:
+        """Drop cached existence answers for the given names, or for every name if none are given."""
+        if not entity_names:
+            self._entity_exists_cache.clear()
+        for name in entity_names:
+            self._entity_exists_cache.pop(name, None)
+    
+    def invalidate_graph_state(self) -> None:
+        """Forget every last-known entity and relation property set.
+        
+        Cached "does not exist" answers are dropped too, since ingestion may have created those entities;
+        paths that delete documents clear the whole existence cache with ``invalidate_entity_cache()``.
+        """
+        self._entity_state.clear()
+        self._relation_state.clear()
+        for name in [name for name, (exists, _) in self._entity_exists_cache.items() if not exists]:
+            del self._entity_exists_cache[name]
+        self.graph_generation += 1
+    
+    def _known_state(self, cache: Dict[Any, Tuple[Dict[str, Any], float]], key: Any) -> Optional[Dict[str, Any]]:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        properties, recorded_at = entry
+        if time.monotonic() - recorded_at > self.edit_state_ttl:
+            del cache[key]
+            return None
+        return properties
+    
+    def _remember_state(
+        self,
+        cache: Dict[Any, Tuple[Dict[str, Any], float]],
+        key: Any,
+        properties: Dict[str, Any],
+        merge: bool = True,
+    ) -> None:
+        if self.edit_state_ttl <= 0:
+            return
+        known = self._known_state(cache, key) if merge else None
+        cache[key] = ({**(known or {}), **properties}, time.monotonic())
+    
+    def _remember_graph_state(self, graph: GraphResponse) -> None:
+        """Record node and edge properties from a graph read."""
+        for node in graph.nodes:
+            properties = node.get("properties")
+            if node.get("id") is not None and isinstance(properties, dict):
+                self._remember_state(self._entity_state, str(node["id"]), properties, merge=False)
+        for edge in graph.edges:
+            properties = edge.get("properties")
+            if edge.get("source") is not None and edge.get("target") is not None and isinstance(properties, dict):
+                key = self._relation_key(str(edge["source"]), str(edge["target"]))
+                self._remember_state(self._relation_state, key, properties, merge=False)
+    
+    @staticmethod
+    def _relation_key(source_id: str, target_id: str) -> Tuple[str, str]:
+        # Relations are addressed by their endpoints regardless of direction
+        return tuple(sorted((source_id, target_id)))
+    
+    def _changed_fields(self, known: Optional[Dict[str, Any]], updated_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the fields of an edit that differ from the last-known properties."""
+        if known is None:
+            return dict(updated_data)
+        missing = object()
+        return {key: value for key, value in updated_data.items() if known.get(key, missing) != value}
+    
+    @staticmethod
+    def _response_properties(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # LightRAG returns the edited node/edge properties under "graph_data"
+        graph_data = data.get("graph_data") if isinstance(data, dict) else None
+        return graph_data if isinstance(graph_data, dict) else None
     
     async def update_entity(self, entity_id: str, properties: Dict[str, Any], entity_name: Optional[str] = None) -> EntityUpdateResponse:
-        """Update an entity in the knowledge graph."""
+        """Update an entity in the knowledge graph.
+        
+        When ``write_combine_window`` is positive, edits are buffered per entity and
+        merged into one upstream edit sent when the window expires or before the next
+        read. A buffered edit returns immediately with status ``buffered``.
+        """
         # Use entity_id as entity_name if not provided
         if entity_name is None:
             entity_name = entity_id
-        request_data = EntityUpdateRequest(entity_id=entity_id, entity_name=entity_name, updated_data=properties)
+        if self.write_combine_window > 0:
+            return await self._buffer_entity_update(entity_id, entity_name, properties)
+        return await self._send_entity_update(entity_id, entity_name, properties)
+    
+    async def _send_entity_update(self, entity_id: str, entity_name: str, properties: Dict[str, Any]) -> EntityUpdateResponse:
+        """Send a single entity edit upstream, dropping fields that are already up to date."""
+        # Naming the entity it already has is not a rename
+        properties = {
+            key: value for key, value in properties.items()
+            if not (key == "entity_name" and value == entity_name)
+        }
+        changes = self._changed_fields(self._known_state(self._entity_state, entity_name), properties)
+        if not changes:
+            self.logger.info(f"Skipping no-op edit for entity '{entity_name}'")
+            return EntityUpdateResponse(
+                status="unchanged",
+                message=f"Entity '{entity_name}' already has the requested values; no edit was sent",
+                data={"entity_name": entity_name, "unchanged_fields": sorted(properties)},
+            )
+        if len(changes) < len(properties):
+            self.logger.info(
+                f"Dropping unchanged fields from edit for entity '{entity_name}': {sorted(set(properties) - set(changes))}"
+            )
+        
+        request_data = EntityUpdateRequest(entity_id=entity_id, entity_name=entity_name, updated_data=changes)
         response_data = await self._make_request("POST", "/graph/entity/edit", request_data.model_dump())
-        return EntityUpdateResponse(**response_data)
+        # Renaming an entity changes which names exist
+        new_name = str(changes.get("entity_name", entity_name))
+        self.invalidate_entity_cache(entity_name, new_name)
+        self.graph_generation += 1
+        result = EntityUpdateResponse(**response_data)
+        
+        state = {key: value for key, value in changes.items() if key != "entity_name"}
+        if new_name != entity_name:
+            known = self._entity_state.pop(entity_name, None)
+            if known is not None:
+                self._entity_state[new_name] = known
+        self._remember_state(self._entity_state, new_name, {**state, **(self._response_properties(result.data) or {})})
+        return result
+    
+    async def _buffer_entity_update(self, entity_id: str, entity_name: str, properties: Dict[str, Any]) -> EntityUpdateResponse:
+        """Merge an edit into the pending combined edit for its entity."""
+        pending = self._pending_entity_edits.setdefault(
+            entity_name, {"entity_id": entity_id, "updated_data": {}, "edits": 0}
+        )
+        pending["updated_data"].update(properties)
+        pending["edits"] += 1
+        
+        # A rename changes the entity's identity, so send it (with everything merged so far) now
+        if "entity_name" in properties and properties["entity_name"] != entity_name:
+            result = await self._flush_entity(entity_name)
+            if result is None:
+                # A flush queued on the same lock took the pending edit, rename included, before us
+                return EntityUpdateResponse(
+                    status="flushed",
+                    message=f"Edit to '{entity_name}' was sent by a concurrent flush of buffered edits; flush_entity_edits reports any errors",
+                    data={"entity_name": entity_name, "new_name": properties["entity_name"]},
+                )
+            return result
+        
+        if entity_name not in self._entity_flush_timers:
+            self._entity_flush_timers[entity_name] = asyncio.ensure_future(self._flush_entity_later(entity_name))
+        self.logger.debug(f"Buffered edit {pending['edits']} for entity '{entity_name}'")
+        return EntityUpdateResponse(
+            status="buffered",
+            message=f"Edit buffered and will be combined with other edits to '{entity_name}' within {self.write_combine_window}s",
+            data={"entity_name": entity_name, "pending_updates": dict(pending["updated_data"]), "combined_edits": pending["edits"]},
+        )
+    
+    async def _flush_entity_later(self, entity_name: str) -> None:
+        await asyncio.sleep(self.write_combine_window)
+        # Drop our own timer handle first so the flush does not cancel this task
+        self._entity_flush_timers.pop(entity_name, None)
+        try:
+            await self._flush_entity(entity_name)
+        except Exception as e:
+            error_msg = f"Background flush of edits to '{entity_name}' failed: {str(e)}"
+            self.logger.error(error_msg)
+            self._write_combine_errors.append(error_msg)
+    
+    async def _flush_entity(self, entity_name: str) -> Optional[EntityUpdateResponse]:
+        """Send the combined pending edit for one entity, if any."""
+        timer = self._entity_flush_timers.pop(entity_name, None)
+        if timer is not None:
+            timer.cancel()
+        lock, users = self._entity_flush_locks.get(entity_name, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._entity_flush_locks[entity_name] = (lock, users + 1)
+        try:
+            async with lock:
+                pending = self._pending_entity_edits.pop(entity_name, None)
+                if pending is None:
+                    return None
+                self.logger.info(f"Flushing {pending['edits']} combined edits for entity '{entity_name}'")
+                return await self._send_entity_update(pending["entity_id"], entity_name, pending["updated_data"])
+        finally:
+            # Drop the lock once no other flush of this entity holds or waits on it
+            lock, users = self._entity_flush_locks[entity_name]
+            if users == 1:
+                del self._entity_flush_locks[entity_name]
+            else:
+                self._entity_flush_locks[entity_name] = (lock, users - 1)
+    
+    async def flush_entity_edits(self) -> EntityFlushResponse:
+        """Send every pending combined entity edit now."""
+        names = list(self._pending_entity_edits)
+        outcomes = await asyncio.gather(*(self._flush_entity(name) for name in names), return_exceptions=True)
+        responses = []
+        errors, self._write_combine_errors = self._write_combine_errors, []
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
+                errors.append(f"Flush of edits to '{name}' failed: {str(outcome)}")
+            elif outcome is not None:
+                responses.append(outcome)
+        return EntityFlushResponse(flushed=len(responses), responses=responses, errors=errors)
+    
+    async def _flush_before_read(self) -> None:
+        """Make buffered edits visible before reading graph state."""
+        if self._pending_entity_edits:
+            result = await self.flush_entity_edits()
+            # Keep errors around for an explicit flush to report
+            self._write_combine_errors.extend(result.errors)
     
     # async def update_relation(self, relation_id: str, properties: Dict[str, Any], source_id: str = "unknown", target_id: str = "unknown") -> RelationUpdateResponse:
     #     """Update a relation in the knowledge graph."""
@@ -451,28 +1168,185 @@ class LightRAGClient:
     #     return RelationUpdateResponse(**response_data)
 
     async def update_relation(self, source_id: str, target_id: str, updated_data: Dict[str, Any]) -> RelationUpdateResponse:
-        """Update a relation in the knowledge graph."""
+        """Update a relation in the knowledge graph, dropping fields that are already up to date."""
+        key = self._relation_key(source_id, target_id)
+        changes = self._changed_fields(self._known_state(self._relation_state, key), updated_data)
+        if not changes:
+            self.logger.info(f"Skipping no-op edit for relation '{source_id}' -> '{target_id}'")
+            return RelationUpdateResponse(
+                status="unchanged",
+                message=f"Relation '{source_id}' -> '{target_id}' already has the requested values; no edit was sent",
+                data={"source_id": source_id, "target_id": target_id, "unchanged_fields": sorted(updated_data)},
+            )
+        
         request_data = RelationUpdateRequest(
             source_id=source_id,
             target_id=target_id,
-            updated_data=updated_data
+            updated_data=changes
         )
         response_data = await self._make_request("POST", "/graph/relation/edit", request_data.model_dump())
-        return RelationUpdateResponse(**response_data)
+        self.graph_generation += 1
+        result = RelationUpdateResponse(**response_data)
+        self._remember_state(self._relation_state, key, {**changes, **(self._response_properties(result.data) or {})})
+        return result
+    
+    async def update_entities(
+        self,
+        updates: List[Union[EntityUpdateRequest, Dict[str, Any]]],
+        concurrency: int = 8,
+        stop_on_error: bool = True,
+    ) -> BulkUpdateResponse:
+        """Apply many entity edits concurrently, keeping edits to the same entity in order.
+        
+        Edits that rename an entity are ordered together with later edits to the new name.
+        With ``stop_on_error`` an edit failure skips the remaining edits for that entity.
+        """
+        requests: List[EntityUpdateRequest] = []
+        for index, update in enumerate(updates):
+            if isinstance(update, EntityUpdateRequest):
+                requests.append(update)
+                continue
+            try:
+                entity_name = update.get("entity_name") or update.get("entity_id")
+                requests.append(EntityUpdateRequest(
+                    entity_id=update.get("entity_id") or entity_name,
+                    entity_name=entity_name,
+                    updated_data=update.get("updated_data"),
+                ))
+            except Exception as e:
+                raise LightRAGValidationError(f"Invalid entity update at index {index}: {str(e)}")
+        
+        # Union edits connected through renames so they share one ordered group
+        parent: Dict[str, str] = {}
+        
+        def find(name: str) -> str:
+            while parent.setdefault(name, name) != name:
+                parent[name] = parent[parent[name]]
+                name = parent[name]
+            return name
+        
+        for request in requests:
+            new_name = request.updated_data.get("entity_name")
+            if isinstance(new_name, str) and new_name != request.entity_name:
+                parent[find(new_name)] = find(request.entity_name)
+        
+        async def edit(index: int) -> EntityUpdateResponse:
+            request = requests[index]
+            return await self.update_entity(request.entity_id, request.updated_data, entity_name=request.entity_name)
+        
+        return await self._run_ordered_edits(
+            keys=[request.entity_name for request in requests],
+            group_keys=[find(request.entity_name) for request in requests],
+            edit=edit,
+            concurrency=concurrency,
+            stop_on_error=stop_on_error,
+        )
+    
+    async def update_relations(
+        self,
+        updates: List[Union[RelationUpdateRequest, Dict[str, Any]]],
+        concurrency: int = 8,
+        stop_on_error: bool = True,
+    ) -> BulkUpdateResponse:
+        """Apply many relation edits concurrently, keeping edits to the same source/target pair in order."""
+        requests: List[RelationUpdateRequest] = []
+        for index, update in enumerate(updates):
+            if isinstance(update, RelationUpdateRequest):
+                requests.append(update)
+                continue
+            try:
+                requests.append(RelationUpdateRequest(**update))
+            except Exception as e:
+                raise LightRAGValidationError(f"Invalid relation update at index {index}: {str(e)}")
+        
+        async def edit(index: int) -> RelationUpdateResponse:
+            request = requests[index]
+            return await self.update_relation(request.source_id, request.target_id, request.updated_data)
+        
+        return await self._run_ordered_edits(
+            keys=[f"{request.source_id} -> {request.target_id}" for request in requests],
+            group_keys=[self._relation_key(request.source_id, request.target_id) for request in requests],
+            edit=edit,
+            concurrency=concurrency,
+            stop_on_error=stop_on_error,
+        )
+    
+    async def _run_ordered_edits(
+        self,
+        keys: List[str],
+        group_keys: List[Hashable],
+        edit: Callable[[int], Awaitable[Any]],
+        concurrency: int,
+        stop_on_error: bool,
+    ) -> BulkUpdateResponse:
+        """Run edits grouped by key: groups run concurrently, edits within a group run in order."""
+        if concurrency < 1:
+            raise LightRAGValidationError("Concurrency must be at least 1")
+        
+        groups: Dict[Hashable, List[int]] = {}
+        for index, group_key in enumerate(group_keys):
+            groups.setdefault(group_key, []).append(index)
+        self.logger.info(f"Applying {len(keys)} edits across {len(groups)} independent groups")
+        
+        results: List[Optional[BulkUpdateItemResult]] = [None] * len(keys)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run_group(indices: List[int]) -> None:
+            group_failed = False
+            for index in indices:
+                if group_failed and stop_on_error:
+                    results[index] = BulkUpdateItemResult(
+                        index=index, key=keys[index], success=False, status="skipped",
+                        message="Skipped because an earlier edit to the same item failed",
+                    )
+                    continue
+                async with semaphore:
+                    try:
+                        response = await edit(index)
+                        results[index] = BulkUpdateItemResult(
+                            index=index, key=keys[index], success=True, status=response.status,
+                            message=response.message, data=response.data,
+                        )
+                    except Exception as e:
+                        group_failed = True
+                        self.logger.error(f"Edit {index} for '{keys[index]}' failed: {str(e)}")
+                        results[index] = BulkUpdateItemResult(
+                            index=index, key=keys[index], success=False, status="error", message=str(e),
+                        )
+        
+        await asyncio.gather(*(run_group(indices) for indices in groups.values()))
+        succeeded = sum(1 for result in results if result.success)
+        return BulkUpdateResponse(
+            total=len(keys),
+            succeeded=succeeded,
+            failed=len(keys) - succeeded,
+            unchanged=sum(1 for result in results if result.status == "unchanged"),
+            results=results,
+        )
     
     async def delete_entity(self, entity_id: str, entity_name: Optional[str] = None) -> DeletionResult:
         """Delete an entity from the knowledge graph."""
         # Use entity_id as entity_name if not provided
         if entity_name is None:
             entity_name = entity_id
+        if entity_name in self._pending_entity_edits:
+            await self._flush_entity(entity_name)
         request_data = DeleteEntityRequest(entity_id=entity_id, entity_name=entity_name)
         response_data = await self._make_request("DELETE", "/documents/delete_entity", request_data.model_dump())
+        self.invalidate_entity_cache(entity_name)
+        # Deleting an entity also deletes its relations
+        self.graph_generation += 1
+        self._entity_state.pop(entity_name, None)
+        for key in [key for key in self._relation_state if entity_name in key]:
+            del self._relation_state[key]
         return DeletionResult(**response_data)
     
     async def delete_relation(self, relation_id: str, source_entity: str = "unknown", target_entity: str = "unknown") -> DeletionResult:
         """Delete a relation from the knowledge graph."""
         request_data = DeleteRelationRequest(relation_id=relation_id, source_entity=source_entity, target_entity=target_entity)
         response_data = await self._make_request("DELETE", "/documents/delete_relation", request_data.model_dump())
+        self._relation_state.pop(self._relation_key(source_entity, target_entity), None)
+        self.graph_generation += 1
         return DeletionResult(**response_data)
     
     # System Management Methods (4 methods)
@@ -487,6 +1361,88 @@ class LightRAGClient:
         response_data = await self._make_request("GET", f"/documents/track_status/{track_id}")
         return TrackStatusResponse(**response_data)
     
+    async def wait_for_track(self, track_id: str, timeout: float = 120.0, poll_interval: float = 0.5) -> TrackWaitResponse:
+        """Wait until every document in a track is processed or failed, or the timeout expires."""
+        started = time.monotonic()
+        return await self._wait_for_track(track_id, started, started + timeout, poll_interval)
+    
+    async def _wait_for_track(
+        self,
+        track_id: str,
+        started: float,
+        deadline: float,
+        poll_interval: float,
+        max_poll_interval: float = 5.0,
+    ) -> TrackWaitResponse:
+        """Poll track status with exponential backoff until a terminal state or the deadline."""
+        if poll_interval <= 0:
+            raise LightRAGValidationError("Poll interval must be positive")
+        
+        polls = 0
+        delay = poll_interval
+        while True:
+            track = await self.get_track_status(track_id)
+            polls += 1
+            statuses = [
+                str(doc.get("status", "")).rsplit(".", 1)[-1].lower()
+                for doc in track.documents
+            ]
+            now = time.monotonic()
+            
+            # A freshly submitted track may not list its documents yet
+            if statuses and all(status in TERMINAL_DOC_STATUSES for status in statuses):
+                final_status = "failed" if "failed" in statuses else "processed"
+                # Ingestion finishes after submission, so graph reads made meanwhile are stale
+                self.invalidate_graph_state()
+                self.logger.info(f"Track {track_id} finished as '{final_status}' after {now - started:.2f}s ({polls} polls)")
+                return TrackWaitResponse(
+                    track_id=track_id,
+                    status=final_status,
+                    completed=True,
+                    elapsed_seconds=now - started,
+                    polls=polls,
+                    status_summary=track.status_summary,
+                    documents=track.documents,
+                )
+            
+            if now >= deadline:
+                self.logger.warning(f"Timed out waiting for track {track_id} after {now - started:.2f}s ({polls} polls)")
+                return TrackWaitResponse(
+                    track_id=track_id,
+                    status="timeout",
+                    completed=False,
+                    elapsed_seconds=now - started,
+                    polls=polls,
+                    status_summary=track.status_summary,
+                    documents=track.documents,
+                    message="Deadline reached before all documents were processed",
+                )
+            
+            await asyncio.sleep(min(delay, deadline - now))
+            delay = min(delay * 2, max_poll_interval)
+    
+    async def _wait_for_pipeline_idle(
+        self,
+        deadline: float,
+        poll_interval: float,
+        max_poll_interval: float = 5.0,
+    ) -> bool:
+        """Poll pipeline status with exponential backoff until it is idle; False if the deadline passes first."""
+        if poll_interval <= 0:
+            raise LightRAGValidationError("Poll interval must be positive")
+        
+        delay = poll_interval
+        while True:
+            status = await self.get_pipeline_status()
+            if not status.busy:
+                return True
+            now = time.monotonic()
+            if now >= deadline:
+                self.logger.warning(f"Pipeline still busy at deadline: {status.latest_message}")
+                return False
+            await asyncio.sleep(min(delay, deadline - now))
+            delay = min(delay * 2, max_poll_interval)
+    
     async def get_document_status_counts(self) -> StatusCountsResponse:
         """Get document status counts from LightRAG."""
         response_data = await self._make_request("GET", "/documents/status_counts")
@@ -0,0 +1,182 @@
+"""
+Pluggable JSON codec for LightRAG request/response bodies and tool output.
+
+The client decodes every response body, and the server encodes every tool
+result. The stdlib ``json`` module is the slowest option for large graphs and
+document lists. :func:`get_codec` picks the fastest installed backend: orjson,
+then msgspec, then the stdlib. ``LIGHTRAG_JSON_CODEC`` forces a specific one.
+All backends produce the same JSON for the values these tools return, and
+output is compact unless an indent is asked for.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Iterator, Optional, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without msgspec
+    msgspec = None
+
+
+# Codec names accepted by get_codec; "auto" picks the fastest installed backend
+JSON_CODECS = ("auto", "orjson", "msgspec", "json")
+
+# Number of list items iterencode encodes per call
+ITERENCODE_CHUNK_ITEMS = 1000
+
+logger = logging.getLogger(__name__)
+
+
+def _fields(model: BaseModel) -> dict:
+    # Same keys as model_dump(), without copying the field values
+    return {name: getattr(model, name) for name in type(model).model_fields}
+
+
+def dump_plain(value: Any) -> Any:
+    """Return the same data as ``model_dump()`` without deep-copying plain lists and dicts.
+
+    ``model_dump()`` copies every node and edge dict of a large graph in one call
+    that holds the GIL throughout. Here only nested models are converted, one at a
+    time, and plain containers are shared with the model.
+    """
+    if isinstance(value, BaseModel):
+        return {name: dump_plain(item) for name, item in _fields(value).items()}
+    if isinstance(value, list) and value and isinstance(value[0], BaseModel):
+        return [dump_plain(item) for item in value]
+    if isinstance(value, dict) and any(isinstance(item, (BaseModel, list)) for item in value.values()):
+        return {key: dump_plain(item) for key, item in value.items()}
+    return value
+
+
+def _stdlib_dumps(value: Any, indent: bool) -> bytes:
+    if indent:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class JSONCodec:
+    """Encode and decode JSON with one backend, falling back to the stdlib for values it rejects."""
+
+    def __init__(self, name: str = "auto"):
+        if name not in JSON_CODECS:
+            raise ValueError(f"Unknown JSON codec '{name}'. Must be one of: {list(JSON_CODECS)}")
+        if name == "auto":
+            name = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+        if name == "orjson" and orjson is None:
+            raise ValueError("JSON codec 'orjson' requested but orjson is not installed")
+        if name == "msgspec" and msgspec is None:
+            raise ValueError("JSON codec 'msgspec' requested but msgspec is not installed")
+        self.name = name
+
+        self._dumps: Callable[[Any, bool], bytes]
+        self._loads: Callable[[Union[str, bytes]], Any]
+        if name == "orjson":
+            self._dumps = self._orjson_dumps
+            self._loads = orjson.loads
+        elif name == "msgspec":
+            encoder, decoder = msgspec.json.Encoder(), msgspec.json.Decoder()
+            self._dumps = lambda value, indent: (
+                msgspec.json.format(encoder.encode(value), indent=2) if indent else encoder.encode(value)
+            )
+            self._loads = decoder.decode
+        else:
+            self._dumps = _stdlib_dumps
+            self._loads = json.loads
+
+    @staticmethod
+    def _orjson_dumps(value: Any, indent: bool) -> bytes:
+        # Non-string keys (e.g. degree histograms) are stringified like the stdlib does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(value, option=option)
+
+    def dumps_bytes(self, value: Any, indent: bool = False) -> bytes:
+        """Encode ``value`` as UTF-8 JSON bytes."""
+        try:
+            return self._dumps(value, indent)
+        except (TypeError, ValueError, OverflowError) as e:
+            # e.g. integers beyond 64 bits, which only the stdlib encodes
+            if self.name == "json":
+                raise
+            logger.debug(f"{self.name} could not encode value ({e}); using stdlib json")
+            return _stdlib_dumps(value, indent)
+
+    def dumps(self, value: Any, indent: bool = False) -> str:
+        """Encode ``value`` as a JSON string."""
+        return self.dumps_bytes(value, indent).decode("utf-8")
+
+    def iterencode(self, value: Any, indent: bool = False, chunk_items: int = ITERENCODE_CHUNK_ITEMS) -> Iterator[str]:
+        """Yield the JSON encoding of ``value`` in pieces, like :meth:`json.JSONEncoder.iterencode`.
+
+        Pydantic models are walked field by field instead of being dumped whole,
+        and long lists are encoded ``chunk_items`` at a time. ``"".join()`` of the
+        pieces equals ``dumps(model.model_dump(), indent)``, but no full copy of the
+        data exists alongside the output. A thread running this also releases the
+        GIL between pieces.
+        """
+        yield from self._iterencode(value, indent, 0, chunk_items)
+
+    def _iterencode(self, value: Any, indent: bool, depth: int, chunk_items: int) -> Iterator[str]:
+        if isinstance(value, BaseModel):
+            value = _fields(value)
+        newline = "\n" + "  " * (depth + 1) if indent else ""
+        if isinstance(value, dict) and value and all(isinstance(key, str) for key in value) and any(
+            isinstance(item, (BaseModel, dict, list)) for item in value.values()
+        ):
+            yield "{"
+            for position, (key, item) in enumerate(value.items()):
+                yield ("," if position else "") + newline + self.dumps(key) + (": " if indent else ":")
+                yield from self._iterencode(item, indent, depth + 1, chunk_items)
+            yield ("\n" + "  " * depth if indent else "") + "}"
+        elif isinstance(value, list) and len(value) > chunk_items:
+            yield "["
+            for start in range(0, len(value), chunk_items):
+                # Encode a slice as a list and keep only its items
+                text = self._leaf(dump_plain(value[start:start + chunk_items]), indent, depth)
+                if indent:
+                    text = text[2 + 2 * depth:-2 - 2 * depth]
+                    yield ("," if start else "") + "\n" + "  " * depth + text
+                else:
+                    yield ("," if start else "") + text[1:-1]
+            yield ("\n" + "  " * depth if indent else "") + "]"
+        else:
+            yield self._leaf(dump_plain(value), indent, depth)
+
+    def _leaf(self, value: Any, indent: bool, depth: int) -> str:
+        text = self.dumps(value, indent)
+        if indent and depth:
+            text = text.replace("\n", "\n" + "  " * depth)
+        return text
+
+    def loads(self, data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        """Decode JSON text or bytes; raises :class:`json.JSONDecodeError` on invalid input."""
+        try:
+            return self._loads(data)
+        except json.JSONDecodeError:
+            raise
+        except ValueError as e:
+            # msgspec.DecodeError is a ValueError but not a JSONDecodeError
+            text = bytes(data).decode("utf-8", "replace") if not isinstance(data, str) else data
+            raise json.JSONDecodeError(str(e), text, 0) from e
+
+
+_default_codec: Optional[JSONCodec] = None
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Return a codec by name; without a name, the shared default chosen from ``LIGHTRAG_JSON_CODEC``."""
+    global _default_codec
+    if name is not None:
+        return JSONCodec(name)
+    if _default_codec is None:
+        _default_codec = JSONCodec(os.getenv("LIGHTRAG_JSON_CODEC", "auto"))
+        logger.info(f"Using JSON codec: {_default_codec.name}")
+    return _default_codec
@@ -0,0 +1,205 @@
+"""
+Columnar, memory-compact representation of a LightRAG knowledge graph.
+
+``GraphResponse`` keeps every node and edge as a dict with repeated keys and
+nested ``properties``. That costs hundreds of bytes per element. ``CompactGraph``
+stores the same graph in columns instead:
+
+- node IDs are interned to integer positions;
+- edge endpoints are ``array('l')`` columns of node positions;
+- edge weights are an ``array('d')`` column;
+- entity and edge types are indexes into a shared string table;
+- everything else about an element is kept as one compact JSON blob and is
+  decoded only when it is asked for. With ``include_properties=False`` the blobs
+  are not built at all, for callers that only need the structure (e.g. graph
+  statistics); elements then materialize without their properties.
+"""
+
+from array import array
+from typing import Any, Dict, List, Optional
+
+from .codec import get_codec
+from .models import GraphResponse
+
+
+# Weight recorded for edges whose properties carry none
+DEFAULT_EDGE_WEIGHT = 1.0
+
+
+def _encode(value: Dict[str, Any]) -> bytes:
+    return get_codec().dumps_bytes(value)
+
+
+def _decode(blob: bytes) -> Dict[str, Any]:
+    return get_codec().loads(blob)
+
+
+class CompactGraph:
+    """Columnar knowledge graph with interned strings and lazily decoded properties."""
+
+    def __init__(self, is_truncated: bool = False, include_properties: bool = True):
+        self.is_truncated = is_truncated
+        self.include_properties = include_properties
+
+        # Shared string table for entity and edge types
+        self.strings: List[str] = []
+        self._string_index: Dict[str, int] = {}
+
+        self.node_ids: List[str] = []
+        self._node_index: Dict[str, int] = {}
+        self.node_types = array("l")
+        self._node_blobs: List[Optional[bytes]] = []
+
+        self.sources = array("l")
+        self.targets = array("l")
+        self.weights = array("d")
+        self.edge_types = array("l")
+        self._edge_blobs: List[Optional[bytes]] = []
+
+    # Construction
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any], include_properties: bool = True) -> "CompactGraph":
+        """Build from a raw ``/graphs`` response body."""
+        graph = cls(is_truncated=bool(data.get("is_truncated", False)), include_properties=include_properties)
+        for node in data.get("nodes") or []:
+            graph.add_node(node)
+        for edge in data.get("edges") or []:
+            graph.add_edge(edge)
+        return graph
+
+    @classmethod
+    def from_graph(cls, graph: GraphResponse) -> "CompactGraph":
+        """Build from an already parsed :class:`GraphResponse`."""
+        return cls.from_response(
+            {"nodes": graph.nodes, "edges": graph.edges, "is_truncated": graph.is_truncated}
+        )
+
+    def intern(self, value: Optional[str]) -> int:
+        """Return the string table index for a value, or -1 for None."""
+        if value is None:
+            return -1
+        index = self._string_index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self._string_index[value] = index
+            self.strings.append(value)
+        return index
+
+    def _node_position(self, node_id: str) -> int:
+        position = self._node_index.get(node_id)
+        if position is None:
+            position = len(self.node_ids)
+            self._node_index[node_id] = position
+            self.node_ids.append(node_id)
+            self.node_types.append(-1)
+            self._node_blobs.append(None)
+        return position
+
+    def add_node(self, node: Dict[str, Any]) -> Optional[int]:
+        """Add a node dict, returning its position (None if it has no ID)."""
+        if node.get("id") is None:
+            return None
+        position = self._node_position(str(node["id"]))
+        rest = {key: value for key, value in node.items() if key != "id"}
+        properties = rest.get("properties") or {}
+        self.node_types[position] = self.intern(properties.get("entity_type"))
+        if self.include_properties:
+            self._node_blobs[position] = _encode(rest)
+        return position
+
+    def add_edge(self, edge: Dict[str, Any]) -> Optional[int]:
+        """Add an edge dict, returning its position (None if an endpoint is missing)."""
+        if edge.get("source") is None or edge.get("target") is None:
+            return None
+        # Endpoints missing from the node list (e.g. in a truncated graph) still get a position
+        self.sources.append(self._node_position(str(edge["source"])))
+        self.targets.append(self._node_position(str(edge["target"])))
+        rest = {key: value for key, value in edge.items() if key not in ("source", "target")}
+        weight = (rest.get("properties") or {}).get("weight")
+        try:
+            self.weights.append(float(weight) if weight is not None else DEFAULT_EDGE_WEIGHT)
+        except (TypeError, ValueError):
+            self.weights.append(DEFAULT_EDGE_WEIGHT)
+        self.edge_types.append(self.intern(rest.get("type")))
+        self._edge_blobs.append(_encode(rest) if self.include_properties else None)
+        return len(self._edge_blobs) - 1
+
+    # Access
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edge_blobs)
+
+    def node_position(self, node_id: str) -> Optional[int]:
+        return self._node_index.get(node_id)
+
+    def node(self, position: int) -> Dict[str, Any]:
+        """Materialize the node dict at a position."""
+        blob = self._node_blobs[position]
+        rest = _decode(blob) if blob is not None else {}
+        return {"id": self.node_ids[position], **rest}
+
+    def node_properties(self, position: int) -> Dict[str, Any]:
+        blob = self._node_blobs[position]
+        return (_decode(blob).get("properties") or {}) if blob is not None else {}
+
+    def edge(self, position: int) -> Dict[str, Any]:
+        """Materialize the edge dict at a position."""
+        blob = self._edge_blobs[position]
+        rest = _decode(blob) if blob is not None else {}
+        return {
+            "source": self.node_ids[self.sources[position]],
+            "target": self.node_ids[self.targets[position]],
+            **rest,
+        }
+
+    def edge_properties(self, position: int) -> Dict[str, Any]:
+        blob = self._edge_blobs[position]
+        return (_decode(blob).get("properties") or {}) if blob is not None else {}
+
+    def nbytes(self) -> int:
+        """Approximate payload size of the columns and blobs, excluding Python object overhead."""
+        arrays = (self.node_types, self.sources, self.targets, self.weights, self.edge_types)
+        blobs = sum(len(blob) for blob in self._node_blobs if blob is not None)
+        blobs += sum(len(blob) for blob in self._edge_blobs if blob is not None)
+        strings = sum(len(value) for value in self.strings) + sum(len(value) for value in self.node_ids)
+        return sum(column.itemsize * len(column) for column in arrays) + blobs + strings
+
+    # Conversion
+
+    def to_graph_response(self) -> GraphResponse:
+        """Materialize the full dict-based :class:`GraphResponse`."""
+        return GraphResponse(
+            nodes=[self.node(position) for position in range(self.node_count)],
+            edges=[self.edge(position) for position in range(self.edge_count)],
+            is_truncated=self.is_truncated,
+        )
+
+    def to_columnar(self, include_properties: bool = True) -> Dict[str, Any]:
+        """Return a JSON-ready columnar encoding of the graph.
+
+        Edge ``source``/``target`` and node ``entity_type``/edge ``type`` values are
+        integer indexes into ``nodes.id`` and ``strings`` respectively (-1 for none).
+        """
+        nodes: Dict[str, Any] = {"id": self.node_ids, "entity_type": self.node_types.tolist()}
+        edges: Dict[str, Any] = {
+            "source": self.sources.tolist(),
+            "target": self.targets.tolist(),
+            "weight": self.weights.tolist(),
+            "type": self.edge_types.tolist(),
+        }
+        if include_properties:
+            nodes["properties"] = [self.node_properties(position) for position in range(self.node_count)]
+            edges["properties"] = [self.edge_properties(position) for position in range(self.edge_count)]
+        return {
+            "format": "columnar",
+            "strings": self.strings,
+            "nodes": nodes,
+            "edges": edges,
+            "is_truncated": self.is_truncated,
+        }
@@ -0,0 +1,204 @@
+"""
+Near-duplicate entity detection over knowledge graph labels.
+
+Each label is normalized and broken into character n-grams. Each n-gram set is
+summarized by a MinHash signature, and the signatures are bucketed with LSH
+banding. Only labels that share a bucket are compared, so the work grows with
+the number of labels rather than the number of label pairs. Candidate pairs are
+scored by the exact Jaccard similarity of their n-gram sets and then grouped
+into clusters of likely duplicates, such as "OpenAI", "Open AI" and "OpenAI Inc.".
+
+Signatures are vectorized with NumPy when it is installed
+(``pip install daniel-lightrag-mcp[analytics]``). The pure-Python fallback
+computes identical signatures.
+"""
+
+import re
+import time
+import zlib
+from random import Random
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .models import DuplicateEntitiesResponse, DuplicateGroup, DuplicatePair
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+# Modulus of the universal hash family; a and x stay below 2**31 so a * x fits in 64 bits
+_PRIME = (1 << 31) - 1
+
+# Shingle columns hashed per NumPy block, bounding the (num_perm x block) work array
+_BLOCK_SIZE = 1 << 16
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize(label: str) -> str:
+    """Case-fold a label and drop whitespace and punctuation."""
+    return _NON_WORD.sub("", label.casefold())
+
+
+def shingles(label: str, size: int = 3) -> Set[str]:
+    """Return the character n-grams of a normalized label."""
+    text = normalize(label)
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Pick (bands, rows) with bands * rows == num_perm and an LSH threshold at or below ``threshold``.
+
+    A pair with Jaccard similarity s shares at least one bucket with probability
+    1 - (1 - s**rows)**bands. That curve is steepest near (1 / bands)**(1 / rows).
+    Choosing the highest such point not above the target keeps recall high while
+    pruning as many dissimilar pairs as possible.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1.0 / bands) ** (1.0 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+def _permutations(num_perm: int, seed: int) -> Tuple[List[int], List[int]]:
+    rng = Random(seed)
+    return (
+        [rng.randrange(1, _PRIME) for _ in range(num_perm)],
+        [rng.randrange(0, _PRIME) for _ in range(num_perm)],
+    )
+
+
+def _hash_shingle(shingle: str) -> int:
+    return zlib.crc32(shingle.encode("utf-8")) % _PRIME
+
+
+def minhash_signatures(shingle_sets: List[Set[str]], num_perm: int = 64, seed: int = 1) -> List[Tuple[int, ...]]:
+    """Return one MinHash signature per non-empty shingle set."""
+    multipliers, offsets = _permutations(num_perm, seed)
+    hashed = [sorted(_hash_shingle(shingle) for shingle in shingle_set) for shingle_set in shingle_sets]
+    if np is None:
+        return [
+            tuple(min((a * value + b) % _PRIME for value in values) for a, b in zip(multipliers, offsets))
+            for values in hashed
+        ]
+
+    a = np.asarray(multipliers, dtype=np.uint64)[:, None]
+    b = np.asarray(offsets, dtype=np.uint64)[:, None]
+    signatures: List[Tuple[int, ...]] = []
+    start = 0
+    while start < len(hashed):
+        # Hash a block of labels' shingles at once, then take per-label column minima
+        end, width = start, 0
+        while end < len(hashed) and (width == 0 or width + len(hashed[end]) <= _BLOCK_SIZE):
+            width += len(hashed[end])
+            end += 1
+        block = hashed[start:end]
+        values = np.fromiter((value for label_values in block for value in label_values), dtype=np.uint64, count=width)
+        boundaries = np.cumsum([0] + [len(label_values) for label_values in block[:-1]])
+        minima = np.minimum.reduceat((a * values[None, :] + b) % _PRIME, boundaries, axis=1)
+        signatures.extend(tuple(column) for column in minima.T.tolist())
+        start = end
+    return signatures
+
+
+def _candidate_pairs(signatures: List[Tuple[int, ...]], bands: int, rows: int) -> Set[Tuple[int, int]]:
+    pairs: Set[Tuple[int, int]] = set()
+    for band in range(bands):
+        buckets: Dict[Tuple[int, ...], List[int]] = {}
+        for position, signature in enumerate(signatures):
+            buckets.setdefault(signature[band * rows:(band + 1) * rows], []).append(position)
+        for members in buckets.values():
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    pairs.add((first, second))
+    return pairs
+
+
+def find_duplicates(
+    labels: Iterable[str],
+    threshold: float = 0.5,
+    num_perm: int = 64,
+    shingle_size: int = 3,
+    limit: int = 100,
+    seed: int = 1,
+) -> DuplicateEntitiesResponse:
+    """Group labels whose n-gram Jaccard similarity is at least ``threshold``.
+
+    Groups are ordered by size and then by their best pair similarity. Pairs
+    inside the returned groups are listed with their scores.
+    """
+    started = time.monotonic()
+    unique = sorted(set(labels))
+    shingle_sets = [shingles(label, shingle_size) for label in unique]
+    # Labels made only of punctuation have no shingles and cannot match anything
+    indexed = [position for position, shingle_set in enumerate(shingle_sets) if shingle_set]
+    signatures = minhash_signatures([shingle_sets[position] for position in indexed], num_perm, seed)
+    bands, rows = choose_bands(num_perm, threshold)
+
+    candidates = _candidate_pairs(signatures, bands, rows)
+    pairs: List[Tuple[int, int, float]] = []
+    for first, second in candidates:
+        first, second = indexed[first], indexed[second]
+        similarity = jaccard(shingle_sets[first], shingle_sets[second])
+        if similarity >= threshold:
+            pairs.append((first, second, similarity))
+
+    # Union-find over accepted pairs gives the duplicate clusters
+    parent = {position: position for position in indexed}
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for first, second, _ in pairs:
+        root_first, root_second = find(first), find(second)
+        if root_first != root_second:
+            parent[root_first] = root_second
+
+    members: Dict[int, Set[int]] = {}
+    group_pairs: Dict[int, List[Tuple[int, int, float]]] = {}
+    for first, second, similarity in pairs:
+        root = find(first)
+        group_pairs.setdefault(root, []).append((first, second, similarity))
+        members.setdefault(root, set()).update((first, second))
+
+    groups = []
+    for root, positions in members.items():
+        scored = sorted(group_pairs[root], key=lambda pair: (-pair[2], unique[pair[0]], unique[pair[1]]))
+        groups.append(DuplicateGroup(
+            labels=sorted(unique[position] for position in positions),
+            max_similarity=scored[0][2],
+            pairs=[
+                DuplicatePair(first=unique[first], second=unique[second], similarity=similarity)
+                for first, second, similarity in scored
+            ],
+        ))
+    groups.sort(key=lambda group: (-len(group.labels), -group.max_similarity, group.labels))
+
+    return DuplicateEntitiesResponse(
+        groups=groups[:limit],
+        total_groups=len(groups),
+        total_labels=len(unique),
+        candidate_pairs=len(candidates),
+        threshold=threshold,
+        num_perm=num_perm,
+        bands=bands,
+        rows=rows,
+        backend="numpy" if np is not None else "python",
+        elapsed_seconds=time.monotonic() - started,
+    )
@@ -0,0 +1,80 @@
+"""
+Trusted fast-path construction of response models.
+
+``Model(**data)`` validates and copies every nested element. For a
+``GraphResponse`` holding tens of thousands of node and edge dicts, that is a
+large share of the CPU time spent on a request. When the LightRAG server is
+trusted, :func:`parse_trusted` validates only the top-level fields:
+
+- untyped list and dict fields (``List[Dict[str, Any]]`` and the like) are only
+  checked to be lists and dicts, and are kept as-is without copying;
+- every other field, including lists of nested models, is validated with a
+  cached ``TypeAdapter``. Pydantic's compiled validator builds small models
+  faster than ``model_construct`` does in Python.
+
+If a top-level check fails, the data is parsed with full validation instead.
+That either coerces the value or raises the usual ``ValidationError``.
+"""
+
+import functools
+import typing
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# (field name, required, container type kept unvalidated, or adapter validating the field)
+_FieldPlan = Tuple[str, bool, Optional[type], Optional[TypeAdapter]]
+
+
+def _is_untyped(annotation: Any) -> bool:
+    return annotation is Any or typing.get_origin(annotation) in (dict, list)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_plans(model: Type[BaseModel]) -> Tuple[_FieldPlan, ...]:
+    plans: List[_FieldPlan] = []
+    for name, field in model.model_fields.items():
+        origin = typing.get_origin(field.annotation)
+        args = typing.get_args(field.annotation)
+        if origin in (list, dict) and args and _is_untyped(args[-1]):
+            plans.append((name, field.is_required(), origin, None))
+        else:
+            plans.append((name, field.is_required(), None, TypeAdapter(field.annotation)))
+    return tuple(plans)
+
+
+class _Untrusted(Exception):
+    """Raised when data does not pass the top-level checks."""
+
+
+def _construct(model: Type[ModelT], data: Any) -> ModelT:
+    if not isinstance(data, dict):
+        raise _Untrusted()
+    values: Dict[str, Any] = {}
+    for name, required, container, adapter in _field_plans(model):
+        if name not in data:
+            if required:
+                raise _Untrusted()
+            continue
+        value = data[name]
+        if adapter is not None:
+            try:
+                values[name] = adapter.validate_python(value)
+            except ValueError:
+                raise _Untrusted()
+        elif isinstance(value, container):
+            values[name] = value
+        else:
+            raise _Untrusted()
+    return model.model_construct(**values)
+
+
+def parse_trusted(model: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """Build ``model`` from ``data``, validating only its top-level fields."""
+    try:
+        return _construct(model, data)
+    except _Untrusted:
+        return model(**data)
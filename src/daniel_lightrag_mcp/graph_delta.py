@@ -0,0 +1,137 @@
+"""
+Versioned knowledge graph snapshots and linear-time diffs between them.
+
+A snapshot stores only a fingerprint (hash of the canonical JSON) per node and
+edge. Diffing against a later fetch is one pass over each side's fingerprint
+map, so callers can ask "what changed since version N" without keeping or
+comparing full copies of the graph.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from .models import GraphDeltaResponse, GraphResponse
+
+
+EdgeKey = Tuple[str, str]
+
+
+def fingerprint(element: Dict[str, Any]) -> str:
+    """Return a stable hash of a node or edge dict."""
+    canonical = json.dumps(element, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _edge_key(edge: Dict[str, Any]) -> EdgeKey:
+    # LightRAG's graph is undirected and may return a relation with its
+    # endpoints swapped between fetches, so key on the sorted pair
+    return tuple(sorted((str(edge.get("source")), str(edge.get("target")))))
+
+
+def _edge_fingerprint(edge: Dict[str, Any]) -> str:
+    """Fingerprint an edge independently of which endpoint is reported as source.
+
+    The edge ``id`` is derived from the endpoints in the order returned, so it
+    is left out along with the endpoints themselves, which the key already covers.
+    """
+    return fingerprint({name: value for name, value in edge.items() if name not in ("id", "source", "target")})
+
+
+class GraphSnapshot:
+    """Fingerprints of one fetched graph, identified by a version number."""
+
+    def __init__(self, version: int, graph: GraphResponse):
+        self.version = version
+        self.taken_at = time.time()
+        self.nodes: Dict[str, str] = {
+            str(node["id"]): fingerprint(node) for node in graph.nodes if node.get("id") is not None
+        }
+        self.edges: Dict[EdgeKey, str] = {_edge_key(edge): _edge_fingerprint(edge) for edge in graph.edges}
+
+    def same_as(self, other: "GraphSnapshot") -> bool:
+        return self.nodes == other.nodes and self.edges == other.edges
+
+
+class GraphSnapshotStore:
+    """Recent snapshots per graph query, used to answer delta requests."""
+
+    def __init__(self, max_versions: int = 8):
+        self.max_versions = max_versions
+        self._next_version = 1
+        # query key -> version -> snapshot, oldest first
+        self._snapshots: Dict[Hashable, "OrderedDict[int, GraphSnapshot]"] = {}
+
+    def record(self, key: Hashable, graph: GraphResponse) -> GraphSnapshot:
+        """Fingerprint a fetched graph, reusing the latest version if nothing changed."""
+        snapshot = GraphSnapshot(self._next_version, graph)
+        history = self._snapshots.setdefault(key, OrderedDict())
+        if history:
+            latest = next(reversed(history.values()))
+            if latest.same_as(snapshot):
+                return latest
+        self._next_version += 1
+        history[snapshot.version] = snapshot
+        while len(history) > self.max_versions:
+            history.popitem(last=False)
+        return snapshot
+
+    def get(self, key: Hashable, version: int) -> Optional[GraphSnapshot]:
+        return self._snapshots.get(key, {}).get(version)
+
+    def diff(
+        self,
+        key: Hashable,
+        graph: GraphResponse,
+        since_version: Optional[int] = None,
+    ) -> GraphDeltaResponse:
+        """Record ``graph`` as the current snapshot and diff it against ``since_version``.
+
+        If the base version is unknown (never issued or already evicted), every
+        current node and edge is reported as added and ``base_found`` is False.
+        """
+        base = self.get(key, since_version) if since_version is not None else None
+        current = self.record(key, graph)
+        base_nodes = base.nodes if base is not None else {}
+        base_edges = base.edges if base is not None else {}
+
+        added_nodes: List[Dict[str, Any]] = []
+        changed_nodes: List[Dict[str, Any]] = []
+        for node in graph.nodes:
+            if node.get("id") is None:
+                continue
+            node_id = str(node["id"])
+            previous = base_nodes.get(node_id)
+            if previous is None:
+                added_nodes.append(node)
+            elif previous != current.nodes[node_id]:
+                changed_nodes.append(node)
+
+        added_edges: List[Dict[str, Any]] = []
+        changed_edges: List[Dict[str, Any]] = []
+        for edge in graph.edges:
+            edge_key = _edge_key(edge)
+            previous = base_edges.get(edge_key)
+            if previous is None:
+                added_edges.append(edge)
+            elif previous != current.edges[edge_key]:
+                changed_edges.append(edge)
+
+        return GraphDeltaResponse(
+            version=current.version,
+            since_version=since_version,
+            base_found=base is not None,
+            added_nodes=added_nodes,
+            changed_nodes=changed_nodes,
+            removed_node_ids=[node_id for node_id in base_nodes if node_id not in current.nodes],
+            added_edges=added_edges,
+            changed_edges=changed_edges,
+            removed_edges=[
+                {"source": source, "target": target}
+                for source, target in base_edges
+                if (source, target) not in current.edges
+            ],
+            is_truncated=graph.is_truncated,
+        )
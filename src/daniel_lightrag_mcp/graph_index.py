@@ -0,0 +1,261 @@
+"""
+Local index over a LightRAG knowledge graph snapshot.
+
+``GraphResponse`` carries nodes and edges as plain lists of dicts, so answering
+"who is connected to X" means fetching and scanning the whole graph. The index
+interns node IDs to integers and stores adjacency in compressed sparse row (CSR)
+form, so neighbor, degree and edge lookups are answered locally from the last
+snapshot. ``GraphIndexCache`` keeps that snapshot fresh.
+"""
+
+import asyncio
+import logging
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .client import LightRAGClient
+from .models import GraphDegreeResponse, GraphEdgeLookupResponse, GraphNeighborsResponse, GraphResponse
+
+
+# Neighbor directions accepted by lookups
+DIRECTIONS = ("out", "in", "both")
+
+
+def _build_csr(node_count: int, pairs: Iterable[Tuple[int, int, int]]) -> Tuple[array, array, array]:
+    """Build CSR arrays from ``(row, column, edge index)`` triples.
+
+    Returns ``(offsets, columns, edge_ids)``; the entries for row ``i`` live in
+    ``columns[offsets[i]:offsets[i + 1]]``.
+    """
+    pairs = list(pairs)
+    counts = [0] * (node_count + 1)
+    for row, _, _ in pairs:
+        counts[row + 1] += 1
+    for i in range(node_count):
+        counts[i + 1] += counts[i]
+    offsets = array("l", counts)
+
+    cursor = list(counts[:node_count])
+    columns = array("l", [0]) * len(pairs)
+    edge_ids = array("l", [0]) * len(pairs)
+    for row, column, edge_index in pairs:
+        position = cursor[row]
+        columns[position] = column
+        edge_ids[position] = edge_index
+        cursor[row] += 1
+    return offsets, columns, edge_ids
+
+
+class GraphIndex:
+    """Immutable, interned CSR index over one knowledge graph snapshot."""
+
+    def __init__(self, graph: GraphResponse, built_at: Optional[float] = None):
+        self.built_at = time.time() if built_at is None else built_at
+        self.is_truncated = graph.is_truncated
+
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._nodes: List[Dict[str, Any]] = []
+        for node in graph.nodes:
+            if node.get("id") is None:
+                continue
+            self._add_node(str(node["id"]), node)
+
+        self._edges: List[Dict[str, Any]] = []
+        self._edge_lookup: Dict[Tuple[int, int], int] = {}
+        endpoints: List[Tuple[int, int]] = []
+        for edge in graph.edges:
+            if edge.get("source") is None or edge.get("target") is None:
+                continue
+            # Edges may reference nodes the (possibly truncated) snapshot did not include
+            source = self._intern(str(edge["source"]))
+            target = self._intern(str(edge["target"]))
+            edge_index = len(self._edges)
+            self._edges.append(edge)
+            endpoints.append((source, target))
+            self._edge_lookup.setdefault((source, target), edge_index)
+
+        node_count = len(self._ids)
+        self._out = _build_csr(node_count, ((s, t, i) for i, (s, t) in enumerate(endpoints)))
+        self._in = _build_csr(node_count, ((t, s, i) for i, (s, t) in enumerate(endpoints)))
+
+    def _add_node(self, node_id: str, node: Dict[str, Any]) -> int:
+        index = self._index.get(node_id)
+        if index is None:
+            index = len(self._ids)
+            self._index[node_id] = index
+            self._ids.append(node_id)
+            self._nodes.append(node)
+        return index
+
+    def _intern(self, node_id: str) -> int:
+        return self._add_node(node_id, {"id": node_id})
+
+    # Size
+
+    @property
+    def node_count(self) -> int:
+        return len(self._ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edges)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._index
+
+    # Lookups
+
+    def node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Return the node dict for an ID, if present."""
+        index = self._index.get(node_id)
+        return None if index is None else self._nodes[index]
+
+    def _rows(self, direction: str) -> List[Tuple[array, array, array]]:
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Invalid direction '{direction}'. Must be one of: {list(DIRECTIONS)}")
+        if direction == "out":
+            return [self._out]
+        if direction == "in":
+            return [self._in]
+        return [self._out, self._in]
+
+    def degree(self, node_id: str, direction: str = "both") -> int:
+        """Return the number of edges touching a node (0 if unknown)."""
+        index = self._index.get(node_id)
+        rows = self._rows(direction)
+        if index is None:
+            return 0
+        return sum(offsets[index + 1] - offsets[index] for offsets, _, _ in rows)
+
+    def neighbor_edges(self, node_id: str, direction: str = "both") -> List[Tuple[str, Dict[str, Any]]]:
+        """Return ``(neighbor ID, edge)`` pairs for a node, without duplicates."""
+        index = self._index.get(node_id)
+        rows = self._rows(direction)
+        if index is None:
+            return []
+        seen = set()
+        result = []
+        for offsets, columns, edge_ids in rows:
+            for position in range(offsets[index], offsets[index + 1]):
+                edge_index = edge_ids[position]
+                if edge_index in seen:
+                    continue
+                seen.add(edge_index)
+                result.append((self._ids[columns[position]], self._edges[edge_index]))
+        return result
+
+    def neighbors(self, node_id: str, direction: str = "both") -> List[str]:
+        """Return the distinct neighbor IDs of a node in edge order."""
+        return list(dict.fromkeys(neighbor for neighbor, _ in self.neighbor_edges(node_id, direction)))
+
+    def edge(self, source_id: str, target_id: str, directed: bool = False) -> Optional[Dict[str, Any]]:
+        """Return the edge between two nodes; unless ``directed``, either orientation matches."""
+        source = self._index.get(source_id)
+        target = self._index.get(target_id)
+        if source is None or target is None:
+            return None
+        edge_index = self._edge_lookup.get((source, target))
+        if edge_index is None and not directed:
+            edge_index = self._edge_lookup.get((target, source))
+        return None if edge_index is None else self._edges[edge_index]
+
+
+class GraphIndexCache:
+    """Refreshable :class:`GraphIndex` snapshot of a LightRAG knowledge graph."""
+
+    def __init__(self, client: LightRAGClient, label: str = "*", refresh_interval: float = 30.0):
+        self.client = client
+        self.label = label
+        self.refresh_interval = refresh_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._index: Optional[GraphIndex] = None
+        self._built_monotonic: Optional[float] = None
+        self._built_generation: Optional[int] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def is_stale(self) -> bool:
+        """Return True if the snapshot is missing, expired, or predates an edit made through the client."""
+        if self._index is None or self._built_monotonic is None:
+            return True
+        if self._built_generation != self.client.graph_generation:
+            return True
+        return time.monotonic() - self._built_monotonic >= self.refresh_interval
+
+    def invalidate(self) -> None:
+        """Force the next lookup to rebuild the snapshot."""
+        self._built_monotonic = None
+
+    async def get(self, force_refresh: bool = False) -> GraphIndex:
+        """Return the current snapshot, rebuilding it from ``get_knowledge_graph`` if stale."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if force_refresh or self.is_stale():
+                generation = self.client.graph_generation
+                started = time.monotonic()
+                graph = await self.client.get_knowledge_graph(label=self.label)
+                self._index = GraphIndex(graph)
+                self._built_monotonic = time.monotonic()
+                self._built_generation = generation
+                self.logger.info(
+                    f"Built graph index with {self._index.node_count} nodes and {self._index.edge_count} edges "
+                    f"in {self._built_monotonic - started:.3f}s"
+                )
+            return self._index
+
+    # Local queries
+
+    async def neighbors(
+        self,
+        entity: str,
+        direction: str = "both",
+        limit: Optional[int] = None,
+        force_refresh: bool = False,
+    ) -> GraphNeighborsResponse:
+        """Return an entity's neighbor nodes and connecting edges from the snapshot."""
+        index = await self.get(force_refresh)
+        pairs = index.neighbor_edges(entity, direction)
+        if limit is not None:
+            pairs = pairs[:limit]
+        neighbor_ids = list(dict.fromkeys(neighbor for neighbor, _ in pairs))
+        return GraphNeighborsResponse(
+            entity=entity,
+            found=entity in index,
+            direction=direction,
+            degree=index.degree(entity, direction),
+            neighbors=[index.node(neighbor) for neighbor in neighbor_ids],
+            edges=[edge for _, edge in pairs],
+            snapshot_built_at=index.built_at,
+            is_truncated=index.is_truncated,
+        )
+
+    async def degrees(
+        self, entities: List[str], direction: str = "both", force_refresh: bool = False
+    ) -> GraphDegreeResponse:
+        """Return the degree of each requested entity from the snapshot."""
+        index = await self.get(force_refresh)
+        return GraphDegreeResponse(
+            direction=direction,
+            degrees={entity: index.degree(entity, direction) for entity in entities if entity in index},
+            missing=[entity for entity in entities if entity not in index],
+            snapshot_built_at=index.built_at,
+            is_truncated=index.is_truncated,
+        )
+
+    async def lookup_edge(
+        self, source: str, target: str, directed: bool = False, force_refresh: bool = False
+    ) -> GraphEdgeLookupResponse:
+        """Return the edge between two entities from the snapshot, if any."""
+        index = await self.get(force_refresh)
+        edge = index.edge(source, target, directed=directed)
+        return GraphEdgeLookupResponse(
+            source=source,
+            target=target,
+            found=edge is not None,
+            edge=edge,
+            snapshot_built_at=index.built_at,
+            is_truncated=index.is_truncated,
+        )
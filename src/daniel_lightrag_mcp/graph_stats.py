@@ -0,0 +1,198 @@
+"""
+Whole-graph analytics over a :class:`CompactGraph`: degree distribution,
+connected components and PageRank.
+
+Degrees and PageRank iterations are vectorized with NumPy when it is installed
+(``pip install daniel-lightrag-mcp[analytics]``). Otherwise the same results are
+computed in pure Python over the graph's array columns. The graph is treated as
+undirected, matching how LightRAG stores relations.
+"""
+
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .compact_graph import CompactGraph
+from .models import (
+    GraphComponentStats,
+    GraphDegreeStats,
+    GraphPageRankStats,
+    GraphStatsResponse,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+# Metrics graph_stats can compute
+GRAPH_METRICS = ("degree", "components", "pagerank")
+
+
+def _top(node_ids: Sequence[str], values: Sequence[float], top_k: int, key: str) -> List[Dict[str, object]]:
+    order = sorted(range(len(values)), key=lambda i: (-values[i], node_ids[i]))[:top_k]
+    return [{"id": node_ids[i], key: values[i]} for i in order]
+
+
+def _column(values: "array") -> "np.ndarray":
+    # Zero-copy view of an array('l') column
+    if not len(values):
+        return np.zeros(0, dtype=np.int64)
+    return np.frombuffer(values, dtype=f"i{values.itemsize}")
+
+
+def _degrees(graph: CompactGraph) -> List[int]:
+    n = graph.node_count
+    if np is not None:
+        sources, targets = _column(graph.sources), _column(graph.targets)
+        return (np.bincount(sources, minlength=n) + np.bincount(targets, minlength=n)).tolist()
+    degrees = [0] * n
+    for source in graph.sources:
+        degrees[source] += 1
+    for target in graph.targets:
+        degrees[target] += 1
+    return degrees
+
+
+def _degree_stats(graph: CompactGraph, degrees: List[int], top_k: int) -> GraphDegreeStats:
+    histogram: Dict[int, int] = {}
+    for degree in degrees:
+        histogram[degree] = histogram.get(degree, 0) + 1
+    ordered = sorted(degrees)
+    count = len(ordered)
+    if count:
+        middle = count // 2
+        median = float(ordered[middle]) if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+    else:
+        median = 0.0
+    return GraphDegreeStats(
+        min=ordered[0] if count else 0,
+        max=ordered[-1] if count else 0,
+        mean=sum(ordered) / count if count else 0.0,
+        median=median,
+        histogram=dict(sorted(histogram.items())),
+        top=_top(graph.node_ids, degrees, top_k, "degree"),
+    )
+
+
+def _component_stats(graph: CompactGraph, degrees: List[int], top_k: int) -> GraphComponentStats:
+    # Union-find with path halving; near-linear in the number of edges
+    parent = list(range(graph.node_count))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for source, target in zip(graph.sources, graph.targets):
+        root_source, root_target = find(source), find(target)
+        if root_source != root_target:
+            parent[root_source] = root_target
+
+    sizes: Dict[int, int] = {}
+    for node in range(graph.node_count):
+        root = find(node)
+        sizes[root] = sizes.get(root, 0) + 1
+    ordered = sorted(sizes.values(), reverse=True)
+    return GraphComponentStats(
+        count=len(ordered),
+        largest_size=ordered[0] if ordered else 0,
+        sizes=ordered[:top_k],
+        isolated_nodes=sum(1 for degree in degrees if degree == 0),
+    )
+
+
+def _pagerank(
+    graph: CompactGraph,
+    degrees: List[int],
+    damping: float,
+    max_iterations: int,
+    tolerance: float,
+    deadline: float,
+) -> Tuple[List[float], int, bool]:
+    """Power-iterate PageRank until converged, out of iterations or past the deadline."""
+    n = graph.node_count
+    if n == 0:
+        return [], 0, True
+    if np is not None:
+        sources, targets = _column(graph.sources), _column(graph.targets)
+        # Each undirected edge carries rank both ways
+        origin = np.concatenate([sources, targets])
+        destination = np.concatenate([targets, sources])
+        degree = np.asarray(degrees, dtype=float)
+        dangling = degree == 0
+        safe_degree = np.where(dangling, 1.0, degree)
+        rank = np.full(n, 1.0 / n)
+        for iteration in range(1, max_iterations + 1):
+            spread = np.bincount(destination, weights=rank[origin] / safe_degree[origin], minlength=n)
+            new_rank = (1.0 - damping) / n + damping * (spread + rank[dangling].sum() / n)
+            delta = float(np.abs(new_rank - rank).sum())
+            rank = new_rank
+            if delta < tolerance:
+                return rank.tolist(), iteration, True
+            if time.monotonic() >= deadline:
+                break
+        return rank.tolist(), iteration, False
+
+    rank = [1.0 / n] * n
+    iteration = 0
+    for iteration in range(1, max_iterations + 1):
+        dangling_mass = sum(rank[node] for node in range(n) if degrees[node] == 0)
+        base = (1.0 - damping) / n + damping * dangling_mass / n
+        new_rank = [base] * n
+        for source, target in zip(graph.sources, graph.targets):
+            new_rank[target] += damping * rank[source] / degrees[source]
+            new_rank[source] += damping * rank[target] / degrees[target]
+        delta = sum(abs(new - old) for new, old in zip(new_rank, rank))
+        rank = new_rank
+        if delta < tolerance:
+            return rank, iteration, True
+        if time.monotonic() >= deadline:
+            break
+    return rank, iteration, False
+
+
+def compute_graph_stats(
+    graph: CompactGraph,
+    metrics: Optional[Iterable[str]] = None,
+    top_k: int = 10,
+    damping: float = 0.85,
+    max_iterations: int = 100,
+    tolerance: float = 1e-6,
+    time_budget: float = 5.0,
+) -> GraphStatsResponse:
+    """Compute the requested metrics, stopping PageRank early if ``time_budget`` runs out."""
+    started = time.monotonic()
+    deadline = started + time_budget
+    selected = set(GRAPH_METRICS if metrics is None else metrics)
+    unknown = selected - set(GRAPH_METRICS)
+    if unknown:
+        raise ValueError(f"Unknown graph metrics {sorted(unknown)}. Must be among: {list(GRAPH_METRICS)}")
+
+    degrees = _degrees(graph)
+    result = GraphStatsResponse(
+        node_count=graph.node_count,
+        edge_count=graph.edge_count,
+        is_truncated=graph.is_truncated,
+        backend="numpy" if np is not None else "python",
+    )
+    if "degree" in selected:
+        result.degree = _degree_stats(graph, degrees, top_k)
+    if "components" in selected:
+        result.components = _component_stats(graph, degrees, top_k)
+    if "pagerank" in selected:
+        if time.monotonic() >= deadline:
+            result.budget_exhausted = True
+        else:
+            ranks, iterations, converged = _pagerank(graph, degrees, damping, max_iterations, tolerance, deadline)
+            result.pagerank = GraphPageRankStats(
+                damping=damping,
+                iterations=iterations,
+                converged=converged,
+                top=_top(graph.node_ids, ranks, top_k, "score"),
+            )
+            result.budget_exhausted = not converged and iterations < max_iterations
+    result.elapsed_seconds = time.monotonic() - started
+    return result
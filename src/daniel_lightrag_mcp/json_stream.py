@@ -0,0 +1,249 @@
+"""
+Incremental parsing of large JSON response bodies.
+
+``response.json()`` needs the whole body in memory and then builds the whole
+object tree. For a 500 MB ``/graphs`` or ``/documents`` response, peak memory is
+several times the payload. ``JSONStreamParser`` is fed raw byte chunks as they
+arrive. Elements of selected arrays (for example ``nodes`` and ``edges``) are
+decoded and emitted one at a time, so only the element being parsed and the
+unconsumed tail of the last chunk are held in memory.
+
+The scanner only tracks structure: strings, brackets and object keys. Each
+emitted element or top-level value is decoded with ``loads`` (:func:`json.loads`
+unless a faster decoder is passed in), which does the actual validation.
+"""
+
+import json
+import re
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+# Path component matching any object key
+WILDCARD = "*"
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_SEPARATORS = re.compile(rb"[ \t\r\n,:]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# String content up to the closing quote, stopping early at a backslash that ends the buffer
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+# Skips to the next bracket outside a string; a lone quote starts a string that continues past the buffer.
+# Each character can be consumed only one way, so a failed match backtracks in linear time.
+_NEXT_BRACKET = re.compile(rb'(?:[^"\[\]{}]|"[^"\\]*(?:\\.[^"\\]*)*")*([\[\]{}]|")', re.DOTALL)
+_SCALAR_END = re.compile(rb"[ \t\r\n,\]}]")
+
+_QUOTE = ord('"')
+_OPENERS = (ord("{"), ord("["))
+
+
+class StreamEvent(NamedTuple):
+    """A value decoded from the stream.
+
+    ``path`` is the chain of object keys leading to the value. For elements of a
+    streamed array, ``path`` is the array's path and ``item`` is True.
+    """
+    path: Tuple[str, ...]
+    value: Any
+    item: bool
+
+
+class _Frame:
+    __slots__ = ("path", "is_object", "streamed", "key")
+
+    def __init__(self, path: Tuple[str, ...], is_object: bool, streamed: bool = False):
+        self.path = path
+        self.is_object = is_object
+        self.streamed = streamed
+        self.key: Optional[str] = None
+
+
+class JSONStreamParser:
+    """Push parser emitting elements of selected arrays as soon as each one is complete.
+
+    ``stream_paths`` lists the key paths of arrays whose elements should be
+    emitted one by one. ``"*"`` matches any key, so ``("statuses", "*")`` streams
+    every per-status document list of a ``/documents`` body. Objects on the way
+    to a streamed array are descended into. Every other value is decoded whole
+    and emitted with ``item=False``.
+    """
+
+    def __init__(self, stream_paths: Iterable[Sequence[str]], loads: Callable[[bytes], Any] = json.loads):
+        self.stream_paths = [tuple(path) for path in stream_paths]
+        self._loads = loads
+        self._buffer = bytearray()
+        self._position = 0
+        self._stack: List[_Frame] = []
+        self._done = False
+        # In-progress capture of one whole value: start offset, resume offset, bracket depth, in-string flag
+        self._capture: Optional[List[Any]] = None
+        self._capture_frame: Optional[_Frame] = None
+
+    def feed(self, chunk: bytes) -> List[StreamEvent]:
+        """Consume a chunk of the body and return the values it completed."""
+        self._buffer += chunk
+        events: List[StreamEvent] = []
+        self._parse(events, final=False)
+        self._compact()
+        return events
+
+    def close(self) -> List[StreamEvent]:
+        """Signal the end of the body, returning any last values.
+
+        Raises :class:`json.JSONDecodeError` if the body was truncated or malformed.
+        """
+        events: List[StreamEvent] = []
+        self._parse(events, final=True)
+        self._position = _WHITESPACE.match(self._buffer, self._position).end()
+        if not self._done or self._capture is not None or self._position < len(self._buffer):
+            raise json.JSONDecodeError("Incomplete or trailing JSON data", self._buffer.decode("utf-8", "replace"), self._position)
+        return events
+
+    # Path matching
+
+    def _is_streamed(self, path: Tuple[str, ...]) -> bool:
+        return any(self._matches(pattern, path) for pattern in self.stream_paths)
+
+    def _leads_to_stream(self, path: Tuple[str, ...]) -> bool:
+        return any(
+            len(pattern) > len(path) and self._matches(pattern[:len(path)], path)
+            for pattern in self.stream_paths
+        )
+
+    @staticmethod
+    def _matches(pattern: Tuple[str, ...], path: Tuple[str, ...]) -> bool:
+        return len(pattern) == len(path) and all(
+            expected in (WILDCARD, actual) for expected, actual in zip(pattern, path)
+        )
+
+    # Scanning
+
+    def _parse(self, events: List[StreamEvent], final: bool) -> None:
+        buffer = self._buffer
+        while not self._done:
+            if self._capture is not None:
+                value = self._finish_capture(final)
+                if value is None:
+                    return
+                frame = self._capture_frame
+                self._capture = self._capture_frame = None
+                self._emit(events, frame, value[0])
+                continue
+
+            self._position = _SEPARATORS.match(buffer, self._position).end()
+            if self._position >= len(buffer):
+                return
+            char = buffer[self._position:self._position + 1]
+            frame = self._stack[-1] if self._stack else None
+
+            if char in (b"}", b"]"):
+                if frame is None:
+                    raise json.JSONDecodeError("Unexpected closing bracket", buffer.decode("utf-8", "replace"), self._position)
+                self._position += 1
+                self._stack.pop()
+                if self._stack:
+                    self._stack[-1].key = None
+                else:
+                    self._done = True
+                continue
+
+            if frame is not None and frame.is_object and frame.key is None:
+                if char != b'"':
+                    raise json.JSONDecodeError("Expected an object key", buffer.decode("utf-8", "replace"), self._position)
+                end = self._string_end(self._position)
+                if end is None:
+                    return
+                frame.key = json.loads(buffer[self._position:end])
+                self._position = end
+                continue
+
+            path = self._value_path(frame)
+            if not (frame is not None and frame.streamed):
+                if char == b"[" and self._is_streamed(path):
+                    self._stack.append(_Frame(path, is_object=False, streamed=True))
+                    self._position += 1
+                    continue
+                if char == b"{" and self._leads_to_stream(path):
+                    self._stack.append(_Frame(path, is_object=True))
+                    self._position += 1
+                    continue
+            self._capture = [self._position, self._position, 0, False]
+            self._capture_frame = frame
+
+    def _value_path(self, frame: Optional[_Frame]) -> Tuple[str, ...]:
+        if frame is None:
+            return ()
+        if frame.is_object:
+            return frame.path + (frame.key,)
+        return frame.path
+
+    def _string_end(self, position: int) -> Optional[int]:
+        """Return the offset just past the string starting at ``position``, or None if incomplete."""
+        match = _STRING.match(self._buffer, position)
+        return match.end() if match is not None else None
+
+    def _finish_capture(self, final: bool) -> Optional[Tuple[Any]]:
+        """Advance the current capture; return ``(value,)`` once the value is complete."""
+        buffer = self._buffer
+        start, scan, depth, in_string = self._capture
+        first = buffer[start]
+
+        if first == _QUOTE:
+            end = self._string_end(start)
+            if end is None:
+                return None
+        elif first in _OPENERS:
+            end = None
+            while end is None:
+                if in_string:
+                    scan = _STRING_BODY.match(buffer, scan).end()
+                    if scan >= len(buffer) or buffer[scan] != _QUOTE:
+                        # The string continues in the next chunk
+                        self._capture = [start, scan, depth, True]
+                        return None
+                    scan += 1
+                    in_string = False
+                    continue
+                match = _NEXT_BRACKET.match(buffer, scan)
+                if match is None:
+                    self._capture = [start, len(buffer), depth, False]
+                    return None
+                scan = match.end()
+                token = buffer[match.start(1)]
+                if token == _QUOTE:
+                    in_string = True
+                elif token in _OPENERS:
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        end = scan
+        else:
+            match = _SCALAR_END.search(buffer, start)
+            if match is None:
+                if not final:
+                    return None
+                end = len(buffer)
+            else:
+                end = match.start()
+
+        self._position = end
+        return (self._loads(buffer[start:end]),)
+
+    def _emit(self, events: List[StreamEvent], frame: Optional[_Frame], value: Any) -> None:
+        if frame is None:
+            events.append(StreamEvent((), value, False))
+            self._done = True
+        elif frame.streamed:
+            events.append(StreamEvent(frame.path, value, True))
+        else:
+            events.append(StreamEvent(frame.path + (frame.key,), value, False))
+            frame.key = None
+
+    def _compact(self) -> None:
+        # Drop consumed bytes; an in-progress capture keeps everything from its start
+        keep = self._capture[0] if self._capture is not None else self._position
+        if keep:
+            del self._buffer[:keep]
+            self._position -= keep
+            if self._capture is not None:
+                self._capture[0] -= keep
+                self._capture[1] -= keep
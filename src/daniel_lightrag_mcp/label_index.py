@@ -0,0 +1,156 @@
+"""
+Local search index over knowledge graph labels.
+
+``/graph/label/list`` returns every entity label in one list. The index keeps
+those labels sorted by their case-folded form, so prefix lookups are a binary
+search. It also keeps a trigram posting index for fuzzy matching, so
+autocompletion-style lookups never scan the full label list.
+``LabelIndexCache`` refreshes the index from LightRAG.
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from typing import Dict, List, Optional, Set
+
+from .client import LightRAGClient
+from .models import LabelMatch, LabelSearchResponse
+
+
+# Search modes accepted by LabelIndex.search
+SEARCH_MODES = ("auto", "prefix", "fuzzy")
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the padded character trigrams of a case-folded string."""
+    padded = f"  {text.casefold()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class LabelIndex:
+    """Immutable prefix and trigram index over a list of labels."""
+
+    def __init__(self, labels: List[str], built_at: Optional[float] = None):
+        self.built_at = time.time() if built_at is None else built_at
+        pairs = sorted({(label.casefold(), label) for label in labels})
+        self._keys = [key for key, _ in pairs]
+        self._labels = [label for _, label in pairs]
+
+        self._grams: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for position, key in enumerate(self._keys):
+            grams = trigrams(key)
+            self._grams.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    @property
+    def labels(self) -> List[str]:
+        """Indexed labels in case-insensitive order."""
+        return list(self._labels)
+
+    def prefix(self, query: str, limit: int) -> List[LabelMatch]:
+        """Return labels starting with ``query`` (case-insensitive), in sorted order."""
+        key = query.casefold()
+        start = bisect.bisect_left(self._keys, key)
+        matches = []
+        for position in range(start, min(start + limit, len(self._keys))):
+            if not self._keys[position].startswith(key):
+                break
+            score = 1.0 if self._keys[position] == key else len(key) / len(self._keys[position])
+            matches.append(LabelMatch(label=self._labels[position], score=score, match_type="prefix"))
+        return matches
+
+    def fuzzy(self, query: str, limit: int, min_score: float = 0.3) -> List[LabelMatch]:
+        """Return labels ranked by trigram (Dice) similarity to ``query``."""
+        grams = trigrams(query)
+        if not grams:
+            return []
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+        scored = []
+        for position, count in shared.items():
+            score = 2.0 * count / (len(grams) + self._grams[position])
+            if score >= min_score:
+                scored.append((-score, self._keys[position], position))
+        scored.sort()
+        return [
+            LabelMatch(label=self._labels[position], score=-negative_score, match_type="fuzzy")
+            for negative_score, _, position in scored[:limit]
+        ]
+
+    def search(self, query: str, limit: int = 10, mode: str = "auto", min_score: float = 0.3) -> List[LabelMatch]:
+        """Search by prefix, by fuzzy similarity, or prefix first topped up with fuzzy matches."""
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Invalid search mode '{mode}'. Must be one of: {list(SEARCH_MODES)}")
+        if mode == "prefix":
+            return self.prefix(query, limit)
+        if mode == "fuzzy":
+            return self.fuzzy(query, limit, min_score)
+        matches = self.prefix(query, limit)
+        if len(matches) < limit:
+            seen = {match.label for match in matches}
+            for match in self.fuzzy(query, limit + len(matches), min_score):
+                if match.label not in seen and len(matches) < limit:
+                    matches.append(match)
+        return matches
+
+
+class LabelIndexCache:
+    """Refreshable :class:`LabelIndex` built from ``get_graph_labels``."""
+
+    def __init__(self, client: LightRAGClient, refresh_interval: float = 60.0):
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._index: Optional[LabelIndex] = None
+        self._built_monotonic: Optional[float] = None
+        self._built_generation: Optional[int] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def is_stale(self) -> bool:
+        """Return True if the index is missing, expired, or predates an edit made through the client."""
+        if self._index is None or self._built_monotonic is None:
+            return True
+        if self._built_generation != self.client.graph_generation:
+            return True
+        return time.monotonic() - self._built_monotonic >= self.refresh_interval
+
+    async def get(self, force_refresh: bool = False) -> LabelIndex:
+        """Return the current index, rebuilding it if stale."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if force_refresh or self.is_stale():
+                generation = self.client.graph_generation
+                labels = await self.client.get_graph_labels()
+                self._index = LabelIndex(labels.entity_labels)
+                self._built_monotonic = time.monotonic()
+                self._built_generation = generation
+                self.logger.info(f"Built label index over {len(self._index)} labels")
+            return self._index
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        mode: str = "auto",
+        min_score: float = 0.3,
+        force_refresh: bool = False,
+    ) -> LabelSearchResponse:
+        """Search the label index, refreshing it first if stale."""
+        index = await self.get(force_refresh)
+        return LabelSearchResponse(
+            query=query,
+            mode=mode,
+            matches=index.search(query, limit=limit, mode=mode, min_score=min_score),
+            total_labels=len(index),
+            index_built_at=index.built_at,
+        )
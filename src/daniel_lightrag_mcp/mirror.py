@@ -0,0 +1,273 @@
+"""
+Local mirror of LightRAG document statuses.
+
+The mirror keeps every document's status in memory (and optionally in SQLite) so
+list, count and filter questions can be answered without recomputing the full
+document map upstream. It is refreshed incrementally: the cheap
+``/documents/status_counts`` call is used as a change detector, and only the
+status buckets whose counts changed are re-fetched through the paginated API.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from .client import LightRAGClient
+from .models import DocStatus, DocumentInfo, DocumentMirrorResponse
+
+
+# Key LightRAG uses for the total in status count responses
+ALL_STATUSES_KEY = "all"
+
+
+class DocumentStatusMirror:
+    """In-memory (optionally SQLite-backed) mirror of document statuses."""
+
+    def __init__(
+        self,
+        client: LightRAGClient,
+        sqlite_path: Optional[str] = None,
+        refresh_interval: float = 5.0,
+        page_size: int = 100,
+        concurrency: int = 8,
+    ):
+        self.client = client
+        self.sqlite_path = sqlite_path
+        self.refresh_interval = refresh_interval
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.logger = logging.getLogger(__name__)
+
+        self._buckets: Dict[str, Dict[str, DocumentInfo]] = {}
+        self._counts: Dict[str, int] = {}
+        self._loaded = False
+        self._dirty: Set[str] = set()
+        self._last_checked: Optional[float] = None
+        self._last_refreshed: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+        if sqlite_path:
+            self._init_db()
+
+    # Refreshing
+
+    async def refresh(self, force: bool = False) -> bool:
+        """Bring the mirror up to date, returning True if any documents were re-fetched.
+
+        Within ``refresh_interval`` seconds of the previous check nothing is requested
+        upstream unless ``force`` is set.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._last_checked is not None
+                and now - self._last_checked < self.refresh_interval
+            ):
+                return False
+
+            if not self._loaded and self.sqlite_path:
+                await self._run_db(self._load_db)
+
+            counts_response = await self.client.get_document_status_counts()
+            counts = self._normalize_counts(counts_response.status_counts)
+            self._last_checked = time.monotonic()
+
+            if force or not self._loaded:
+                changed = set(counts) | set(self._buckets)
+            else:
+                changed = {
+                    status for status in set(counts) | set(self._counts)
+                    if counts.get(status, 0) != self._counts.get(status, 0)
+                }
+
+            if not changed:
+                self.logger.debug("Document status counts unchanged, mirror is current")
+                return False
+
+            self.logger.info(f"Refreshing mirrored document statuses: {sorted(changed)}")
+            known_statuses = {status.value for status in DocStatus}
+            if not changed <= known_statuses:
+                # The paginated endpoint can only filter on known statuses
+                await self._refresh_all()
+            else:
+                for status in sorted(changed):
+                    await self._refresh_status(status, counts.get(status, 0))
+
+            self._counts = counts
+            self._loaded = True
+            self._last_refreshed = time.time()
+            if self.sqlite_path:
+                dirty, self._dirty = self._dirty, set()
+                await self._run_db(self._save_db, dirty)
+            return True
+
+    async def _refresh_status(self, status: str, expected_count: int) -> None:
+        """Replace one status bucket with a fresh fetch."""
+        if expected_count == 0:
+            self._buckets.pop(status, None)
+            self._dirty.add(status)
+            return
+        inventory = await self.client.get_document_inventory(
+            page_size=self.page_size, status_filter=status, concurrency=self.concurrency
+        )
+        self._replace_bucket(status, inventory.documents)
+
+    async def _refresh_all(self) -> None:
+        """Replace every status bucket with a single unfiltered fetch."""
+        inventory = await self.client.get_document_inventory(
+            page_size=self.page_size, concurrency=self.concurrency
+        )
+        buckets: Dict[str, Dict[str, DocumentInfo]] = {}
+        for document in inventory.documents:
+            buckets.setdefault(self._status_of(document), {})[document.id] = document
+        self._dirty.update(self._buckets)
+        self._dirty.update(buckets)
+        self._buckets = buckets
+
+    def _replace_bucket(self, status: str, documents: Iterable[DocumentInfo]) -> None:
+        bucket = {document.id: document for document in documents}
+        # A document that changed status must not linger in its previous bucket
+        for other_status, other_bucket in self._buckets.items():
+            if other_status != status:
+                for doc_id in bucket.keys() & other_bucket.keys():
+                    del other_bucket[doc_id]
+                    self._dirty.add(other_status)
+        self._buckets[status] = bucket
+        self._dirty.add(status)
+
+    @staticmethod
+    def _normalize_counts(status_counts: Dict[str, int]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for status, count in status_counts.items():
+            key = str(status).rsplit(".", 1)[-1].lower()
+            if key != ALL_STATUSES_KEY:
+                counts[key] = counts.get(key, 0) + int(count)
+        return counts
+
+    @staticmethod
+    def _status_of(document: DocumentInfo) -> str:
+        status = document.status
+        return status.value if isinstance(status, DocStatus) else str(status).lower()
+
+    # Local queries
+
+    def get(self, document_id: str) -> Optional[DocumentInfo]:
+        """Return a mirrored document by ID, if present."""
+        for bucket in self._buckets.values():
+            document = bucket.get(document_id)
+            if document is not None:
+                return document
+        return None
+
+    def count(self, status: Optional[str] = None) -> int:
+        """Return the number of mirrored documents, optionally for a single status."""
+        if status is not None:
+            return len(self._buckets.get(status.lower(), {}))
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def status_counts(self) -> Dict[str, int]:
+        """Return per-status counts of mirrored documents, including the total."""
+        counts = {status: len(bucket) for status, bucket in self._buckets.items() if bucket}
+        counts[ALL_STATUSES_KEY] = sum(counts.values())
+        return counts
+
+    def list_documents(
+        self,
+        status: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        document_ids: Optional[List[str]] = None,
+    ) -> List[DocumentInfo]:
+        """Return mirrored documents, optionally filtered by status or ID."""
+        documents = self._select(status, document_ids)
+        end = None if limit is None else offset + limit
+        return documents[offset:end]
+
+    def _select(self, status: Optional[str], document_ids: Optional[List[str]]) -> List[DocumentInfo]:
+        if document_ids is not None:
+            documents = [doc for doc in (self.get(doc_id) for doc_id in document_ids) if doc is not None]
+            if status is not None:
+                documents = [doc for doc in documents if self._status_of(doc) == status.lower()]
+            return documents
+        if status is not None:
+            return list(self._buckets.get(status.lower(), {}).values())
+        return [doc for bucket in self._buckets.values() for doc in bucket.values()]
+
+    async def query(
+        self,
+        status: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        document_ids: Optional[List[str]] = None,
+        refresh: bool = True,
+        force: bool = False,
+    ) -> DocumentMirrorResponse:
+        """Refresh if due (or unconditionally with ``force``), then answer a list/count/filter query from the mirror."""
+        refreshed = await self.refresh(force=force) if refresh or force else False
+        documents = self._select(status, document_ids)
+        end = None if limit is None else offset + limit
+        return DocumentMirrorResponse(
+            documents=documents[offset:end],
+            total_count=len(documents),
+            status_counts=self.status_counts(),
+            refreshed=refreshed,
+            last_refreshed=self._last_refreshed,
+        )
+
+    # SQLite persistence
+
+    async def _run_db(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.sqlite_path)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents "
+                "(id TEXT PRIMARY KEY, status TEXT NOT NULL, data TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_status ON documents(status)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS status_counts (status TEXT PRIMARY KEY, count INTEGER NOT NULL)"
+            )
+
+    def _load_db(self) -> None:
+        with self._connect() as conn:
+            counts = dict(conn.execute("SELECT status, count FROM status_counts").fetchall())
+            rows = conn.execute("SELECT status, data FROM documents").fetchall()
+        if not counts:
+            return
+        buckets: Dict[str, Dict[str, DocumentInfo]] = {}
+        for status, data in rows:
+            document = DocumentInfo(**json.loads(data))
+            buckets.setdefault(status, {})[document.id] = document
+        self._buckets = buckets
+        self._counts = counts
+        self._loaded = True
+        self.logger.info(f"Loaded {len(rows)} mirrored documents from {self.sqlite_path}")
+
+    def _save_db(self, statuses: Iterable[str]) -> None:
+        with self._connect() as conn:
+            for status in statuses:
+                conn.execute("DELETE FROM documents WHERE status = ?", (status,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO documents (id, status, data) VALUES (?, ?, ?)",
+                    [
+                        (document.id, status, document.model_dump_json())
+                        for document in self._buckets.get(status, {}).values()
+                    ],
+                )
+            conn.execute("DELETE FROM status_counts")
+            conn.executemany(
+                "INSERT INTO status_counts (status, count) VALUES (?, ?)",
+                list(self._counts.items()),
+            )
@@ -190,6 +190,23 @@ class PaginatedDocsResponse(BaseModel):
     status_counts: Dict[str, int] = Field(default_factory=dict, description="Status counts")
 
 
+class DocumentInventoryResponse(BaseModel):
+    """Response model for a complete document inventory assembled from paginated fetches."""
+    documents: List[DocumentInfo] = Field(default_factory=list, description="All documents, deduplicated by ID")
+    total_count: int = Field(0, ge=0, description="Total number of documents reported by the server")
+    pages_fetched: int = Field(0, ge=0, description="Number of pages requested")
+    status_counts: Dict[str, int] = Field(default_factory=dict, description="Status counts")
+
+
+class DocumentMirrorResponse(BaseModel):
+    """Response model for document queries answered from the local status mirror."""
+    documents: List[DocumentInfo] = Field(default_factory=list, description="Matching documents")
+    total_count: int = Field(0, ge=0, description="Total number of matching documents")
+    status_counts: Dict[str, int] = Field(default_factory=dict, description="Mirrored status counts")
+    refreshed: bool = Field(False, description="Whether documents were re-fetched for this query")
+    last_refreshed: Optional[float] = Field(None, description="Unix time of the last upstream fetch")
+
+
 class DeleteDocByIdResponse(BaseModel):
     """Response model for document deletion by ID."""
     status: str = Field(..., description="Deletion status")
@@ -197,6 +214,23 @@ class DeleteDocByIdResponse(BaseModel):
     doc_id: Optional[str] = Field(None, description="ID of the deleted document")
 
 
+class DocumentDeletionOutcome(BaseModel):
+    """Outcome of deleting a single document as part of a batch."""
+    doc_id: str = Field(..., description="Document ID")
+    success: bool = Field(..., description="Whether the deletion request was accepted")
+    status: str = Field(..., description="Deletion status reported for the request carrying this ID")
+    message: Optional[str] = None
+
+
+class BatchDeleteResponse(BaseModel):
+    """Response model for deleting many documents in chunked requests."""
+    requested: int = Field(0, ge=0, description="Number of distinct document IDs requested")
+    succeeded: int = Field(0, ge=0, description="Number of IDs whose deletion was accepted")
+    failed: int = Field(0, ge=0, description="Number of IDs whose deletion failed")
+    requests_made: int = Field(0, ge=0, description="Number of delete requests sent")
+    results: List[DocumentDeletionOutcome] = Field(default_factory=list, description="Per-ID outcomes")
+
+
 class ClearDocumentsResponse(BaseModel):
     """Response model for clearing all documents."""
     status: str = Field(..., description="Clearing status")
@@ -229,6 +263,18 @@ class TrackStatusResponse(BaseModel):
     status_summary: Dict[str, Any] = Field(default_factory=dict, description="Status summary")
 
 
+class TrackWaitResponse(BaseModel):
+    """Response model for waiting on a track ID until ingestion finishes."""
+    track_id: str = Field(..., description="Track ID that was waited on")
+    status: str = Field(..., description="Final state: processed, failed or timeout")
+    completed: bool = Field(..., description="Whether all documents reached a terminal status")
+    elapsed_seconds: float = Field(..., ge=0, description="Time spent waiting for ingestion")
+    polls: int = Field(0, ge=0, description="Number of track status requests made")
+    status_summary: Dict[str, Any] = Field(default_factory=dict, description="Last status summary")
+    documents: List[Dict[str, Any]] = Field(default_factory=list, description="Documents in track")
+    message: Optional[str] = None
+
+
 class StatusCountsResponse(BaseModel):
     """Response model for document status counts."""
     status_counts: Dict[str, int] = Field(..., description="Status counts mapping")
@@ -315,6 +361,134 @@ class LabelsResponse(BaseModel):
     relation_labels: List[str] = Field(default_factory=list)
 
 
+class LabelMatch(BaseModel):
+    """A single label search hit."""
+    label: str = Field(..., description="Matching label")
+    score: float = Field(..., ge=0, le=1, description="Match quality, 1.0 for an exact match")
+    match_type: str = Field(..., description="How the label matched: prefix or fuzzy")
+
+
+class LabelSearchResponse(BaseModel):
+    """Response model for searching graph labels."""
+    query: str = Field(..., description="Search text")
+    mode: str = Field("auto", description="Search mode used")
+    matches: List[LabelMatch] = Field(default_factory=list, description="Best matches first")
+    total_labels: int = Field(0, ge=0, description="Number of labels in the index")
+    index_built_at: float = Field(..., description="Unix time the label index was built")
+
+
+class DuplicatePair(BaseModel):
+    """Two labels that look like the same entity."""
+    first: str = Field(..., description="First label")
+    second: str = Field(..., description="Second label")
+    similarity: float = Field(..., ge=0, le=1, description="Jaccard similarity of the labels' character n-grams")
+
+
+class DuplicateGroup(BaseModel):
+    """A cluster of labels that are likely duplicates of each other."""
+    labels: List[str] = Field(..., description="Labels in the cluster")
+    max_similarity: float = Field(..., ge=0, le=1, description="Highest pair similarity in the cluster")
+    pairs: List[DuplicatePair] = Field(default_factory=list, description="Matching pairs, most similar first")
+
+
+class DuplicateEntitiesResponse(BaseModel):
+    """Response model for near-duplicate entity detection."""
+    groups: List[DuplicateGroup] = Field(default_factory=list, description="Duplicate clusters, largest first")
+    total_groups: int = Field(0, ge=0, description="Number of clusters found before applying the limit")
+    total_labels: int = Field(0, ge=0, description="Number of distinct labels compared")
+    candidate_pairs: int = Field(0, ge=0, description="Pairs sharing an LSH bucket that were scored")
+    threshold: float = Field(0.5, description="Minimum similarity for a pair to count as a duplicate")
+    num_perm: int = Field(64, description="MinHash signature length")
+    bands: int = Field(16, description="LSH bands")
+    rows: int = Field(4, description="Signature rows per LSH band")
+    backend: str = Field("python", description="Computation backend: numpy or python")
+    elapsed_seconds: float = Field(0.0, ge=0, description="Time spent finding duplicates")
+
+
+class GraphDeltaResponse(BaseModel):
+    """Response model for changes to the knowledge graph since an earlier snapshot."""
+    version: int = Field(..., description="Snapshot version of the current graph; pass as since_version next time")
+    since_version: Optional[int] = Field(None, description="Snapshot version the delta is relative to")
+    base_found: bool = Field(False, description="Whether since_version was known; if not, everything is reported as added")
+    added_nodes: List[Dict[str, Any]] = Field(default_factory=list, description="Nodes not in the base snapshot")
+    changed_nodes: List[Dict[str, Any]] = Field(default_factory=list, description="Nodes whose content changed")
+    removed_node_ids: List[str] = Field(default_factory=list, description="IDs of nodes no longer present")
+    added_edges: List[Dict[str, Any]] = Field(default_factory=list, description="Edges not in the base snapshot")
+    changed_edges: List[Dict[str, Any]] = Field(default_factory=list, description="Edges whose content changed")
+    removed_edges: List[Dict[str, str]] = Field(default_factory=list, description="Source/target pairs of edges no longer present")
+    is_truncated: bool = Field(False, description="Whether the current graph was truncated upstream")
+
+
+class GraphNeighborsResponse(BaseModel):
+    """Response model for a neighbor lookup in the local graph index."""
+    entity: str = Field(..., description="Entity whose neighbors were looked up")
+    found: bool = Field(..., description="Whether the entity is in the indexed snapshot")
+    direction: str = Field("both", description="Edge direction followed: out, in or both")
+    degree: int = Field(0, ge=0, description="Number of edges followed")
+    neighbors: List[Dict[str, Any]] = Field(default_factory=list, description="Neighbor nodes")
+    edges: List[Dict[str, Any]] = Field(default_factory=list, description="Edges connecting the entity to its neighbors")
+    snapshot_built_at: float = Field(..., description="Unix time the indexed snapshot was fetched")
+    is_truncated: bool = Field(False, description="Whether the indexed snapshot was truncated upstream")
+
+
+class GraphDegreeResponse(BaseModel):
+    """Response model for degree lookups in the local graph index."""
+    direction: str = Field("both", description="Edge direction counted: out, in or both")
+    degrees: Dict[str, int] = Field(default_factory=dict, description="Mapping of entity name to degree")
+    missing: List[str] = Field(default_factory=list, description="Requested entities not in the indexed snapshot")
+    snapshot_built_at: float = Field(..., description="Unix time the indexed snapshot was fetched")
+    is_truncated: bool = Field(False, description="Whether the indexed snapshot was truncated upstream")
+
+
+class GraphEdgeLookupResponse(BaseModel):
+    """Response model for an edge lookup in the local graph index."""
+    source: str = Field(..., description="Source entity")
+    target: str = Field(..., description="Target entity")
+    found: bool = Field(..., description="Whether an edge between the entities exists in the snapshot")
+    edge: Optional[Dict[str, Any]] = Field(None, description="The matching edge")
+    snapshot_built_at: float = Field(..., description="Unix time the indexed snapshot was fetched")
+    is_truncated: bool = Field(False, description="Whether the indexed snapshot was truncated upstream")
+
+
+class GraphDegreeStats(BaseModel):
+    """Degree distribution of a knowledge graph."""
+    min: int = Field(0, ge=0, description="Smallest node degree")
+    max: int = Field(0, ge=0, description="Largest node degree")
+    mean: float = Field(0.0, ge=0, description="Mean node degree")
+    median: float = Field(0.0, ge=0, description="Median node degree")
+    histogram: Dict[int, int] = Field(default_factory=dict, description="Mapping of degree to number of nodes")
+    top: List[Dict[str, Any]] = Field(default_factory=list, description="Highest-degree nodes")
+
+
+class GraphComponentStats(BaseModel):
+    """Connected components of a knowledge graph."""
+    count: int = Field(0, ge=0, description="Number of connected components")
+    largest_size: int = Field(0, ge=0, description="Number of nodes in the largest component")
+    sizes: List[int] = Field(default_factory=list, description="Sizes of the largest components, descending")
+    isolated_nodes: int = Field(0, ge=0, description="Nodes without any edges")
+
+
+class GraphPageRankStats(BaseModel):
+    """PageRank centrality of a knowledge graph."""
+    damping: float = Field(0.85, description="Damping factor used")
+    iterations: int = Field(0, ge=0, description="Power iterations run")
+    converged: bool = Field(False, description="Whether the scores converged within tolerance")
+    top: List[Dict[str, Any]] = Field(default_factory=list, description="Highest-scoring nodes")
+
+
+class GraphStatsResponse(BaseModel):
+    """Response model for knowledge graph analytics."""
+    node_count: int = Field(0, ge=0, description="Number of nodes analysed")
+    edge_count: int = Field(0, ge=0, description="Number of edges analysed")
+    is_truncated: bool = Field(False, description="Whether the analysed graph was truncated upstream")
+    degree: Optional[GraphDegreeStats] = Field(None, description="Degree distribution")
+    components: Optional[GraphComponentStats] = Field(None, description="Connected components")
+    pagerank: Optional[GraphPageRankStats] = Field(None, description="PageRank centrality")
+    backend: str = Field("python", description="Computation backend: numpy or python")
+    elapsed_seconds: float = Field(0.0, ge=0, description="Time spent computing the metrics")
+    budget_exhausted: bool = Field(False, description="Whether the time budget cut PageRank short")
+
+
 class EntityExistsResponse(BaseModel):
     """Response model for entity existence check."""
     exists: bool = Field(..., description="Whether entity exists")
@@ -322,6 +496,13 @@ class EntityExistsResponse(BaseModel):
     entity_id: Optional[str] = None
 
 
+class EntitiesExistResponse(BaseModel):
+    """Response model for a batched entity existence check."""
+    results: Dict[str, bool] = Field(default_factory=dict, description="Mapping of entity name to existence")
+    cache_hits: int = Field(0, ge=0, description="Names answered from the local cache")
+    requests_made: int = Field(0, ge=0, description="Existence checks sent to LightRAG")
+
+
 class EntityUpdateResponse(BaseModel):
     """Response model for entity update."""
     status: str = Field(..., description="Update status")
@@ -336,6 +517,58 @@ class RelationUpdateResponse(BaseModel):
     data: Dict[str, Any] = Field(..., description="Updated relation data")
 
 
+class BulkUpdateItemResult(BaseModel):
+    """Outcome of a single edit within a bulk entity/relation update."""
+    index: int = Field(..., ge=0, description="Position of the edit in the request")
+    key: str = Field(..., description="Entity name or source/target pair the edit applies to")
+    success: bool = Field(..., description="Whether the edit was applied")
+    status: str = Field(..., description="Upstream status, 'error' or 'skipped'")
+    message: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+
+
+class BulkUpdateResponse(BaseModel):
+    """Response model for bulk entity/relation updates."""
+    total: int = Field(0, ge=0, description="Number of edits requested")
+    succeeded: int = Field(0, ge=0, description="Number of edits applied")
+    failed: int = Field(0, ge=0, description="Number of edits that failed or were skipped")
+    unchanged: int = Field(0, ge=0, description="Number of edits not sent because nothing would change")
+    results: List[BulkUpdateItemResult] = Field(default_factory=list, description="Per-edit results in request order")
+
+
+class EntityFlushResponse(BaseModel):
+    """Response model for flushing write-combined entity edits."""
+    flushed: int = Field(0, ge=0, description="Number of combined edits sent upstream")
+    responses: List[EntityUpdateResponse] = Field(default_factory=list, description="Upstream edit responses")
+    errors: List[str] = Field(default_factory=list, description="Errors from this and earlier background flushes")
+
+
+class PagedResultResponse(BaseModel):
+    """Response model for one page of a large, server-cached tool result."""
+    tool: str = Field(..., description="Tool that produced the result")
+    items: Dict[str, List[Any]] = Field(default_factory=dict, description="Items on this page, by result section")
+    offset: int = Field(0, ge=0, description="Position of the first item on this page")
+    returned: int = Field(0, ge=0, description="Number of items on this page")
+    total_items: int = Field(0, ge=0, description="Number of items across all pages")
+    section_totals: Dict[str, int] = Field(default_factory=dict, description="Number of items in each section")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Non-list fields of the result")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, absent on the last page")
+    cursor_expires_in: Optional[float] = Field(None, description="Seconds until the cursor expires")
+
+
+class SpilledResultResponse(BaseModel):
+    """Response model for a tool result written to disk because it was too large to return inline."""
+    tool: str = Field(..., description="Tool that produced the result")
+    uri: str = Field(..., description="MCP resource URI serving the full JSON result")
+    path: str = Field(..., description="Local file holding the full JSON result")
+    compressed: bool = Field(False, description="Whether the file is gzip-compressed")
+    output_chars: int = Field(0, ge=0, description="Length of the full JSON result in characters")
+    file_bytes: int = Field(0, ge=0, description="Size of the file on disk")
+    section_totals: Dict[str, int] = Field(default_factory=dict, description="Number of items in each list or mapping field")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Other fields of the result, long strings shortened")
+    expires_in: float = Field(0.0, ge=0, description="Seconds until the file may be evicted")
+
+
 # System Management Response Models
 class HealthResponse(BaseModel):
     """Response model for health check."""
@@ -0,0 +1,110 @@
+"""
+Streamed multipart uploads of files on disk.
+
+httpx builds a ``files=`` body by reading the open file synchronously on the
+event loop, and checking the file beforehand (exists, readable, size) is
+blocking too. On a network filesystem either can stall every other tool call.
+Here the checks and each chunk read run in the default executor, and the
+``multipart/form-data`` body is yielded chunk by chunk, so only one chunk of
+the file is in memory at a time.
+"""
+
+import asyncio
+import os
+import secrets
+from typing import AsyncIterator, Dict, NamedTuple, Optional
+
+
+# Bytes read from the file per executor call
+UPLOAD_CHUNK_BYTES = 1 << 18
+
+# Escapes for quoted header parameters, as browsers (and httpx) do for form data
+_QUOTED_ESCAPES = {'"': "%22", "\\": "\\\\", "\r": "%0D", "\n": "%0A"}
+
+
+class FileInfo(NamedTuple):
+    """Result of checking a file before upload."""
+    exists: bool
+    readable: bool
+    size: int
+
+
+def file_info(path: str) -> FileInfo:
+    """Check ``path`` for upload. Blocking; call it from a worker thread."""
+    if not os.path.exists(path):
+        return FileInfo(False, False, 0)
+    return FileInfo(True, os.access(path, os.R_OK), os.path.getsize(path))
+
+
+async def file_info_async(path: str) -> FileInfo:
+    """Check ``path`` for upload without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, file_info, path)
+
+
+def _quote(value: str) -> str:
+    return "".join(_QUOTED_ESCAPES.get(char, char) for char in value)
+
+
+class MultipartFileBody:
+    """``multipart/form-data`` body holding one file, read from disk in chunks.
+
+    Iterate it with ``async for``; each iteration opens and reads the file
+    again, so the body can be sent more than once. ``size`` is the file size
+    the body was built for, and the upload fails if the file changes size
+    while it is being sent.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        field: str = "file",
+        filename: Optional[str] = None,
+        content_type: str = "application/octet-stream",
+        chunk_size: int = UPLOAD_CHUNK_BYTES,
+    ):
+        self.path = path
+        self.size = size
+        self.chunk_size = chunk_size
+        self.boundary = secrets.token_hex(16)
+        filename = os.path.basename(path) if filename is None else filename
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(field)}"; filename="{_quote(filename)}"\r\n'
+            f"Content-Type: {content_type}\r\n"
+            "\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+
+    @property
+    def content_length(self) -> int:
+        return len(self._head) + self.size + len(self._tail)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {
+            "Content-Type": f"multipart/form-data; boundary={self.boundary}",
+            "Content-Length": str(self.content_length),
+        }
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        yield self._head
+        handle = await loop.run_in_executor(None, open, self.path, "rb")
+        sent = 0
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, handle.read, self.chunk_size)
+                if not chunk:
+                    break
+                sent += len(chunk)
+                if sent > self.size:
+                    break
+                yield chunk
+        finally:
+            await loop.run_in_executor(None, handle.close)
+        if sent != self.size:
+            # Content-Length was sent up front, so a changed file cannot be sent correctly
+            raise OSError(f"File changed size during upload: {self.path} (expected {self.size} bytes)")
+        yield self._tail
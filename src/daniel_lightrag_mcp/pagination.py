@@ -0,0 +1,166 @@
+"""
+Cursor-based pagination of large tool results.
+
+Tools such as ``get_knowledge_graph`` can return megabytes in a single MCP
+message. Instead, the server keeps the fetched result in a short-lived cache
+and returns it a page at a time. Each page carries an opaque cursor for the next
+one, so the upstream fetch only happens once.
+"""
+
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .client import LightRAGValidationError
+from .models import PagedResultResponse
+
+
+def _documents_sections(data: Dict[str, Any]) -> Tuple[Dict[str, List[Any]], Dict[str, Any]]:
+    # /documents groups documents by status; page over one flat list instead
+    documents = []
+    for status, status_documents in (data.get("statuses") or {}).items():
+        for document in status_documents or []:
+            if isinstance(document, dict):
+                document = {"status": status, **document}
+            documents.append(document)
+    return {"documents": documents}, {}
+
+
+def _list_sections(*names: str):
+    def extract(data: Dict[str, Any]) -> Tuple[Dict[str, List[Any]], Dict[str, Any]]:
+        sections = {name: list(data.get(name) or []) for name in names}
+        metadata = {key: value for key, value in data.items() if key not in names}
+        return sections, metadata
+    return extract
+
+
+# Tool name -> function splitting a dumped result into pageable lists and scalar metadata
+PAGINATED_TOOLS = {
+    "get_knowledge_graph": _list_sections("nodes", "edges"),
+    "get_documents": _documents_sections,
+    "get_graph_labels": _list_sections("entity_labels", "relation_labels"),
+}
+
+
+# Aim this far below an output budget when shrinking a page, since item sizes vary
+_SHRINK_MARGIN = 0.9
+
+
+class ResultPageCache:
+    """Short-lived store of tool results served page by page through cursors."""
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 32):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # token -> (tool name, sections, metadata, monotonic expiry)
+        self._entries: "OrderedDict[str, Tuple[str, Dict[str, List[Any]], Dict[str, Any], float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        self._evict_expired()
+        return len(self._entries)
+
+    @staticmethod
+    def total_items(tool_name: str, data: Dict[str, Any]) -> int:
+        """Return how many pageable items a dumped result holds."""
+        sections, _ = PAGINATED_TOOLS[tool_name](data)
+        return sum(len(items) for items in sections.values())
+
+    def first_page(
+        self,
+        tool_name: str,
+        data: Dict[str, Any],
+        page_size: int,
+        max_output_bytes: Optional[int] = None,
+        measure: Optional[Callable[[PagedResultResponse], int]] = None,
+    ) -> PagedResultResponse:
+        """Cache a freshly fetched result and return its first page.
+
+        With ``max_output_bytes``, the page is cut to fewer items until
+        ``measure(page)`` fits; the cursor then resumes right after the last
+        item returned, so no item is skipped.
+        """
+        sections, metadata = PAGINATED_TOOLS[tool_name](data)
+        self._evict_expired()
+        while len(self._entries) >= self.max_entries:
+            self._entries.popitem(last=False)
+        token = secrets.token_urlsafe(12)
+        self._entries[token] = (tool_name, sections, metadata, time.monotonic() + self.ttl)
+        return self._page(token, 0, page_size, max_output_bytes, measure)
+
+    def next_page(
+        self,
+        tool_name: str,
+        cursor: str,
+        page_size: int,
+        max_output_bytes: Optional[int] = None,
+        measure: Optional[Callable[[PagedResultResponse], int]] = None,
+    ) -> PagedResultResponse:
+        """Return the page a cursor points at, cut to ``max_output_bytes`` as in ``first_page``."""
+        token, _, offset_text = cursor.rpartition(".")
+        if not token or not offset_text.isdigit():
+            raise LightRAGValidationError("Invalid cursor")
+        self._evict_expired()
+        entry = self._entries.get(token)
+        if entry is None:
+            raise LightRAGValidationError("Cursor has expired or is unknown; call the tool again without a cursor")
+        if entry[0] != tool_name:
+            raise LightRAGValidationError(f"Cursor belongs to '{entry[0]}', not '{tool_name}'")
+        return self._page(token, int(offset_text), page_size, max_output_bytes, measure)
+
+    def _page(
+        self,
+        token: str,
+        offset: int,
+        page_size: int,
+        max_output_bytes: Optional[int] = None,
+        measure: Optional[Callable[[PagedResultResponse], int]] = None,
+    ) -> PagedResultResponse:
+        page = self._slice(token, offset, page_size)
+        while max_output_bytes and measure is not None and page.returned > 1:
+            size = measure(page)
+            if size <= max_output_bytes:
+                break
+            page_size = max(1, min(page.returned - 1, int(page.returned * max_output_bytes / size * _SHRINK_MARGIN)))
+            page = self._slice(token, offset, page_size)
+        if page.next_cursor is None:
+            # The last page has been served; release the cached result
+            self._entries.pop(token, None)
+        return page
+
+    def _slice(self, token: str, offset: int, page_size: int) -> PagedResultResponse:
+        tool_name, sections, metadata, expires_at = self._entries[token]
+        total = sum(len(items) for items in sections.values())
+
+        # Slice the sections as one concatenated sequence
+        items: Dict[str, List[Any]] = {}
+        start, remaining = offset, page_size
+        for name, section in sections.items():
+            if remaining <= 0:
+                break
+            if start >= len(section):
+                start -= len(section)
+                continue
+            chunk = section[start:start + remaining]
+            items[name] = chunk
+            remaining -= len(chunk)
+            start = 0
+
+        end = min(offset + page_size, total)
+        has_more = end < total
+        return PagedResultResponse(
+            tool=tool_name,
+            items=items,
+            offset=offset,
+            returned=max(end - offset, 0),
+            total_items=total,
+            section_totals={name: len(section) for name, section in sections.items()},
+            metadata=metadata,
+            next_cursor=f"{token}.{end}" if has_more else None,
+            cursor_expires_in=max(expires_at - time.monotonic(), 0.0) if has_more else None,
+        )
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for token in [token for token, entry in self._entries.items() if entry[3] <= now]:
+            del self._entries[token]
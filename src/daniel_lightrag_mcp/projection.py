@@ -0,0 +1,171 @@
+"""
+Field projection and output budgets for read tools.
+
+``fields`` keeps only the listed keys of each record a tool returns: graph nodes
+and edges, documents, or the whole response for ``query_text``. Paths are
+dotted (``properties.entity_type``), and lists along a path are traversed. The
+envelope around the records is always kept, e.g. ``is_truncated``, pagination
+info and page cursors.
+
+``max_output_bytes`` caps the size of the encoded output. Records are dropped
+from the end of each list until it fits, or, for ``query_text``, long strings
+are shortened. A trimmed result carries ``output_truncated`` and
+``omitted_items``. Cursor pages are instead cut to fewer items before they are
+shaped (see ``ResultPageCache``), so their records are never dropped here; only
+strings of a page that is still too large are shortened.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Tool name -> fields of its result holding lists of records; query_text's whole response is one record
+PROJECTED_TOOLS = {
+    "get_knowledge_graph": ("nodes", "edges"),
+    "get_documents": ("documents",),
+    "get_documents_paginated": ("documents",),
+    "query_text": (),
+}
+
+# Re-encoding rounds before giving up on fitting a budget
+_MAX_FIT_ROUNDS = 8
+
+# Aim this far below the budget, since trimmed sizes are estimated from the average item size
+_FIT_MARGIN = 0.9
+
+_ELLIPSIS = "..."
+
+# Path tree: key -> subtree, or None to keep the whole value
+_FieldTree = Dict[str, Optional[dict]]
+
+
+def _field_tree(fields: Sequence[str]) -> _FieldTree:
+    tree: _FieldTree = {}
+    for field in fields:
+        node = tree
+        parts = field.split(".")
+        for position, part in enumerate(parts):
+            if position == len(parts) - 1:
+                node[part] = None
+            elif part not in node:
+                node[part] = {}
+            elif node[part] is None:
+                # The whole value is already selected
+                break
+            node = node[part]
+    return tree
+
+
+def _project(value: Any, tree: _FieldTree) -> Any:
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected = {}
+    for key, subtree in tree.items():
+        if key not in value:
+            continue
+        if subtree is None:
+            projected[key] = value[key]
+            continue
+        nested = _project(value[key], subtree)
+        # Leave out objects none of whose selected keys are present
+        if nested != {}:
+            projected[key] = nested
+    return projected
+
+
+def _is_page(data: Dict[str, Any]) -> bool:
+    return isinstance(data.get("items"), dict) and "next_cursor" in data
+
+
+def _record_lists(tool_name: str, data: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Return the record lists of a dumped result by name."""
+    if _is_page(data):
+        return {name: items for name, items in data["items"].items() if isinstance(items, list)}
+    if tool_name == "get_documents" and isinstance(data.get("statuses"), dict):
+        # /documents groups documents by status
+        return {status: documents for status, documents in data["statuses"].items() if isinstance(documents, list)}
+    return {name: data[name] for name in PROJECTED_TOOLS.get(tool_name, ()) if isinstance(data.get(name), list)}
+
+
+def _with_records(tool_name: str, data: Dict[str, Any], records: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """Return a copy of ``data`` with its record lists replaced, leaving ``data`` itself untouched."""
+    data = dict(data)
+    if _is_page(data):
+        data["items"] = {**data["items"], **records}
+    elif tool_name == "get_documents" and isinstance(data.get("statuses"), dict):
+        data["statuses"] = {**data["statuses"], **records}
+    else:
+        data.update(records)
+    return data
+
+
+def project(tool_name: str, data: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """Keep only ``fields`` of each record in a dumped ``tool_name`` result."""
+    tree = _field_tree(fields)
+    if not PROJECTED_TOOLS.get(tool_name):
+        return _project(data, tree)
+    records = _record_lists(tool_name, data)
+    return _with_records(tool_name, data, {name: _project(items, tree) for name, items in records.items()})
+
+
+def _shorten_strings(value: Any, limit: int) -> Any:
+    if isinstance(value, str):
+        return value if len(value) <= limit else value[:limit] + _ELLIPSIS
+    if isinstance(value, list):
+        return [_shorten_strings(item, limit) for item in value]
+    if isinstance(value, dict):
+        return {key: _shorten_strings(item, limit) for key, item in value.items()}
+    return value
+
+
+def _longest_string(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, list):
+        return max((_longest_string(item) for item in value), default=0)
+    if isinstance(value, dict):
+        return max((_longest_string(item) for item in value.values()), default=0)
+    return 0
+
+
+def fit_to_budget(
+    tool_name: str,
+    data: Dict[str, Any],
+    max_output_bytes: int,
+    encode: Callable[[Any], bytes],
+) -> Dict[str, Any]:
+    """Trim a dumped result until ``encode(result)`` is at most ``max_output_bytes`` long.
+
+    Best effort: if even the envelope alone is larger than the budget, the most
+    trimmed version is returned.
+    """
+    size = len(encode(data))
+    if size <= max_output_bytes:
+        return data
+
+    # Records dropped from a page could not be fetched through its cursor
+    records = {} if _is_page(data) else _record_lists(tool_name, data)
+    kept_ratio = 1.0
+    string_limit = _longest_string(data["items"] if _is_page(data) else data)
+    result = data
+    for _ in range(_MAX_FIT_ROUNDS):
+        shrink = max_output_bytes / size * _FIT_MARGIN
+        if any(records.values()) and kept_ratio > 0:
+            kept_ratio = kept_ratio * shrink if kept_ratio * shrink * max(map(len, records.values())) >= 1 else 0.0
+            kept = {name: items[:int(len(items) * kept_ratio)] for name, items in records.items()}
+            result = _with_records(tool_name, data, kept)
+            omitted = {name: len(items) - len(kept[name]) for name, items in records.items()}
+        else:
+            # No records left to drop; shorten the longest strings instead
+            string_limit = int(string_limit * shrink)
+            if _is_page(data):
+                # Leave the envelope, including the cursor, intact
+                result = {**result, "items": _shorten_strings(result["items"], string_limit)}
+            else:
+                result = _shorten_strings(result, string_limit)
+            omitted = {name: len(items) for name, items in records.items()} if records else {}
+        result = {**result, "output_truncated": True, "omitted_items": omitted}
+        size = len(encode(result))
+        if size <= max_output_bytes:
+            break
+    return result
@@ -3,11 +3,15 @@ MCP server for LightRAG integration.
 """
 
 import asyncio
+import functools
+import itertools
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Sequence
+import signal
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 from mcp.server import Server, NotificationOptions
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -15,12 +19,13 @@ from mcp.types import (
     CallToolResult,
     ListToolsRequest,
     ListToolsResult,
+    Resource,
     Tool,
     TextContent,
     ImageContent,
     EmbeddedResource,
 )
-from pydantic import AnyUrl
+from pydantic import AnyUrl, BaseModel
 
 from .client import (
     LightRAGClient, 
@@ -32,6 +37,17 @@ from .client import (
     LightRAGTimeoutError,
     LightRAGServerError
 )
+from .mirror import DocumentStatusMirror
+from .graph_index import DIRECTIONS, GraphIndexCache
+from .pagination import PAGINATED_TOOLS, ResultPageCache
+from .projection import PROJECTED_TOOLS, fit_to_budget, project
+from .graph_stats import GRAPH_METRICS, compute_graph_stats
+from .label_index import SEARCH_MODES, LabelIndexCache
+from .entity_dedup import find_duplicates
+from .codec import dump_plain, get_codec
+from .multipart import file_info_async
+from .models import SpilledResultResponse
+from .spill import SPILL_URI_PREFIX, SpillStore, summarize
 
 # Configure logging with structured format
 logging.basicConfig(
@@ -53,6 +69,249 @@ server = Server("daniel-lightrag-mcp")
 # Global client instance
 lightrag_client: Optional[LightRAGClient] = None
 
+# Local document status mirror, created on first use
+document_mirror: Optional[DocumentStatusMirror] = None
+
+# Local knowledge graph index, created on first use
+graph_index: Optional[GraphIndexCache] = None
+
+# Local label search index, created on first use
+label_index: Optional[LabelIndexCache] = None
+
+# Large results served page by page, created on first use
+result_pages: Optional[ResultPageCache] = None
+
+# Directory of results too large to return inline, created on first use
+spill_store: Optional[SpillStore] = None
+
+
+def _get_document_mirror() -> DocumentStatusMirror:
+    """Return the shared document status mirror, creating it on first use."""
+    global document_mirror
+    if document_mirror is None or document_mirror.client is not lightrag_client:
+        sqlite_path = os.getenv("LIGHTRAG_DOC_MIRROR_DB") or None
+        refresh_interval = float(os.getenv("LIGHTRAG_DOC_MIRROR_REFRESH_INTERVAL", "5.0"))
+        logger.info(f"Creating document status mirror (sqlite: {sqlite_path}, refresh interval: {refresh_interval}s)")
+        document_mirror = DocumentStatusMirror(
+            lightrag_client, sqlite_path=sqlite_path, refresh_interval=refresh_interval
+        )
+    return document_mirror
+
+
+def _get_graph_index() -> GraphIndexCache:
+    """Return the shared local graph index, creating it on first use."""
+    global graph_index
+    if graph_index is None or graph_index.client is not lightrag_client:
+        refresh_interval = float(os.getenv("LIGHTRAG_GRAPH_INDEX_REFRESH_INTERVAL", "30.0"))
+        logger.info(f"Creating local graph index (refresh interval: {refresh_interval}s)")
+        graph_index = GraphIndexCache(lightrag_client, refresh_interval=refresh_interval)
+    return graph_index
+
+
+def _get_label_index() -> LabelIndexCache:
+    """Return the shared label search index, creating it on first use."""
+    global label_index
+    if label_index is None or label_index.client is not lightrag_client:
+        refresh_interval = float(os.getenv("LIGHTRAG_LABEL_INDEX_REFRESH_INTERVAL", "60.0"))
+        logger.info(f"Creating label index (refresh interval: {refresh_interval}s)")
+        label_index = LabelIndexCache(lightrag_client, refresh_interval=refresh_interval)
+    return label_index
+
+
+def _get_result_pages() -> ResultPageCache:
+    """Return the shared cache of paginated results, creating it on first use."""
+    global result_pages
+    if result_pages is None:
+        ttl = float(os.getenv("LIGHTRAG_RESULT_CURSOR_TTL", "300.0"))
+        result_pages = ResultPageCache(ttl=ttl)
+    return result_pages
+
+
+def _get_spill_store() -> SpillStore:
+    """Return the shared spill directory for oversized results, creating it on first use."""
+    global spill_store
+    if spill_store is None:
+        directory = os.getenv("LIGHTRAG_SPILL_DIR") or None
+        compress = os.getenv("LIGHTRAG_SPILL_COMPRESS", "false").lower() in ("1", "true", "yes")
+        ttl = float(os.getenv("LIGHTRAG_SPILL_TTL", "3600.0"))
+        max_files = int(os.getenv("LIGHTRAG_SPILL_MAX_FILES", "32"))
+        spill_store = SpillStore(directory, compress=compress, ttl=ttl, max_files=max_files)
+        logger.info(f"Created spill directory {spill_store.directory} (compress: {compress}, ttl: {ttl}s, max files: {max_files})")
+    return spill_store
+
+
+def _spill_threshold() -> int:
+    """Tool output longer than this many characters is written to disk; 0 disables spilling."""
+    return int(os.getenv("LIGHTRAG_SPILL_THRESHOLD", "0"))
+
+
+def _default_page_size() -> int:
+    return int(os.getenv("LIGHTRAG_RESULT_PAGE_SIZE", "200"))
+
+
+def _pretty_json() -> bool:
+    """Whether tool output is indented; compact by default to keep responses small."""
+    return os.getenv("LIGHTRAG_JSON_PRETTY", "false").lower() in ("1", "true", "yes")
+
+
+def _serialize_offload_items() -> int:
+    """Results with at least this many list/dict elements are serialized off the event loop."""
+    return int(os.getenv("LIGHTRAG_SERIALIZE_OFFLOAD_ITEMS", "1000"))
+
+
+def _result_size(result: Any) -> int:
+    """Cheaply estimate how large ``result`` is from the lengths of its list and dict fields."""
+    if isinstance(result, BaseModel):
+        values = [getattr(result, name) for name in type(result).model_fields]
+    elif isinstance(result, dict):
+        values = list(result.values())
+    elif isinstance(result, (list, tuple)):
+        return len(result)
+    else:
+        return 0
+    size = 0
+    for value in values:
+        if isinstance(value, (list, tuple)):
+            size += len(value)
+        elif isinstance(value, str):
+            # Long answers count one item per kilobyte
+            size += len(value) // 1024
+        elif isinstance(value, dict):
+            size += len(value) + sum(len(item) for item in value.values() if isinstance(item, (list, tuple, dict)))
+    return size
+
+
+def _describe_result(result: Any) -> str:
+    """Return ``repr(result)`` for logging, or just its size when the result is large."""
+    size = _result_size(result)
+    if size >= _serialize_offload_items():
+        return f"not logged ({size} items)"
+    return repr(result)
+
+
+def _encode_or_spill(pieces: Iterable[str], result: Any, tool_name: str) -> str:
+    """Join the encoded ``pieces`` of a result, or spill them to disk and return a summary if too long."""
+    threshold = _spill_threshold()
+    if threshold <= 0:
+        return "".join(pieces)
+    pieces = iter(pieces)
+    head: List[str] = []
+    length = 0
+    for piece in pieces:
+        head.append(piece)
+        length += len(piece)
+        if length > threshold:
+            break
+    else:
+        return "".join(head)
+
+    def counted(chunks):
+        nonlocal length
+        for chunk in chunks:
+            length += len(chunk)
+            yield chunk
+
+    store = _get_spill_store()
+    spilled = store.spill(tool_name, itertools.chain(head, counted(pieces)))
+    logger.info(f"Spilled {tool_name} result to {spilled.path} ({length} characters, {spilled.file_bytes} bytes on disk)")
+    section_totals, metadata = summarize(result)
+    summary = SpilledResultResponse(
+        tool=tool_name,
+        uri=spilled.uri,
+        path=spilled.path,
+        compressed=spilled.compressed,
+        output_chars=length,
+        file_bytes=spilled.file_bytes,
+        section_totals=section_totals,
+        metadata=metadata,
+        expires_in=store.expires_in(spilled),
+    )
+    return get_codec().dumps(summary.model_dump(), indent=_pretty_json())
+
+
+async def _run_off_loop(size: int, func, *args, **kwargs) -> Any:
+    """Call ``func`` inline for small results, or in the default executor for large ones."""
+    if size < _serialize_offload_items():
+        return func(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+async def _create_success_response_async(
+    result: Any,
+    tool_name: str,
+    compact: Optional[bool] = None,
+    fields: Optional[Sequence[str]] = None,
+    max_output_bytes: Optional[int] = None,
+) -> dict:
+    """Create a success response, serializing large results in a worker thread."""
+    return await _run_off_loop(
+        _result_size(result), _create_success_response, result, tool_name, compact, fields, max_output_bytes
+    )
+
+
+async def _create_paginated_response(result: Any, tool_name: str, arguments: Dict[str, Any]) -> dict:
+    """Return the first page of a large result, or the whole result if it fits in one page."""
+    page_size = arguments.get("page_size")
+    shaping = {"fields": arguments.get("fields"), "max_output_bytes": arguments.get("max_output_bytes")}
+    data = await _run_off_loop(_result_size(result), dump_plain, result)
+    if not isinstance(data, dict):
+        return await _create_success_response_async(result, tool_name, **shaping)
+    total = ResultPageCache.total_items(tool_name, data)
+    budget = _page_budget(tool_name, arguments)
+    if page_size is None:
+        page_size = _default_page_size()
+        # A result over its output budget is paged too, so records that do not fit stay reachable by cursor
+        if total <= page_size and not (budget and await _run_off_loop(
+            _result_size(result), _exceeds_budget, tool_name, data, arguments
+        )):
+            return await _create_success_response_async(result, tool_name, **shaping)
+    logger.info(f"Paginating {tool_name} result: {total} items, page size {page_size}")
+    page = _get_result_pages().first_page(tool_name, data, page_size, **budget)
+    return await _create_success_response_async(page, tool_name, **shaping)
+
+
+def _measure_shaped(tool_name: str, fields: Optional[Sequence[str]], result: Any) -> int:
+    """Return the encoded size of a result after ``fields`` projection."""
+    data = dump_plain(result)
+    if fields and isinstance(data, dict):
+        data = project(tool_name, data, fields)
+    return len(get_codec().dumps_bytes(data, indent=_pretty_json()))
+
+
+def _exceeds_budget(tool_name: str, data: Dict[str, Any], arguments: Dict[str, Any]) -> bool:
+    return _measure_shaped(tool_name, arguments.get("fields"), data) > arguments["max_output_bytes"]
+
+
+def _page_budget(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments that make ``ResultPageCache`` cut pages to the ``max_output_bytes`` budget."""
+    max_output_bytes = arguments.get("max_output_bytes")
+    if not max_output_bytes:
+        return {}
+    return {
+        "max_output_bytes": max_output_bytes,
+        "measure": functools.partial(_measure_shaped, tool_name, arguments.get("fields")),
+    }
+
+
+def _shape_output(
+    result: Any,
+    tool_name: str,
+    fields: Optional[Sequence[str]],
+    max_output_bytes: Optional[int],
+    indent: bool,
+) -> Any:
+    """Apply ``fields`` projection and the ``max_output_bytes`` budget to a result before it is encoded."""
+    data = dump_plain(result)
+    if not isinstance(data, dict):
+        return result
+    if fields:
+        data = project(tool_name, data, fields)
+    if max_output_bytes:
+        codec = get_codec()
+        data = fit_to_budget(tool_name, data, max_output_bytes, lambda value: codec.dumps_bytes(value, indent=indent))
+    return data
+
 
 def _validate_tool_arguments(tool_name: str, arguments: Dict[str, Any]) -> None:
     """Validate tool arguments against expected schemas."""
@@ -61,13 +320,22 @@ def _validate_tool_arguments(tool_name: str, arguments: Dict[str, Any]) -> None:
         "insert_text": ["text"],
         "insert_texts": ["texts"],
         "upload_document": ["file_path"],
+        "insert_text_and_wait": ["text"],
+        "upload_document_and_wait": ["file_path"],
         "get_documents_paginated": ["page", "page_size"],
         "delete_document": ["document_id"],
         "query_text": ["query"],
         "query_text_stream": ["query"],
         "check_entity_exists": ["entity_name"],
+        "check_entities_exist": ["entity_names"],
+        "search_graph_labels": ["query"],
+        "graph_neighbors": ["entity_name"],
+        "graph_degree": ["entity_names"],
+        "graph_edge": ["source_id", "target_id"],
         "update_entity": ["entity_id", "properties"],
         "update_relation": ["source_id", "target_id", "updated_data"],
+        "update_entities": ["updates"],
+        "update_relations": ["updates"],
         "delete_entity": ["entity_id"],
         "delete_relation": ["relation_id"],
         "get_track_status": ["track_id"],
@@ -85,6 +353,37 @@ def _validate_tool_arguments(tool_name: str, arguments: Dict[str, Any]) -> None:
             logger.warning(f"Validation error: {error_msg}")
             raise LightRAGValidationError(error_msg)
     
+    # Paginated result tools share page_size/cursor arguments
+    if tool_name in PAGINATED_TOOLS:
+        page_size = arguments.get("page_size")
+        cursor = arguments.get("cursor")
+        if page_size is not None and (isinstance(page_size, bool) or not isinstance(page_size, int) or not 1 <= page_size <= 10000):
+            raise LightRAGValidationError("page_size must be an integer between 1 and 10000")
+        if cursor is not None and (not isinstance(cursor, str) or not cursor):
+            raise LightRAGValidationError("cursor must be a non-empty string")
+    
+    # Read tools share fields/max_output_bytes arguments
+    if tool_name in PROJECTED_TOOLS:
+        fields = arguments.get("fields")
+        max_output_bytes = arguments.get("max_output_bytes")
+        if fields is not None and (
+            not isinstance(fields, list) or not fields
+            or not all(isinstance(field, str) and all(field.split(".")) for field in fields)
+        ):
+            raise LightRAGValidationError("fields must be a non-empty list of dotted field paths")
+        if max_output_bytes is not None and (
+            isinstance(max_output_bytes, bool) or not isinstance(max_output_bytes, int)
+            or not 256 <= max_output_bytes <= 100_000_000
+        ):
+            raise LightRAGValidationError("max_output_bytes must be an integer between 256 and 100000000")
+        # Compact output is built in one piece and neither shaped nor paginated
+        if arguments.get("format", "full") == "compact" and any(
+            arguments.get(name) is not None for name in ("fields", "max_output_bytes", "page_size", "cursor")
+        ):
+            raise LightRAGValidationError(
+                "fields, max_output_bytes, page_size and cursor cannot be combined with format 'compact'"
+            )
+    
     # Additional validation for specific tools
     if tool_name == "get_documents_paginated":
         page = arguments.get("page", 1)
@@ -101,40 +400,192 @@ def _validate_tool_arguments(tool_name: str, arguments: Dict[str, Any]) -> None:
         if mode not in valid_modes:
             raise LightRAGValidationError(f"Invalid query mode '{mode}'. Must be one of: {valid_modes}")
     
+    elif tool_name == "get_document_inventory":
+        page_size = arguments.get("page_size", 100)
+        concurrency = arguments.get("concurrency", 8)
+        
+        if not isinstance(page_size, int) or page_size < 1 or page_size > 100:
+            raise LightRAGValidationError("Page size must be an integer between 1 and 100")
+        if not isinstance(concurrency, int) or concurrency < 1 or concurrency > 32:
+            raise LightRAGValidationError("Concurrency must be an integer between 1 and 32")
+    
+    elif tool_name == "check_entities_exist":
+        entity_names = arguments.get("entity_names")
+        if not isinstance(entity_names, list) or not all(isinstance(name, str) for name in entity_names):
+            raise LightRAGValidationError("entity_names must be a list of strings")
+        if len(entity_names) > 5000:
+            raise LightRAGValidationError("entity_names cannot contain more than 5000 names")
+    
+    elif tool_name in ("get_knowledge_graph", "get_knowledge_graph_delta"):
+        label = arguments.get("label", "*")
+        if not isinstance(label, str) or not label.strip():
+            raise LightRAGValidationError("label must be a non-empty string")
+        for name in ("max_depth", "max_nodes"):
+            value = arguments.get(name)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                raise LightRAGValidationError(f"{name} must be a positive integer")
+        if arguments.get("format", "full") not in ("full", "compact"):
+            raise LightRAGValidationError("format must be 'full' or 'compact'")
+        since_version = arguments.get("since_version")
+        if since_version is not None and (isinstance(since_version, bool) or not isinstance(since_version, int) or since_version < 1):
+            raise LightRAGValidationError("since_version must be a positive integer")
+    
+    elif tool_name == "search_graph_labels":
+        query = arguments.get("query")
+        limit = arguments.get("limit", 10)
+        min_score = arguments.get("min_score", 0.3)
+        if not isinstance(query, str) or not query.strip():
+            raise LightRAGValidationError("query must be a non-empty string")
+        if arguments.get("mode", "auto") not in SEARCH_MODES:
+            raise LightRAGValidationError(f"mode must be one of: {list(SEARCH_MODES)}")
+        if isinstance(limit, bool) or not isinstance(limit, int) or not 1 <= limit <= 1000:
+            raise LightRAGValidationError("limit must be an integer between 1 and 1000")
+        if isinstance(min_score, bool) or not isinstance(min_score, (int, float)) or not 0 <= min_score <= 1:
+            raise LightRAGValidationError("min_score must be a number between 0 and 1")
+    
+    elif tool_name == "find_duplicate_entities":
+        threshold = arguments.get("threshold", 0.5)
+        num_perm = arguments.get("num_perm", 64)
+        limit = arguments.get("limit", 100)
+        if isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or not 0 < threshold <= 1:
+            raise LightRAGValidationError("threshold must be a number greater than 0 and at most 1")
+        if isinstance(num_perm, bool) or not isinstance(num_perm, int) or not 8 <= num_perm <= 512:
+            raise LightRAGValidationError("num_perm must be an integer between 8 and 512")
+        if isinstance(limit, bool) or not isinstance(limit, int) or not 1 <= limit <= 1000:
+            raise LightRAGValidationError("limit must be an integer between 1 and 1000")
+    
+    elif tool_name == "graph_stats":
+        metrics = arguments.get("metrics", list(GRAPH_METRICS))
+        top_k = arguments.get("top_k", 10)
+        time_budget = arguments.get("time_budget_seconds", 5.0)
+        if not isinstance(metrics, list) or not metrics or any(metric not in GRAPH_METRICS for metric in metrics):
+            raise LightRAGValidationError(f"metrics must be a non-empty list drawn from: {list(GRAPH_METRICS)}")
+        if isinstance(top_k, bool) or not isinstance(top_k, int) or not 1 <= top_k <= 1000:
+            raise LightRAGValidationError("top_k must be an integer between 1 and 1000")
+        if isinstance(time_budget, bool) or not isinstance(time_budget, (int, float)) or not 0 < time_budget <= 300:
+            raise LightRAGValidationError("time_budget_seconds must be a number between 0 and 300")
+        for name in ("max_depth", "max_nodes"):
+            value = arguments.get(name)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                raise LightRAGValidationError(f"{name} must be a positive integer")
+    
+    elif tool_name in ("graph_neighbors", "graph_degree"):
+        direction = arguments.get("direction", "both")
+        if direction not in DIRECTIONS:
+            raise LightRAGValidationError(f"direction must be one of: {list(DIRECTIONS)}")
+        if tool_name == "graph_neighbors":
+            limit = arguments.get("limit", 100)
+            if not isinstance(limit, int) or limit < 1:
+                raise LightRAGValidationError("limit must be a positive integer")
+        else:
+            entity_names = arguments.get("entity_names")
+            if not isinstance(entity_names, list) or not all(isinstance(name, str) for name in entity_names):
+                raise LightRAGValidationError("entity_names must be a list of strings")
+    
+    elif tool_name in ("update_entities", "update_relations"):
+        updates = arguments.get("updates")
+        concurrency = arguments.get("concurrency", 8)
+        
+        if not isinstance(updates, list) or not updates:
+            raise LightRAGValidationError("updates must be a non-empty list")
+        for index, update in enumerate(updates):
+            if not isinstance(update, dict) or not isinstance(update.get("updated_data"), dict):
+                raise LightRAGValidationError(f"Update {index} must be an object with an 'updated_data' object")
+        if not isinstance(concurrency, int) or concurrency < 1 or concurrency > 32:
+            raise LightRAGValidationError("concurrency must be an integer between 1 and 32")
+    
+    elif tool_name == "delete_documents":
+        document_ids = arguments.get("document_ids")
+        status_filter = arguments.get("status_filter")
+        chunk_size = arguments.get("chunk_size", 100)
+        concurrency = arguments.get("concurrency", 1)
+        
+        if (document_ids is None) == (status_filter is None):
+            raise LightRAGValidationError("Provide exactly one of document_ids or status_filter")
+        if document_ids is not None and (not isinstance(document_ids, list) or not document_ids):
+            raise LightRAGValidationError("document_ids must be a non-empty list of document IDs")
+        if not isinstance(chunk_size, int) or chunk_size < 1 or chunk_size > 1000:
+            raise LightRAGValidationError("chunk_size must be an integer between 1 and 1000")
+        if not isinstance(concurrency, int) or concurrency < 1 or concurrency > 8:
+            raise LightRAGValidationError("concurrency must be an integer between 1 and 8")
+    
+    elif tool_name == "list_documents_local":
+        offset = arguments.get("offset", 0)
+        limit = arguments.get("limit", 100)
+        document_ids = arguments.get("document_ids")
+        
+        if not isinstance(offset, int) or offset < 0:
+            raise LightRAGValidationError("offset must be a non-negative integer")
+        if not isinstance(limit, int) or limit < 0:
+            raise LightRAGValidationError("limit must be a non-negative integer")
+        if document_ids is not None and not isinstance(document_ids, list):
+            raise LightRAGValidationError("document_ids must be a list of document IDs")
+    
+    elif tool_name in ("insert_text_and_wait", "upload_document_and_wait"):
+        timeout_seconds = arguments.get("timeout_seconds", 120)
+        if isinstance(timeout_seconds, bool) or not isinstance(timeout_seconds, (int, float)) or timeout_seconds <= 0:
+            raise LightRAGValidationError("timeout_seconds must be a positive number")
+    
     logger.debug(f"Tool arguments validation passed for {tool_name}")
 
 
 def _serialize_result(result: Any) -> str:
     """Serialize result to JSON, handling Pydantic models."""
+    codec = get_codec()
     if hasattr(result, 'dict'):
         # Pydantic model
-        return json.dumps(result.model_dump(), indent=2)
+        return codec.dumps(result.model_dump(), indent=_pretty_json())
     elif hasattr(result, '__dict__'):
         # Regular object with __dict__
-        return json.dumps(result.__dict__, indent=2)
+        return codec.dumps(result.__dict__, indent=_pretty_json())
     else:
         # Fallback to direct serialization
-        return json.dumps(result, indent=2)
+        return codec.dumps(result, indent=_pretty_json())
 
 
-def _create_success_response(result: Any, tool_name: str) -> dict:
-    """Create standardized MCP success response."""
+def _create_success_response(
+    result: Any,
+    tool_name: str,
+    compact: Optional[bool] = None,
+    fields: Optional[Sequence[str]] = None,
+    max_output_bytes: Optional[int] = None,
+) -> dict:
+    """Create standardized MCP success response.
+    
+    ``compact`` forces minified (True) or indented (False) JSON; by default output
+    is minified unless ``LIGHTRAG_JSON_PRETTY`` is set. ``fields`` and
+    ``max_output_bytes`` trim the result before it is serialized (see ``projection``).
+    """
+    indent = _pretty_json() if compact is None else not compact
+    codec = get_codec()
+    if fields or max_output_bytes:
+        logger.info(f"  - Shaping output (fields: {fields}, max_output_bytes: {max_output_bytes})")
+        result = _shape_output(result, tool_name, fields, max_output_bytes, indent)
     logger.info("=" * 60)
     logger.info("CREATING SUCCESS RESPONSE")
     logger.info("=" * 60)
     logger.info(f"SUCCESS RESPONSE INPUT:")
     logger.info(f"  - tool_name: '{tool_name}'")
     logger.info(f"  - result type: {type(result)}")
-    logger.info(f"  - result content: {repr(result)}")
+    logger.info(f"  - result content: {_describe_result(result)}")
     
     # Handle Pydantic models properly
     logger.info("RESPONSE SERIALIZATION:")
-    if hasattr(result, 'model_dump'):
+    if _result_size(result) >= _serialize_offload_items():
+        # Encode straight from the model in pieces instead of holding a full dump alongside the output
+        logger.info("  - Using incremental JSON encoding")
+        try:
+            response_text = _encode_or_spill(codec.iterencode(result, indent=indent), result, tool_name)
+            logger.info(f"  - JSON serialization successful")
+        except Exception as e:
+            logger.error(f"  - Incremental JSON encoding failed: {e}")
+            response_text = str(result)
+    elif hasattr(result, 'model_dump'):
         logger.info("  - Using result.model_dump() (Pydantic v2)")
         try:
             serialized_data = result.model_dump()
             logger.info(f"  - model_dump() result: {serialized_data}")
-            response_text = json.dumps(serialized_data, indent=2)
+            response_text = _encode_or_spill([codec.dumps(serialized_data, indent=indent)], result, tool_name)
             logger.info(f"  - JSON serialization successful")
         except Exception as e:
             logger.error(f"  - model_dump() failed: {e}")
@@ -144,7 +595,7 @@ def _create_success_response(result: Any, tool_name: str) -> dict:
         try:
             serialized_data = result.dict()
             logger.info(f"  - dict() result: {serialized_data}")
-            response_text = json.dumps(serialized_data, indent=2)
+            response_text = _encode_or_spill([codec.dumps(serialized_data, indent=indent)], result, tool_name)
             logger.info(f"  - JSON serialization successful")
         except Exception as e:
             logger.error(f"  - dict() failed: {e}")
@@ -152,7 +603,7 @@ def _create_success_response(result: Any, tool_name: str) -> dict:
     elif result:
         logger.info("  - Direct JSON serialization")
         try:
-            response_text = json.dumps(result, indent=2)
+            response_text = _encode_or_spill([codec.dumps(result, indent=indent)], result, tool_name)
             logger.info(f"  - Direct JSON serialization successful")
         except Exception as e:
             logger.error(f"  - Direct JSON serialization failed: {e}")
@@ -268,7 +719,7 @@ def _create_error_response(error: Exception, tool_name: str) -> dict:
         "content": [
             {
                 "type": "text",
-                "text": json.dumps(error_details, indent=2)
+                "text": get_codec().dumps(error_details, indent=_pretty_json())
             }
         ],
         "isError": True
@@ -355,6 +806,44 @@ async def handle_list_tools() -> List[Tool]:#ListToolsResult:
                 "required": ["file_path"]
             }
         ),
+        Tool(
+            name="insert_text_and_wait",
+            description="Insert text content into LightRAG and wait until it has been processed and is queryable",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "text": {
+                        "type": "string",
+                        "description": "Text content to insert"
+                    },
+                    "timeout_seconds": {
+                        "type": "number",
+                        "description": "Maximum time to wait for processing before returning a timeout status",
+                        "default": 120
+                    }
+                },
+                "required": ["text"]
+            }
+        ),
+        Tool(
+            name="upload_document_and_wait",
+            description="Upload a document file to LightRAG and wait until it has been processed and is queryable",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Path to the file to upload"
+                    },
+                    "timeout_seconds": {
+                        "type": "number",
+                        "description": "Maximum time to wait for processing before returning a timeout status",
+                        "default": 120
+                    }
+                },
+                "required": ["file_path"]
+            }
+        ),
         Tool(
             name="scan_documents",
             description="Scan for new documents in LightRAG",
@@ -366,10 +855,32 @@ async def handle_list_tools() -> List[Tool]:#ListToolsResult:
         ),
         Tool(
             name="get_documents",
-            description="Retrieve all documents from LightRAG",
+            description="Retrieve all documents from LightRAG. Large results are returned in pages; pass next_cursor back as cursor for the next page.",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Return the result in pages of this many items. Large results are paginated automatically.",
+                        "minimum": 1,
+                        "maximum": 10000
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from a previous page; fetches the next page of that result"
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only return these fields of each document, e.g. [\"id\", \"status\"]; dotted paths select nested keys"
+                    },
+                    "max_output_bytes": {
+                        "type": "integer",
+                        "description": "Cap the encoded output at this many bytes by dropping records from the end; the result then has output_truncated and omitted_items",
+                        "minimum": 256,
+                        "maximum": 100000000
+                    }
+                },
                 "required": []
             }
         ),
@@ -389,11 +900,87 @@ async def handle_list_tools() -> List[Tool]:#ListToolsResult:
                         "description": "Number of documents per page",
                         "minimum": 1,
                         "maximum": 100
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only return these fields of each document, e.g. [\"id\", \"status\"]; dotted paths select nested keys"
+                    },
+                    "max_output_bytes": {
+                        "type": "integer",
+                        "description": "Cap the encoded output at this many bytes by dropping records from the end; the result then has output_truncated and omitted_items",
+                        "minimum": 256,
+                        "maximum": 100000000
                     }
                 },
                 "required": ["page", "page_size"]
             }
         ),
+        Tool(
+            name="get_document_inventory",
+            description="Retrieve the complete document list by fetching all pages concurrently. Faster than get_documents_paginated for full scans.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Number of documents per page request",
+                        "minimum": 1,
+                        "maximum": 100,
+                        "default": 100
+                    },
+                    "status_filter": {
+                        "type": "string",
+                        "description": "Only include documents with this status",
+                        "enum": ["pending", "processing", "processed", "failed"]
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Maximum number of page requests in flight",
+                        "minimum": 1,
+                        "maximum": 32,
+                        "default": 8
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="list_documents_local",
+            description="List, count and filter documents from a local mirror of document statuses. The mirror is refreshed incrementally (only when upstream status counts change), so repeated calls are answered locally.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "status_filter": {
+                        "type": "string",
+                        "description": "Only include documents with this status"
+                    },
+                    "document_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only include these document IDs"
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Number of matching documents to skip",
+                        "minimum": 0,
+                        "default": 0
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of documents to return (0 returns counts only)",
+                        "minimum": 0,
+                        "default": 100
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Re-fetch every status bucket from LightRAG before answering",
+                        "default": False
+                    }
+                },
+                "required": []
+            }
+        ),
         Tool(
             name="delete_document",
             description="Delete a specific document by ID",
@@ -408,6 +995,40 @@ async def handle_list_tools() -> List[Tool]:#ListToolsResult:
                 "required": ["document_id"]
             }
         ),
+        Tool(
+            name="delete_documents",
+            description="Delete many documents at once, by ID list or by status (e.g. all failed documents). IDs are sent in chunked multi-ID requests, one chunk at a time, waiting for LightRAG's deletion pipeline to go idle between chunks; per-ID outcomes are reported.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "document_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "IDs of the documents to delete"
+                    },
+                    "status_filter": {
+                        "type": "string",
+                        "description": "Delete every document with this status instead of an explicit ID list",
+                        "enum": ["pending", "processing", "processed", "failed"]
+                    },
+                    "chunk_size": {
+                        "type": "integer",
+                        "description": "Number of document IDs per delete request",
+                        "minimum": 1,
+                        "maximum": 1000,
+                        "default": 100
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Maximum number of delete requests in flight; LightRAG deletes in one pipeline, so more than 1 mostly waits on it",
+                        "minimum": 1,
+                        "maximum": 8,
+                        "default": 1
+                    }
+                },
+                "required": []
+            }
+        ),
         # Tool(
         #     name="clear_documents",
         #     description="Clear all documents from LightRAG",
@@ -441,6 +1062,17 @@ async def handle_list_tools() -> List[Tool]:#ListToolsResult:
                         "type": "boolean",
                         "description": "Whether to only return context without generation",
                         "default": False
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only return these fields of the response, e.g. [\"response\"]; dotted paths select nested keys"
+                    },
+                    "max_output_bytes": {
+                        "type": "integer",
+                        "description": "Cap the encoded output at this many bytes by shortening long strings; the result then has output_truncated",
+                        "minimum": 256,
+                        "maximum": 100000000
                     }
                 },
                 "required": ["query"]
@@ -452,59 +1084,366 @@ async def handle_list_tools() -> List[Tool]:#ListToolsResult:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "query": {
+                    "query": {
+                        "type": "string",
+                        "description": "Query text"
+                    },
+                    "mode": {
+                        "type": "string",
+                        "description": "Query mode",
+                        "enum": ["naive", "local", "global", "hybrid"],
+                        "default": "hybrid"
+                    },
+                    "only_need_context": {
+                        "type": "boolean",
+                        "description": "Whether to only return context without generation",
+                        "default": False
+                    }
+                },
+                "required": ["query"]
+            }
+        ),
+    ])
+    
+    # Knowledge Graph Tools (7 tools)
+    tools.extend([
+        Tool(
+            name="get_knowledge_graph",
+            description="Retrieve the knowledge graph from LightRAG, or only the subgraph around one entity when a label is given",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "label": {
+                        "type": "string",
+                        "description": "Entity to center the subgraph on, or '*' for the whole graph",
+                        "default": "*"
+                    },
+                    "max_depth": {
+                        "type": "integer",
+                        "description": "Maximum number of hops from the labeled entity (server default if omitted)",
+                        "minimum": 1
+                    },
+                    "max_nodes": {
+                        "type": "integer",
+                        "description": "Maximum number of nodes to return (server default if omitted)",
+                        "minimum": 1
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["full", "compact"],
+                        "description": "'compact' returns minified columnar JSON (node ID list, integer edge endpoints, interned types) instead of node and edge objects; it is not paginated",
+                        "default": "full"
+                    },
+                    "include_properties": {
+                        "type": "boolean",
+                        "description": "With format 'compact', include node and edge property columns",
+                        "default": True
+                    },
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Return the result in pages of this many items. Large results are paginated automatically.",
+                        "minimum": 1,
+                        "maximum": 10000
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from a previous page; fetches the next page of that result"
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only return these fields of each node and edge, e.g. [\"id\", \"properties.entity_type\", \"source\", \"target\"]; dotted paths select nested keys"
+                    },
+                    "max_output_bytes": {
+                        "type": "integer",
+                        "description": "Cap the encoded output at this many bytes by dropping records from the end; the result then has output_truncated and omitted_items",
+                        "minimum": 256,
+                        "maximum": 100000000
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="get_knowledge_graph_delta",
+            description="Return only the nodes and edges added, changed or removed since an earlier snapshot version of the knowledge graph. Call without since_version to get the full graph and its version, then pass that version on later calls.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "since_version": {
+                        "type": "integer",
+                        "description": "Snapshot version returned by a previous call",
+                        "minimum": 1
+                    },
+                    "label": {
+                        "type": "string",
+                        "description": "Entity to center the subgraph on, or '*' for the whole graph",
+                        "default": "*"
+                    },
+                    "max_depth": {
+                        "type": "integer",
+                        "description": "Maximum number of hops from the labeled entity (server default if omitted)",
+                        "minimum": 1
+                    },
+                    "max_nodes": {
+                        "type": "integer",
+                        "description": "Maximum number of nodes to return (server default if omitted)",
+                        "minimum": 1
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="get_graph_labels",
+            description="Get labels from the knowledge graph. Large results are returned in pages; pass next_cursor back as cursor for the next page.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Return the result in pages of this many items. Large results are paginated automatically.",
+                        "minimum": 1,
+                        "maximum": 10000
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from a previous page; fetches the next page of that result"
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="search_graph_labels",
+            description="Search graph labels by prefix and/or fuzzy (trigram) similarity using a local index, returning the best matches. Use this instead of get_graph_labels to find entity names.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Text to search for"
+                    },
+                    "mode": {
+                        "type": "string",
+                        "enum": list(SEARCH_MODES),
+                        "description": "'prefix', 'fuzzy', or 'auto' (prefix matches first, then fuzzy)",
+                        "default": "auto"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of matches",
+                        "minimum": 1,
+                        "maximum": 1000,
+                        "default": 10
+                    },
+                    "min_score": {
+                        "type": "number",
+                        "description": "Minimum fuzzy similarity (0-1)",
+                        "default": 0.3
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Rebuild the index from LightRAG before searching",
+                        "default": False
+                    }
+                },
+                "required": ["query"]
+            }
+        ),
+        Tool(
+            name="find_duplicate_entities",
+            description="Find entities whose labels look like duplicates (e.g. 'OpenAI', 'Open AI', 'OpenAI Inc.') using MinHash/LSH over character n-grams. Returns clusters of candidates with similarity scores to review before merging with update_entity/delete_entity.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "threshold": {
+                        "type": "number",
+                        "description": "Minimum n-gram Jaccard similarity (0-1] for two labels to count as duplicates",
+                        "default": 0.5
+                    },
+                    "num_perm": {
+                        "type": "integer",
+                        "description": "MinHash signature length; longer signatures miss fewer pairs but take longer",
+                        "minimum": 8,
+                        "maximum": 512,
+                        "default": 64
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of clusters to return",
+                        "minimum": 1,
+                        "maximum": 1000,
+                        "default": 100
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Reload labels from LightRAG instead of using the label index",
+                        "default": False
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="check_entity_exists",
+            description="Check if an entity exists in the knowledge graph",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "entity_name": {
+                        "type": "string",
+                        "description": "Name of the entity to check"
+                    }
+                },
+                "required": ["entity_name"]
+            }
+        ),
+        Tool(
+            name="check_entities_exist",
+            description="Check whether many entities exist in the knowledge graph in one call. Names are deduplicated and recently checked names are answered from a short-lived cache. Returns a name to exists map.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "entity_names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Names of the entities to check"
+                    },
+                    "use_cache": {
+                        "type": "boolean",
+                        "description": "Answer from cached results when fresh (set false to always ask LightRAG)",
+                        "default": True
+                    }
+                },
+                "required": ["entity_names"]
+            }
+        ),
+        Tool(
+            name="graph_neighbors",
+            description="List an entity's neighbors and connecting edges from a local index of the knowledge graph. The index is a snapshot of get_knowledge_graph that is rebuilt after edits made through this server or when it expires.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "entity_name": {
                         "type": "string",
-                        "description": "Query text"
+                        "description": "Entity whose neighbors to list"
                     },
-                    "mode": {
+                    "direction": {
                         "type": "string",
-                        "description": "Query mode",
-                        "enum": ["naive", "local", "global", "hybrid"],
-                        "default": "hybrid"
+                        "enum": list(DIRECTIONS),
+                        "description": "Follow outgoing edges, incoming edges or both",
+                        "default": "both"
                     },
-                    "only_need_context": {
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of edges to return",
+                        "minimum": 1,
+                        "default": 100
+                    },
+                    "force_refresh": {
                         "type": "boolean",
-                        "description": "Whether to only return context without generation",
+                        "description": "Rebuild the index from LightRAG before answering",
                         "default": False
                     }
                 },
-                "required": ["query"]
+                "required": ["entity_name"]
             }
         ),
-    ])
-    
-    # Knowledge Graph Tools (7 tools)
-    tools.extend([
         Tool(
-            name="get_knowledge_graph",
-            description="Retrieve the knowledge graph from LightRAG",
+            name="graph_stats",
+            description="Compute whole-graph analytics locally: degree distribution, connected components and PageRank, returning the top-k entities for each. PageRank stops early if the time budget runs out.",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "metrics": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": list(GRAPH_METRICS)},
+                        "description": "Metrics to compute (default: all)"
+                    },
+                    "top_k": {
+                        "type": "integer",
+                        "description": "Number of top entities to return per metric",
+                        "minimum": 1,
+                        "maximum": 1000,
+                        "default": 10
+                    },
+                    "time_budget_seconds": {
+                        "type": "number",
+                        "description": "Time allowed for computing the metrics",
+                        "default": 5
+                    },
+                    "label": {
+                        "type": "string",
+                        "description": "Entity to center the analysed subgraph on, or '*' for the whole graph",
+                        "default": "*"
+                    },
+                    "max_depth": {
+                        "type": "integer",
+                        "description": "Maximum number of hops from the labeled entity",
+                        "minimum": 1
+                    },
+                    "max_nodes": {
+                        "type": "integer",
+                        "description": "Maximum number of nodes to fetch",
+                        "minimum": 1
+                    }
+                },
                 "required": []
             }
         ),
         Tool(
-            name="get_graph_labels",
-            description="Get labels from the knowledge graph",
+            name="graph_degree",
+            description="Get the degree (number of connected edges) of one or more entities from the local graph index.",
             inputSchema={
                 "type": "object",
-                "properties": {},
-                "required": []
+                "properties": {
+                    "entity_names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Entities to look up"
+                    },
+                    "direction": {
+                        "type": "string",
+                        "enum": list(DIRECTIONS),
+                        "description": "Count outgoing edges, incoming edges or both",
+                        "default": "both"
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Rebuild the index from LightRAG before answering",
+                        "default": False
+                    }
+                },
+                "required": ["entity_names"]
             }
         ),
         Tool(
-            name="check_entity_exists",
-            description="Check if an entity exists in the knowledge graph",
+            name="graph_edge",
+            description="Look up the edge between two entities in the local graph index.",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "entity_name": {
+                    "source_id": {
                         "type": "string",
-                        "description": "Name of the entity to check"
+                        "description": "Source entity"
+                    },
+                    "target_id": {
+                        "type": "string",
+                        "description": "Target entity"
+                    },
+                    "directed": {
+                        "type": "boolean",
+                        "description": "Only match an edge from source to target, not the reverse",
+                        "default": False
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Rebuild the index from LightRAG before answering",
+                        "default": False
                     }
                 },
-                "required": ["entity_name"]
+                "required": ["source_id", "target_id"]
             }
         ),
         Tool(
@@ -565,6 +1504,85 @@ async def handle_list_tools() -> List[Tool]:#ListToolsResult:
                 "required": ["source_id", "target_id", "updated_data"]
             }
         ),
+        Tool(
+            name="update_entities",
+            description="Apply many entity edits in one call. Edits run concurrently, but edits to the same entity (including after a rename) are applied in request order. Returns per-edit results.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "updates": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "entity_name": {"type": "string"},
+                                "entity_id": {"type": "string"},
+                                "updated_data": {"type": "object"}
+                            },
+                            "required": ["entity_name", "updated_data"]
+                        },
+                        "description": "Entity edits to apply"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Maximum number of edits in flight",
+                        "minimum": 1,
+                        "maximum": 32,
+                        "default": 8
+                    },
+                    "stop_on_error": {
+                        "type": "boolean",
+                        "description": "Skip the remaining edits for an entity after one of its edits fails",
+                        "default": True
+                    }
+                },
+                "required": ["updates"]
+            }
+        ),
+        Tool(
+            name="update_relations",
+            description="Apply many relation edits in one call. Edits run concurrently, but edits to the same source/target pair are applied in request order. Returns per-edit results.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "updates": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "source_id": {"type": "string"},
+                                "target_id": {"type": "string"},
+                                "updated_data": {"type": "object"}
+                            },
+                            "required": ["source_id", "target_id", "updated_data"]
+                        },
+                        "description": "Relation edits to apply"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Maximum number of edits in flight",
+                        "minimum": 1,
+                        "maximum": 32,
+                        "default": 8
+                    },
+                    "stop_on_error": {
+                        "type": "boolean",
+                        "description": "Skip the remaining edits for a pair after one of its edits fails",
+                        "default": True
+                    }
+                },
+                "required": ["updates"]
+            }
+        ),
+        Tool(
+            name="flush_entity_edits",
+            description="Send any buffered, write-combined entity edits to LightRAG now (only relevant when LIGHTRAG_WRITE_COMBINE_WINDOW is set). Reports errors from earlier background flushes.",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        ),
         Tool(
             name="delete_entity",
             description="Delete an entity from the knowledge graph",
@@ -785,6 +1803,37 @@ async def handle_list_tools() -> List[Tool]:#ListToolsResult:
     
     return tools
 
+
+@server.list_resources()
+async def handle_list_resources() -> List[Resource]:
+    """List spilled tool results that can still be read."""
+    if spill_store is None and _spill_threshold() <= 0:
+        return []
+    loop = asyncio.get_running_loop()
+    spilled_files = await loop.run_in_executor(None, _get_spill_store().list)
+    return [
+        Resource(
+            uri=spilled.uri,
+            name=spilled.name,
+            description=f"Spilled tool result ({spilled.file_bytes} bytes{', gzip' if spilled.compressed else ''})",
+            mimeType="application/json",
+        )
+        for spilled in spilled_files
+    ]
+
+
+@server.read_resource()
+async def handle_read_resource(uri: AnyUrl) -> List[ReadResourceContents]:
+    """Return the full JSON of a spilled tool result."""
+    uri = str(uri)
+    logger.info(f"READ_RESOURCE: {uri}")
+    if not uri.startswith(SPILL_URI_PREFIX):
+        raise LightRAGValidationError(f"Unknown resource: {uri}")
+    loop = asyncio.get_running_loop()
+    text = await loop.run_in_executor(None, _get_spill_store().read, uri)
+    return [ReadResourceContents(content=text, mime_type="application/json")]
+
+
 @server.call_tool()
 async def handle_call_tool(self, request: CallToolRequest) -> dict:
     """Handle tool calls."""
@@ -857,16 +1906,31 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
             base_url = os.getenv("LIGHTRAG_BASE_URL", "http://localhost:9621")
             api_key = os.getenv("LIGHTRAG_API_KEY", None)
             timeout = float(os.getenv("LIGHTRAG_TIMEOUT", "30.0"))
+            entity_cache_ttl = float(os.getenv("LIGHTRAG_ENTITY_CACHE_TTL", "60.0"))
+            entity_cache_size = int(os.getenv("LIGHTRAG_ENTITY_CACHE_SIZE", "10000"))
+            write_combine_window = float(os.getenv("LIGHTRAG_WRITE_COMBINE_WINDOW", "0"))
+            edit_state_ttl = float(os.getenv("LIGHTRAG_EDIT_STATE_TTL", "0"))
+            trusted_responses = os.getenv("LIGHTRAG_TRUSTED_RESPONSES", "false").lower() in ("1", "true", "yes")
             
             logger.info("CLIENT CONFIGURATION:")
             logger.info(f"  - base_url: {base_url}")
             logger.info(f"  - api_key: {'***REDACTED***' if api_key else 'None'}")
             logger.info(f"  - timeout: {timeout}")
+            logger.info(f"  - entity_cache_ttl: {entity_cache_ttl}")
+            logger.info(f"  - entity_cache_size: {entity_cache_size}")
+            logger.info(f"  - write_combine_window: {write_combine_window}")
+            logger.info(f"  - edit_state_ttl: {edit_state_ttl}")
+            logger.info(f"  - trusted_responses: {trusted_responses}")
             
             lightrag_client = LightRAGClient(
                 base_url=base_url,
                 api_key=api_key,
-                timeout=timeout
+                timeout=timeout,
+                entity_cache_ttl=entity_cache_ttl,
+                entity_cache_size=entity_cache_size,
+                write_combine_window=write_combine_window,
+                edit_state_ttl=edit_state_ttl,
+                trusted_responses=trusted_responses
             )
             logger.info(f"  - Client initialized successfully: {type(lightrag_client)}")
             logger.info(f"  - Client base_url: {lightrag_client.base_url}")
@@ -900,6 +1964,17 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
         logger.info("TOOL DISPATCH:")
         logger.info(f"  - Dispatching to tool handler for: {tool_name}")
         
+        # Later pages of a paginated result are served from the cache without refetching
+        if tool_name in PAGINATED_TOOLS and arguments.get("cursor"):
+            logger.info(f"  - Serving next page of {tool_name} from cursor")
+            page = _get_result_pages().next_page(
+                tool_name, arguments["cursor"], arguments.get("page_size") or _default_page_size(),
+                **_page_budget(tool_name, arguments)
+            )
+            return await _create_success_response_async(
+                page, tool_name, fields=arguments.get("fields"), max_output_bytes=arguments.get("max_output_bytes")
+            )
+        
         # Document Management Tools (8 tools)
         if tool_name == "insert_text":
             logger.info("EXECUTING INSERT_TEXT TOOL:")
@@ -925,18 +2000,18 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.insert_text(text)
                 logger.info("INSERT_TEXT SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"  - Status: {result_dump.get('status', 'N/A')}")
                         logger.info(f"  - Track ID: {result_dump.get('track_id', 'N/A')}")
                         logger.info(f"  - Message: {result_dump.get('message', 'N/A')}")
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -979,18 +2054,18 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.insert_texts(texts)
                 logger.info("INSERT_TEXTS SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"  - Status: {result_dump.get('status', 'N/A')}")
                         logger.info(f"  - Track ID: {result_dump.get('track_id', 'N/A')}")
                         logger.info(f"  - Message: {result_dump.get('message', 'N/A')}")
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -1019,18 +2094,19 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.error("  - File path is empty or whitespace only")
                 raise LightRAGValidationError("File path cannot be empty")
             
-            # Check if file exists
-            if not os.path.exists(file_path):
+            # Check if file exists, off the event loop in case it is on a slow filesystem
+            info = await file_info_async(file_path)
+            if not info.exists:
                 logger.error("UPLOAD_DOCUMENT FILE ERROR:")
                 logger.error(f"  - File does not exist: {file_path}")
                 raise LightRAGValidationError(f"File does not exist: {file_path}")
             
             # Get file info
-            file_size = os.path.getsize(file_path)
+            file_size = info.size
             logger.info(f"FILE INFORMATION:")
             logger.info(f"  - File exists: True")
             logger.info(f"  - File size: {file_size} bytes")
-            logger.info(f"  - File readable: {os.access(file_path, os.R_OK)}")
+            logger.info(f"  - File readable: {info.readable}")
             
             logger.info("  - Parameter validation passed")
             logger.info("  - Calling lightrag_client.upload_document()...")
@@ -1039,18 +2115,18 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.upload_document(file_path)
                 logger.info("UPLOAD_DOCUMENT SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"  - Status: {result_dump.get('status', 'N/A')}")
                         logger.info(f"  - Track ID: {result_dump.get('track_id', 'N/A')}")
                         logger.info(f"  - Message: {result_dump.get('message', 'N/A')}")
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -1063,6 +2139,60 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.error(f"  - Full traceback: {traceback.format_exc()}")
                 raise
         
+        elif tool_name == "insert_text_and_wait":
+            logger.info("EXECUTING INSERT_TEXT_AND_WAIT TOOL:")
+            logger.info(f"  - Raw arguments: {arguments}")
+            
+            text = arguments.get("text", "")
+            timeout_seconds = float(arguments.get("timeout_seconds", 120))
+            logger.info(f"INSERT_TEXT_AND_WAIT PARAMETERS:")
+            logger.info(f"  - text length: {len(text)}")
+            logger.info(f"  - timeout_seconds: {timeout_seconds}")
+            
+            if not text or not text.strip():
+                logger.error("INSERT_TEXT_AND_WAIT VALIDATION ERROR: text is empty")
+                raise LightRAGValidationError("Text cannot be empty")
+            
+            try:
+                result = await lightrag_client.insert_text_and_wait(text, timeout=timeout_seconds)
+                logger.info("INSERT_TEXT_AND_WAIT SUCCESS:")
+                logger.info(f"  - Track ID: {result.track_id}")
+                logger.info(f"  - Final status: {result.status}")
+                logger.info(f"  - Elapsed: {result.elapsed_seconds:.2f}s over {result.polls} polls")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"INSERT_TEXT_AND_WAIT FAILED: {e}")
+                raise
+        
+        elif tool_name == "upload_document_and_wait":
+            logger.info("EXECUTING UPLOAD_DOCUMENT_AND_WAIT TOOL:")
+            logger.info(f"  - Raw arguments: {arguments}")
+            
+            file_path = arguments.get("file_path", "")
+            timeout_seconds = float(arguments.get("timeout_seconds", 120))
+            logger.info(f"UPLOAD_DOCUMENT_AND_WAIT PARAMETERS:")
+            logger.info(f"  - file_path: '{file_path}'")
+            logger.info(f"  - timeout_seconds: {timeout_seconds}")
+            
+            if not file_path or not file_path.strip():
+                logger.error("UPLOAD_DOCUMENT_AND_WAIT VALIDATION ERROR: file_path is empty")
+                raise LightRAGValidationError("File path cannot be empty")
+            
+            try:
+                result = await lightrag_client.upload_document_and_wait(file_path, timeout=timeout_seconds)
+                logger.info("UPLOAD_DOCUMENT_AND_WAIT SUCCESS:")
+                logger.info(f"  - Track ID: {result.track_id}")
+                logger.info(f"  - Final status: {result.status}")
+                logger.info(f"  - Elapsed: {result.elapsed_seconds:.2f}s over {result.polls} polls")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"UPLOAD_DOCUMENT_AND_WAIT FAILED: {e}")
+                raise
+        
         elif tool_name == "scan_documents":
             logger.info("EXECUTING SCAN_DOCUMENTS TOOL:")
             logger.info(f"  - Tool: {tool_name}")
@@ -1076,11 +2206,11 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.scan_documents()
                 logger.info("SCAN_DOCUMENTS SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"  - Status: {result_dump.get('status', 'N/A')}")
                         logger.info(f"  - Track ID: {result_dump.get('track_id', 'N/A')}")
                         logger.info(f"  - Message: {result_dump.get('message', 'N/A')}")
@@ -1089,7 +2219,7 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -1106,18 +2236,17 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
             logger.info(f"  - Client type: {type(lightrag_client)}")
             logger.info(f"  - Client base_url: {lightrag_client.base_url}")
             logger.info(f"  - Arguments: {arguments}")
-            logger.info("  - This tool requires no parameters")
             logger.info("  - Calling lightrag_client.get_documents()...")
             
             try:
                 result = await lightrag_client.get_documents()
                 logger.info("GET_DOCUMENTS SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         statuses = result_dump.get('statuses', {})
                         logger.info(f"DOCUMENT STATUSES:")
                         for status, docs in statuses.items():
@@ -1127,7 +2256,7 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_paginated_response(result, tool_name, arguments)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -1168,11 +2297,11 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.get_documents_paginated(page, page_size)
                 logger.info("GET_DOCUMENTS_PAGINATED SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         documents = result_dump.get('documents', [])
                         pagination = result_dump.get('pagination', {})
                         status_counts = result_dump.get('status_counts', {})
@@ -1190,7 +2319,10 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(
+                    result, tool_name,
+                    fields=arguments.get("fields"), max_output_bytes=arguments.get("max_output_bytes"),
+                )
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -1203,6 +2335,57 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.error(f"  - Full traceback: {traceback.format_exc()}")
                 raise
         
+        elif tool_name == "get_document_inventory":
+            logger.info("EXECUTING GET_DOCUMENT_INVENTORY TOOL:")
+            logger.info(f"  - Raw arguments: {arguments}")
+            
+            page_size = arguments.get("page_size", 100)
+            status_filter = arguments.get("status_filter")
+            concurrency = arguments.get("concurrency", 8)
+            logger.info(f"GET_DOCUMENT_INVENTORY PARAMETERS:")
+            logger.info(f"  - page_size: {page_size}")
+            logger.info(f"  - status_filter: {status_filter}")
+            logger.info(f"  - concurrency: {concurrency}")
+            
+            try:
+                result = await lightrag_client.get_document_inventory(
+                    page_size=page_size, status_filter=status_filter, concurrency=concurrency
+                )
+                logger.info("GET_DOCUMENT_INVENTORY SUCCESS:")
+                logger.info(f"  - Documents: {len(result.documents)} of {result.total_count}")
+                logger.info(f"  - Pages fetched: {result.pages_fetched}")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"GET_DOCUMENT_INVENTORY FAILED: {e}")
+                raise
+        
+        elif tool_name == "list_documents_local":
+            logger.info("EXECUTING LIST_DOCUMENTS_LOCAL TOOL:")
+            logger.info(f"  - Raw arguments: {arguments}")
+            
+            status_filter = arguments.get("status_filter")
+            document_ids = arguments.get("document_ids")
+            offset = arguments.get("offset", 0)
+            limit = arguments.get("limit", 100)
+            force_refresh = bool(arguments.get("force_refresh", False))
+            
+            try:
+                mirror = _get_document_mirror()
+                result = await mirror.query(
+                    status=status_filter, offset=offset, limit=limit, document_ids=document_ids, force=force_refresh
+                )
+                logger.info("LIST_DOCUMENTS_LOCAL SUCCESS:")
+                logger.info(f"  - Returned {len(result.documents)} of {result.total_count} matching documents")
+                logger.info(f"  - Refreshed from upstream: {result.refreshed}")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"LIST_DOCUMENTS_LOCAL FAILED: {e}")
+                raise
+        
         elif tool_name == "delete_document":
             logger.info("EXECUTING DELETE_DOCUMENT TOOL:")
             logger.info(f"  - Tool: {tool_name}")
@@ -1228,17 +2411,17 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.delete_document(document_id)
                 logger.info("DELETE_DOCUMENT SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"  - Status: {result_dump.get('status', 'N/A')}")
                         logger.info(f"  - Message: {result_dump.get('message', 'N/A')}")
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 logger.warning(f"  - Document {document_id} has been deleted")
                 return response
@@ -1251,6 +2434,40 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.error(f"  - Full traceback: {traceback.format_exc()}")
                 raise
         
+        elif tool_name == "delete_documents":
+            logger.info("EXECUTING DELETE_DOCUMENTS TOOL:")
+            logger.info(f"  - Raw arguments: {arguments}")
+            
+            document_ids = arguments.get("document_ids")
+            status_filter = arguments.get("status_filter")
+            chunk_size = arguments.get("chunk_size", 100)
+            concurrency = arguments.get("concurrency", 1)
+            logger.info(f"DELETE_DOCUMENTS PARAMETERS:")
+            logger.info(f"  - document_ids count: {len(document_ids) if document_ids else 0}")
+            logger.info(f"  - status_filter: {status_filter}")
+            logger.info(f"  - chunk_size: {chunk_size}")
+            logger.info(f"  - concurrency: {concurrency}")
+            logger.warning(f"  - DESTRUCTIVE OPERATION: Deleting documents in bulk")
+            
+            try:
+                result = await lightrag_client.delete_documents(
+                    document_ids=document_ids,
+                    status_filter=status_filter,
+                    chunk_size=chunk_size,
+                    concurrency=concurrency,
+                )
+                logger.info("DELETE_DOCUMENTS SUCCESS:")
+                logger.info(f"  - Requested: {result.requested}")
+                logger.info(f"  - Succeeded: {result.succeeded}")
+                logger.info(f"  - Failed: {result.failed}")
+                logger.info(f"  - Requests made: {result.requests_made}")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"DELETE_DOCUMENTS FAILED: {e}")
+                raise
+        
         elif tool_name == "clear_documents":
             logger.info("EXECUTING CLEAR_DOCUMENTS TOOL:")
             logger.info(f"  - Tool: {tool_name}")
@@ -1265,17 +2482,17 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.clear_documents()
                 logger.info("CLEAR_DOCUMENTS SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"  - Status: {result_dump.get('status', 'N/A')}")
                         logger.info(f"  - Message: {result_dump.get('message', 'N/A')}")
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 logger.warning("  - ALL documents have been cleared")
                 return response
@@ -1328,20 +2545,23 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 )
                 logger.info("QUERY_TEXT SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, '__dict__'):
-                    logger.info(f"  - Result.__dict__: {result.__dict__}")
+                    logger.info(f"  - Result.__dict__: {_describe_result(result.__dict__)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"  - Response length: {len(str(result_dump.get('response', '')))}")
                         logger.info(f"  - Results count: {len(result_dump.get('results', []))}")
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
                 logger.info("  - Calling _create_success_response()...")
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(
+                    result, tool_name,
+                    fields=arguments.get("fields"), max_output_bytes=arguments.get("max_output_bytes"),
+                )
                 logger.info(f"  - Success response type: {type(response)}")
                 logger.info(f"  - Success response keys: {list(response.keys())}")
                 return response
@@ -1423,10 +2643,12 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.info(f"  - Final response length: {len(streaming_response)}")
                 logger.info(f"  - Response preview: {streaming_response[:200]}{'...' if len(streaming_response) > 200 else ''}")
                 
-                # Create MCP response
-                response = CallToolResult(
-                    content=[TextContent(type="text", text=json.dumps(result, indent=2))]
+                # Create MCP response, spilling very long answers to disk
+                text = await _run_off_loop(
+                    _result_size(result), _encode_or_spill,
+                    [get_codec().dumps(result, indent=_pretty_json())], result, tool_name,
                 )
+                response = CallToolResult(content=[TextContent(type="text", text=text)])
                 logger.info(f"  - MCP response created successfully")
                 return response
                 
@@ -1450,18 +2672,44 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
             logger.info(f"  - Client type: {type(lightrag_client)}")
             logger.info(f"  - Client base_url: {lightrag_client.base_url}")
             logger.info(f"  - Arguments: {arguments}")
-            logger.info("  - This tool requires no parameters")
+            
+            label = arguments.get("label", "*")
+            max_depth = arguments.get("max_depth")
+            max_nodes = arguments.get("max_nodes")
+            logger.info("GET_KNOWLEDGE_GRAPH PARAMETERS:")
+            logger.info(f"  - label: '{label}'")
+            logger.info(f"  - max_depth: {max_depth}")
+            logger.info(f"  - max_nodes: {max_nodes}")
+            
+            if arguments.get("format", "full") == "compact":
+                include_properties = bool(arguments.get("include_properties", True))
+                logger.info(f"  - format: compact (include_properties: {include_properties})")
+                try:
+                    compact_graph = await lightrag_client.get_knowledge_graph_compact(
+                        label=label, max_depth=max_depth, max_nodes=max_nodes, include_properties=include_properties
+                    )
+                    logger.info("GET_KNOWLEDGE_GRAPH SUCCESS:")
+                    logger.info(f"  - Nodes: {compact_graph.node_count}, edges: {compact_graph.edge_count}")
+                    return await _create_success_response_async(
+                        compact_graph.to_columnar(include_properties=include_properties), tool_name, compact=True
+                    )
+                except Exception as e:
+                    logger.error(f"GET_KNOWLEDGE_GRAPH FAILED: {e}")
+                    raise
+            
             logger.info("  - Calling lightrag_client.get_knowledge_graph()...")
             
             try:
-                result = await lightrag_client.get_knowledge_graph()
+                result = await lightrag_client.get_knowledge_graph(
+                    label=label, max_depth=max_depth, max_nodes=max_nodes
+                )
                 logger.info("GET_KNOWLEDGE_GRAPH SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         nodes = result_dump.get('nodes', [])
                         edges = result_dump.get('edges', [])
                         logger.info(f"KNOWLEDGE GRAPH STATISTICS:")
@@ -1489,7 +2737,7 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_paginated_response(result, tool_name, arguments)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -1500,37 +2748,63 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.error(f"  - Full traceback: {traceback.format_exc()}")
                 raise
         
+        elif tool_name == "get_knowledge_graph_delta":
+            logger.info("EXECUTING GET_KNOWLEDGE_GRAPH_DELTA TOOL:")
+            logger.info(f"  - Raw arguments: {arguments}")
+            
+            since_version = arguments.get("since_version")
+            logger.info("GET_KNOWLEDGE_GRAPH_DELTA PARAMETERS:")
+            logger.info(f"  - since_version: {since_version}")
+            logger.info(f"  - label: '{arguments.get('label', '*')}'")
+            
+            try:
+                result = await lightrag_client.get_knowledge_graph_delta(
+                    since_version=since_version,
+                    label=arguments.get("label", "*"),
+                    max_depth=arguments.get("max_depth"),
+                    max_nodes=arguments.get("max_nodes"),
+                )
+                logger.info("GET_KNOWLEDGE_GRAPH_DELTA SUCCESS:")
+                logger.info(f"  - Version: {result.version} (base found: {result.base_found})")
+                logger.info(f"  - Nodes added/changed/removed: {len(result.added_nodes)}/{len(result.changed_nodes)}/{len(result.removed_node_ids)}")
+                logger.info(f"  - Edges added/changed/removed: {len(result.added_edges)}/{len(result.changed_edges)}/{len(result.removed_edges)}")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"GET_KNOWLEDGE_GRAPH_DELTA FAILED: {e}")
+                raise
+        
         elif tool_name == "get_graph_labels":
             logger.info("EXECUTING GET_GRAPH_LABELS TOOL:")
             logger.info(f"  - Tool: {tool_name}")
             logger.info(f"  - Client type: {type(lightrag_client)}")
             logger.info(f"  - Client base_url: {lightrag_client.base_url}")
             logger.info(f"  - Arguments: {arguments}")
-            logger.info("  - This tool requires no parameters")
             logger.info("  - Calling lightrag_client.get_graph_labels()...")
             
             try:
                 result = await lightrag_client.get_graph_labels()
                 logger.info("GET_GRAPH_LABELS SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         entity_labels = result_dump.get('entity_labels', [])
                         relation_labels = result_dump.get('relation_labels', [])
                         logger.info(f"GRAPH LABELS:")
                         logger.info(f"    - Entity labels count: {len(entity_labels)}")
                         logger.info(f"    - Relation labels count: {len(relation_labels)}")
                         if entity_labels:
-                            logger.info(f"    - Entity labels: {entity_labels}")
+                            logger.info(f"    - Entity labels: {_describe_result(entity_labels)}")
                         if relation_labels:
-                            logger.info(f"    - Relation labels: {relation_labels}")
+                            logger.info(f"    - Relation labels: {_describe_result(relation_labels)}")
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_paginated_response(result, tool_name, arguments)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -1565,11 +2839,11 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.check_entity_exists(entity_name)
                 logger.info("CHECK_ENTITY_EXISTS SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         exists = result_dump.get('exists', False)
                         logger.info(f"ENTITY EXISTENCE CHECK:")
                         logger.info(f"    - Entity '{entity_name}' exists: {exists}")
@@ -1577,7 +2851,7 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -1589,6 +2863,147 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.error(f"  - Full traceback: {traceback.format_exc()}")
                 raise
         
+        elif tool_name == "check_entities_exist":
+            logger.info("EXECUTING CHECK_ENTITIES_EXIST TOOL:")
+            
+            entity_names = arguments.get("entity_names", [])
+            use_cache = bool(arguments.get("use_cache", True))
+            logger.info(f"CHECK_ENTITIES_EXIST PARAMETERS:")
+            logger.info(f"  - entity_names count: {len(entity_names)}")
+            logger.info(f"  - use_cache: {use_cache}")
+            
+            try:
+                result = await lightrag_client.check_entities_exist(entity_names, use_cache=use_cache)
+                logger.info("CHECK_ENTITIES_EXIST SUCCESS:")
+                logger.info(f"  - Distinct names: {len(result.results)}")
+                logger.info(f"  - Cache hits: {result.cache_hits}")
+                logger.info(f"  - Requests made: {result.requests_made}")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"CHECK_ENTITIES_EXIST FAILED: {e}")
+                raise
+        
+        elif tool_name == "search_graph_labels":
+            logger.info("EXECUTING SEARCH_GRAPH_LABELS TOOL:")
+            logger.info(f"  - Raw arguments: {arguments}")
+            
+            try:
+                result = await _get_label_index().search(
+                    arguments["query"],
+                    limit=arguments.get("limit", 10),
+                    mode=arguments.get("mode", "auto"),
+                    min_score=float(arguments.get("min_score", 0.3)),
+                    force_refresh=bool(arguments.get("force_refresh", False)),
+                )
+                logger.info("SEARCH_GRAPH_LABELS SUCCESS:")
+                logger.info(f"  - {len(result.matches)} matches among {result.total_labels} labels")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"SEARCH_GRAPH_LABELS FAILED: {e}")
+                raise
+        
+        elif tool_name == "find_duplicate_entities":
+            logger.info("EXECUTING FIND_DUPLICATE_ENTITIES TOOL:")
+            logger.info(f"  - Raw arguments: {arguments}")
+            
+            try:
+                index = await _get_label_index().get(bool(arguments.get("force_refresh", False)))
+                # Signature hashing is CPU-bound; keep it off the event loop
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        find_duplicates,
+                        index.labels,
+                        threshold=float(arguments.get("threshold", 0.5)),
+                        num_perm=arguments.get("num_perm", 64),
+                        limit=arguments.get("limit", 100),
+                    ),
+                )
+                logger.info("FIND_DUPLICATE_ENTITIES SUCCESS:")
+                logger.info(f"  - {result.total_groups} groups among {result.total_labels} labels")
+                logger.info(f"  - Candidate pairs: {result.candidate_pairs}, elapsed: {result.elapsed_seconds:.3f}s")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"FIND_DUPLICATE_ENTITIES FAILED: {e}")
+                raise
+        
+        elif tool_name == "graph_stats":
+            logger.info("EXECUTING GRAPH_STATS TOOL:")
+            logger.info(f"  - Raw arguments: {arguments}")
+            
+            metrics = arguments.get("metrics", list(GRAPH_METRICS))
+            top_k = arguments.get("top_k", 10)
+            time_budget = float(arguments.get("time_budget_seconds", 5.0))
+            
+            try:
+                # The metrics only read the graph's structure, so skip encoding property blobs
+                graph = await lightrag_client.get_knowledge_graph_compact(
+                    label=arguments.get("label", "*"),
+                    max_depth=arguments.get("max_depth"),
+                    max_nodes=arguments.get("max_nodes"),
+                    include_properties=False,
+                )
+                # The metrics are CPU-bound; keep them off the event loop
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    None,
+                    functools.partial(compute_graph_stats, graph, metrics=metrics, top_k=top_k, time_budget=time_budget),
+                )
+                logger.info("GRAPH_STATS SUCCESS:")
+                logger.info(f"  - Nodes: {result.node_count}, edges: {result.edge_count}")
+                logger.info(f"  - Backend: {result.backend}, elapsed: {result.elapsed_seconds:.3f}s")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"GRAPH_STATS FAILED: {e}")
+                raise
+        
+        elif tool_name in ("graph_neighbors", "graph_degree", "graph_edge"):
+            logger.info(f"EXECUTING {tool_name.upper()} TOOL:")
+            logger.info(f"  - Raw arguments: {arguments}")
+            
+            force_refresh = bool(arguments.get("force_refresh", False))
+            direction = arguments.get("direction", "both")
+            
+            try:
+                index = _get_graph_index()
+                if tool_name == "graph_neighbors":
+                    result = await index.neighbors(
+                        arguments["entity_name"],
+                        direction=direction,
+                        limit=arguments.get("limit", 100),
+                        force_refresh=force_refresh,
+                    )
+                    logger.info(f"  - Found: {result.found}, degree: {result.degree}")
+                elif tool_name == "graph_degree":
+                    result = await index.degrees(
+                        arguments["entity_names"], direction=direction, force_refresh=force_refresh
+                    )
+                    logger.info(f"  - Degrees: {len(result.degrees)}, missing: {len(result.missing)}")
+                else:
+                    result = await index.lookup_edge(
+                        arguments["source_id"],
+                        arguments["target_id"],
+                        directed=bool(arguments.get("directed", False)),
+                        force_refresh=force_refresh,
+                    )
+                    logger.info(f"  - Found: {result.found}")
+                logger.info(f"{tool_name.upper()} SUCCESS:")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"{tool_name.upper()} FAILED: {e}")
+                raise
+        
         elif tool_name == "update_entity":
             logger.info("EXECUTING UPDATE_ENTITY TOOL:")
             logger.info(f"  - Tool: {tool_name}")
@@ -1626,11 +3041,11 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.update_entity(entity_id, properties)
                 logger.info("UPDATE_ENTITY SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"ENTITY UPDATE DETAILS:")
                         logger.info(f"    - Status: {result_dump.get('status', 'N/A')}")
                         logger.info(f"    - Message: {result_dump.get('message', 'N/A')}")
@@ -1644,7 +3059,7 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -1694,11 +3109,11 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
         #         result = await lightrag_client.update_relation(relation_id, properties)
         #         logger.info("UPDATE_RELATION SUCCESS:")
         #         logger.info(f"  - Result type: {type(result)}")
-        #         logger.info(f"  - Result content: {repr(result)}")
+        #         logger.info(f"  - Result content: {_describe_result(result)}")
         #         if hasattr(result, 'model_dump'):
         #             try:
-        #                 result_dump = result.model_dump()
-        #                 logger.info(f"  - Result.model_dump(): {result_dump}")
+        #                 result_dump = dump_plain(result)
+        #                 logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
         #                 logger.info(f"RELATION UPDATE DETAILS:")
         #                 logger.info(f"    - Status: {result_dump.get('status', 'N/A')}")
         #                 logger.info(f"    - Message: {result_dump.get('message', 'N/A')}")
@@ -1710,7 +3125,7 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
         #             except Exception as e:
         #                 logger.error(f"  - model_dump() failed: {e}")
                 
-        #         response = _create_success_response(result, tool_name)
+        #         response = await _create_success_response_async(result, tool_name)
         #         logger.info(f"  - Success response created")
         #         return response
         #     except Exception as e:
@@ -1754,14 +3169,60 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
             try:
                 result = await lightrag_client.update_relation(source_id, target_id, updated_data)
                 logger.info("UPDATE_RELATION SUCCESS:")
-                logger.info(f"  - Result content: {repr(result)}")
-                response = _create_success_response(result, tool_name)
+                logger.info(f"  - Result content: {_describe_result(result)}")
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
                 logger.error(f"UPDATE_RELATION FAILED: {e}")
                 raise
 
+        elif tool_name in ("update_entities", "update_relations"):
+            logger.info(f"EXECUTING {tool_name.upper()} TOOL:")
+            
+            updates = arguments.get("updates", [])
+            concurrency = arguments.get("concurrency", 8)
+            stop_on_error = bool(arguments.get("stop_on_error", True))
+            logger.info(f"{tool_name.upper()} PARAMETERS:")
+            logger.info(f"  - updates count: {len(updates)}")
+            logger.info(f"  - concurrency: {concurrency}")
+            logger.info(f"  - stop_on_error: {stop_on_error}")
+            
+            try:
+                if tool_name == "update_entities":
+                    result = await lightrag_client.update_entities(
+                        updates, concurrency=concurrency, stop_on_error=stop_on_error
+                    )
+                else:
+                    result = await lightrag_client.update_relations(
+                        updates, concurrency=concurrency, stop_on_error=stop_on_error
+                    )
+                logger.info(f"{tool_name.upper()} SUCCESS:")
+                logger.info(f"  - Succeeded: {result.succeeded} of {result.total}")
+                logger.info(f"  - Failed: {result.failed}")
+                logger.info(f"  - Unchanged: {result.unchanged}")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"{tool_name.upper()} FAILED: {e}")
+                raise
+        
+        elif tool_name == "flush_entity_edits":
+            logger.info("EXECUTING FLUSH_ENTITY_EDITS TOOL:")
+            
+            try:
+                result = await lightrag_client.flush_entity_edits()
+                logger.info("FLUSH_ENTITY_EDITS SUCCESS:")
+                logger.info(f"  - Flushed: {result.flushed}")
+                logger.info(f"  - Errors: {len(result.errors)}")
+                response = await _create_success_response_async(result, tool_name)
+                logger.info(f"  - Success response created")
+                return response
+            except Exception as e:
+                logger.error(f"FLUSH_ENTITY_EDITS FAILED: {e}")
+                raise
+        
         elif tool_name == "delete_entity":
             logger.info("EXECUTING DELETE_ENTITY TOOL:")
             logger.info(f"  - Tool: {tool_name}")
@@ -1787,17 +3248,17 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.delete_entity(entity_id)
                 logger.info("DELETE_ENTITY SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"  - Status: {result_dump.get('status', 'N/A')}")
                         logger.info(f"  - Message: {result_dump.get('message', 'N/A')}")
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 logger.warning(f"  - Entity {entity_id} has been deleted")
                 return response
@@ -1835,17 +3296,17 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.delete_relation(relation_id)
                 logger.info("DELETE_RELATION SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"  - Status: {result_dump.get('status', 'N/A')}")
                         logger.info(f"  - Message: {result_dump.get('message', 'N/A')}")
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 logger.warning(f"  - Relation {relation_id} has been deleted")
                 return response
@@ -1873,13 +3334,13 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.get_pipeline_status()
                 logger.info("GET_PIPELINE_STATUS SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, '__dict__'):
-                    logger.info(f"  - Result.__dict__: {result.__dict__}")
+                    logger.info(f"  - Result.__dict__: {_describe_result(result.__dict__)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"PIPELINE STATUS DETAILS:")
                         logger.info(f"    - autoscanned: {result_dump.get('autoscanned', 'N/A')}")
                         logger.info(f"    - busy: {result_dump.get('busy', 'N/A')}")
@@ -1900,7 +3361,7 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                         logger.error(f"  - model_dump() failed: {e}")
                 
                 logger.info("  - Calling _create_success_response()...")
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response type: {type(response)}")
                 logger.info(f"  - Success response keys: {list(response.keys())}")
                 return response
@@ -1937,11 +3398,11 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.get_track_status(track_id)
                 logger.info("GET_TRACK_STATUS SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"TRACK STATUS DETAILS:")
                         logger.info(f"    - Track ID: {result_dump.get('track_id', 'N/A')}")
                         documents = result_dump.get('documents', [])
@@ -1955,7 +3416,7 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -1980,11 +3441,11 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.get_document_status_counts()
                 logger.info("GET_DOCUMENT_STATUS_COUNTS SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         status_counts = result_dump.get('status_counts', {})
                         logger.info(f"DOCUMENT STATUS COUNTS:")
                         for status, count in status_counts.items():
@@ -2003,7 +3464,7 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 return response
             except Exception as e:
@@ -2028,11 +3489,11 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.clear_cache()
                 logger.info("CLEAR_CACHE SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, 'model_dump'):
                     try:
-                        result_dump = result.model_dump()
-                        logger.info(f"  - Result.model_dump(): {result_dump}")
+                        result_dump = dump_plain(result)
+                        logger.info(f"  - Result.model_dump(): {_describe_result(result_dump)}")
                         logger.info(f"CACHE CLEAR DETAILS:")
                         logger.info(f"    - Status: {result_dump.get('status', 'N/A')}")
                         logger.info(f"    - Message: {result_dump.get('message', 'N/A')}")
@@ -2041,7 +3502,7 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                     except Exception as e:
                         logger.error(f"  - model_dump() failed: {e}")
                 
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response created")
                 logger.info("  - System cache has been cleared")
                 return response
@@ -2064,13 +3525,13 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 result = await lightrag_client.get_health()
                 logger.info("GET_HEALTH SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
-                logger.info(f"  - Result content: {repr(result)}")
+                logger.info(f"  - Result content: {_describe_result(result)}")
                 if hasattr(result, '__dict__'):
-                    logger.info(f"  - Result.__dict__: {result.__dict__}")
+                    logger.info(f"  - Result.__dict__: {_describe_result(result.__dict__)}")
                 if hasattr(result, 'model_dump'):
                     logger.info(f"  - Result.model_dump(): {result.model_dump()}")
                 logger.info("  - Calling _create_success_response()...")
-                response = _create_success_response(result, tool_name)
+                response = await _create_success_response_async(result, tool_name)
                 logger.info(f"  - Success response type: {type(response)}")
                 logger.info(f"  - Success response: {response}")
                 return response
@@ -2141,6 +3602,13 @@ async def main():
         logger.info(f"  - Server object: {server}")
         logger.info(f"  - Server type: {type(server)}")
         
+        # Turn SIGTERM into cancellation so the cleanup below (which flushes buffered edits) still runs
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except (NotImplementedError, RuntimeError):
+            logger.info("  - SIGTERM handler not supported on this platform")
+        
         logger.info("STDIO SERVER SETUP:")
         async with stdio_server() as (read_stream, write_stream):
             logger.info("  - STDIO server context entered successfully")
@@ -2177,6 +3645,9 @@ async def main():
     except KeyboardInterrupt:
         logger.info("SERVER SHUTDOWN:")
         logger.info("  - Server shutdown requested by user (KeyboardInterrupt)")
+    except asyncio.CancelledError:
+        logger.info("SERVER SHUTDOWN:")
+        logger.info("  - Server shutdown requested (cancelled or SIGTERM)")
     except ConnectionError as e:
         logger.error("CONNECTION ERROR:")
         logger.error(f"  - Connection error during server startup: {e}")
@@ -0,0 +1,176 @@
+"""
+Spilling of large tool results to disk.
+
+Some results, such as a full knowledge graph or a long streamed answer, are too
+large to send inline as one MCP text content item. Above a size threshold the
+server writes the JSON to a spill directory, optionally gzip-compressed. The
+tool then returns a short summary with an MCP resource URI and the file path.
+Spill files expire after a TTL, and the oldest are evicted once the directory
+holds more than ``max_files`` of them.
+"""
+
+import gzip
+import os
+import re
+import secrets
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .client import LightRAGValidationError
+
+
+# Resource URI prefix under which spilled results are served
+SPILL_URI_PREFIX = "lightrag://results/"
+
+# Only files with names like this are read or evicted, so a shared directory is left alone
+_SPILL_NAME = re.compile(r"^[a-z0-9_]+-[A-Za-z0-9_-]{16}\.json(?:\.gz)?$")
+
+# Characters written per call, so the whole result is never encoded at once
+_WRITE_CHUNK_CHARS = 1 << 20
+
+# Metadata strings longer than this are cut short in summaries
+_PREVIEW_CHARS = 200
+
+
+class SpilledFile(NamedTuple):
+    """A result written to the spill directory."""
+    name: str
+    path: str
+    uri: str
+    compressed: bool
+    file_bytes: int
+    modified_at: float
+
+
+def summarize(result: Any) -> Tuple[Dict[str, int], Dict[str, Any]]:
+    """Split a result into the sizes of its list/dict fields and its other (shortened) fields."""
+    if isinstance(result, BaseModel):
+        fields = {name: getattr(result, name) for name in type(result).model_fields}
+    elif isinstance(result, dict):
+        fields = result
+    else:
+        return {}, {}
+    section_totals: Dict[str, int] = {}
+    metadata: Dict[str, Any] = {}
+    for key, value in fields.items():
+        if isinstance(value, (list, tuple, dict)):
+            section_totals[str(key)] = len(value)
+        elif isinstance(value, str) and len(value) > _PREVIEW_CHARS:
+            metadata[str(key)] = value[:_PREVIEW_CHARS] + "..."
+        elif value is None or isinstance(value, (str, int, float, bool)):
+            metadata[str(key)] = value
+        else:
+            metadata[str(key)] = str(value)
+    return section_totals, metadata
+
+
+class SpillStore:
+    """Directory of spilled tool results with TTL and count-based eviction.
+
+    Methods do blocking file I/O; call them from a worker thread when the
+    result is large.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        compress: bool = False,
+        ttl: float = 3600.0,
+        max_files: int = 32,
+    ):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "daniel-lightrag-mcp-results")
+        self.compress = compress
+        self.ttl = ttl
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def uri(name: str) -> str:
+        return SPILL_URI_PREFIX + name
+
+    def spill(self, tool_name: str, pieces: Iterable[str]) -> SpilledFile:
+        """Write the concatenated ``pieces`` of a result to a new spill file."""
+        name = f"{re.sub(r'[^a-z0-9_]', '_', tool_name.lower())}-{secrets.token_urlsafe(12)}.json"
+        if self.compress:
+            name += ".gz"
+        path = os.path.join(self.directory, name)
+        temp_path = path + ".tmp"
+        try:
+            if self.compress:
+                handle = gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=6)
+            else:
+                handle = open(temp_path, "w", encoding="utf-8")
+            with handle:
+                for piece in pieces:
+                    for start in range(0, len(piece), _WRITE_CHUNK_CHARS):
+                        handle.write(piece[start:start + _WRITE_CHUNK_CHARS])
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        stat = os.stat(path)
+        # Evict after writing so the new file counts towards max_files but is never the one removed
+        self.evict(keep=name)
+        return SpilledFile(name, path, self.uri(name), self.compress, stat.st_size, stat.st_mtime)
+
+    def read(self, name_or_uri: str) -> str:
+        """Return the JSON text of a spilled result."""
+        name = name_or_uri[len(SPILL_URI_PREFIX):] if name_or_uri.startswith(SPILL_URI_PREFIX) else name_or_uri
+        if not _SPILL_NAME.match(name):
+            raise LightRAGValidationError(f"Unknown spilled result: {name_or_uri}")
+        self.evict()
+        path = os.path.join(self.directory, name)
+        try:
+            if name.endswith(".gz"):
+                with gzip.open(path, "rt", encoding="utf-8") as handle:
+                    return handle.read()
+            with open(path, "r", encoding="utf-8") as handle:
+                return handle.read()
+        except FileNotFoundError:
+            raise LightRAGValidationError(f"Spilled result has expired or was evicted: {name_or_uri}")
+
+    def list(self) -> List[SpilledFile]:
+        """Return the live spill files, newest first."""
+        self.evict()
+        return sorted(self._scan(), key=lambda spilled: spilled.modified_at, reverse=True)
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Remove expired files, then the oldest beyond ``max_files``; returns how many were removed."""
+        with self._lock:
+            files = sorted(self._scan(), key=lambda spilled: spilled.modified_at)
+            cutoff = time.time() - self.ttl
+            expired = [spilled for spilled in files if spilled.modified_at <= cutoff and spilled.name != keep]
+            live = [spilled for spilled in files if spilled not in expired]
+            excess = max(len(live) - self.max_files, 0)
+            evicted = expired + [spilled for spilled in live if spilled.name != keep][:excess]
+            for spilled in evicted:
+                try:
+                    os.remove(spilled.path)
+                except FileNotFoundError:
+                    pass
+            return len(evicted)
+
+    def expires_in(self, spilled: SpilledFile) -> float:
+        """Seconds until ``spilled`` expires."""
+        return max(spilled.modified_at + self.ttl - time.time(), 0.0)
+
+    def _scan(self) -> List[SpilledFile]:
+        files = []
+        for entry in os.scandir(self.directory):
+            if not _SPILL_NAME.match(entry.name):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append(SpilledFile(
+                entry.name, entry.path, self.uri(entry.name), entry.name.endswith(".gz"),
+                stat.st_size, stat.st_mtime,
+            ))
+        return files
@@ -4,6 +4,7 @@ Pytest configuration and fixtures for daniel-lightrag-mcp tests.
 
 import pytest
 import asyncio
+import json
 from typing import Dict, Any, AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock
 import httpx
@@ -42,6 +43,7 @@ def mock_response():
         response = MagicMock()
         response.status_code = status_code
         response.json.return_value = json_data or {}
+        response.content = json.dumps(json_data or {}).encode("utf-8")
         response.text = text
         response.raise_for_status = MagicMock()
         
@@ -66,9 +68,15 @@ def mock_streaming_response():
             for chunk in chunks:
                 yield chunk
         
+        async def aiter_bytes(chunk_size=None):
+            for chunk in chunks:
+                yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        
         response = MagicMock()
         response.status_code = status_code
         response.aiter_text = aiter_text
+        response.aiter_bytes = aiter_bytes
+        response.aread = AsyncMock()
         response.raise_for_status = MagicMock()
         
         if status_code >= 400:
@@ -3,6 +3,7 @@ Unit tests for LightRAG client functionality.
 """
 
 import pytest
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
@@ -22,8 +23,10 @@ from daniel_lightrag_mcp.models import (
     InsertResponse,
     QueryResponse,
     DocumentsResponse,
-    HealthResponse
+    HealthResponse,
+    EntityUpdateResponse
 )
+from daniel_lightrag_mcp.multipart import MultipartFileBody
 
 
 class TestLightRAGClientInitialization:
@@ -192,6 +195,23 @@ class TestDocumentManagementMethods:
             assert result.status == "uploaded"
             lightrag_client.client.post.assert_called_once()
     
+    async def test_upload_document_streams_body(self, lightrag_client, mock_response, tmp_path):
+        """Test the file is sent as a streamed multipart body with an exact length."""
+        path = tmp_path / "test.txt"
+        path.write_bytes(b"hello")
+        response = mock_response(200, {"status": "success", "message": "ok", "track_id": "t1"})
+        lightrag_client.client.post = AsyncMock(return_value=response)
+        
+        result = await lightrag_client.upload_document(str(path))
+        
+        assert result.track_id == "t1"
+        kwargs = lightrag_client.client.post.call_args.kwargs
+        body = kwargs["content"]
+        assert isinstance(body, MultipartFileBody)
+        assert body.size == 5
+        assert kwargs["headers"]["Content-Length"] == str(body.content_length)
+        assert b"".join([chunk async for chunk in body]).count(b"hello") == 1
+    
     async def test_upload_document_file_not_found(self, lightrag_client):
         """Test document upload with file not found."""
         with patch('os.path.exists', return_value=False):
@@ -266,6 +286,68 @@ class TestDocumentManagementMethods:
         assert result.document_id == "doc_123"
         lightrag_client.client.delete.assert_called_once()
     
+    async def test_delete_documents_chunks_and_dedupes(self, lightrag_client, mock_response):
+        """Test bulk deletion deduplicates IDs and sends one request per chunk."""
+        response = mock_response(200, {"status": "deletion_started", "message": "ok"})
+        lightrag_client.client.request = AsyncMock(return_value=response)
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"autoscanned": False, "busy": False}))
+        ids = [f"doc_{i}" for i in range(5)] + ["doc_0"]
+        
+        result = await lightrag_client.delete_documents(document_ids=ids, chunk_size=2)
+        
+        assert result.requested == 5
+        assert result.succeeded == 5
+        assert result.requests_made == 3
+        # The pipeline is checked before the second and third chunks
+        assert lightrag_client.client.get.await_count == 2
+        sent = [call[1]["json"]["doc_ids"] for call in lightrag_client.client.request.call_args_list]
+        assert sorted(doc_id for chunk in sent for doc_id in chunk) == sorted(set(ids))
+    
+    async def test_delete_documents_reports_failed_chunks(self, lightrag_client, mock_response):
+        """Test a failing chunk marks only its own IDs as failed."""
+        ok = mock_response(200, {"status": "deletion_started", "message": "ok"})
+        lightrag_client.client.request = AsyncMock(side_effect=[ok, httpx.ConnectError("down")])
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"autoscanned": False, "busy": False}))
+        
+        result = await lightrag_client.delete_documents(document_ids=["a", "b", "c"], chunk_size=2, concurrency=1)
+        
+        outcomes = {outcome.doc_id: outcome.success for outcome in result.results}
+        assert outcomes == {"a": True, "b": True, "c": False}
+        assert result.failed == 1
+    
+    async def test_delete_documents_retries_when_busy(self, lightrag_client, mock_response):
+        """Test a busy response waits for the pipeline to go idle, however long it takes, then retries."""
+        busy = mock_response(200, {"status": "busy", "message": "pipeline busy"})
+        ok = mock_response(200, {"status": "deletion_started", "message": "ok"})
+        pipeline_busy = mock_response(200, {"autoscanned": False, "busy": True, "latest_message": "deleting"})
+        pipeline_idle = mock_response(200, {"autoscanned": False, "busy": False})
+        lightrag_client.client.request = AsyncMock(side_effect=[ok, busy, ok])
+        # Busy for longer than the old three-retry backoff allowed
+        lightrag_client.client.get = AsyncMock(side_effect=[pipeline_idle] + [pipeline_busy] * 10 + [pipeline_idle])
+        
+        with patch("daniel_lightrag_mcp.client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = await lightrag_client.delete_documents(document_ids=["a", "b"], chunk_size=1)
+        
+        assert result.succeeded == 2
+        assert result.requests_made == 3
+        assert mock_sleep.await_count == 10
+    
+    async def test_delete_documents_gives_up_after_busy_timeout(self, lightrag_client, mock_response):
+        """Test a chunk is reported as busy once the pipeline stays busy past the timeout."""
+        busy = mock_response(200, {"status": "busy", "message": "pipeline busy"})
+        lightrag_client.client.request = AsyncMock(return_value=busy)
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"autoscanned": False, "busy": True}))
+        
+        result = await lightrag_client.delete_documents(document_ids=["a"], busy_timeout=0)
+        
+        assert result.failed == 1
+        assert result.results[0].status == "busy"
+    
+    async def test_delete_documents_requires_one_selector(self, lightrag_client):
+        """Test bulk deletion needs exactly one of IDs or status filter."""
+        with pytest.raises(LightRAGValidationError):
+            await lightrag_client.delete_documents()
+    
     async def test_clear_documents_success(self, lightrag_client, mock_response):
         """Test successful document clearing."""
         # Setup mock
@@ -284,6 +366,93 @@ class TestDocumentManagementMethods:
         )
 
 
+@pytest.mark.asyncio
+class TestDocumentIteration:
+    """Test iterating documents across pages with prefetching."""
+    
+    @staticmethod
+    def _paged_post(mock_response, total_docs, page_size, requested_pages):
+        """Build a post side effect serving ``total_docs`` documents in pages."""
+        total_pages = (total_docs + page_size - 1) // page_size
+        
+        async def post(url, json=None):
+            page = json["page"]
+            requested_pages.append(page)
+            start = (page - 1) * page_size
+            docs = [
+                {"id": f"doc_{i}", "status": "processed"}
+                for i in range(start, min(start + page_size, total_docs))
+            ]
+            return mock_response(200, {
+                "documents": docs,
+                "pagination": {
+                    "page": page, "page_size": page_size, "total_count": total_docs,
+                    "total_pages": total_pages, "has_next": page < total_pages, "has_prev": page > 1
+                }
+            })
+        
+        return post
+    
+    async def test_iter_documents_all_pages(self, lightrag_client, mock_response):
+        """Test iteration yields every document in order across pages."""
+        requested = []
+        lightrag_client.client.post = self._paged_post(mock_response, 25, 10, requested)
+        
+        ids = [doc.id async for doc in lightrag_client.iter_documents(page_size=10, prefetch=2)]
+        
+        assert ids == [f"doc_{i}" for i in range(25)]
+        assert sorted(requested) == [1, 2, 3]
+    
+    async def test_iter_documents_max_items_stops_early(self, lightrag_client, mock_response):
+        """Test max_items stops iteration without walking the remaining pages."""
+        requested = []
+        lightrag_client.client.post = self._paged_post(mock_response, 100, 10, requested)
+        
+        ids = [doc.id async for doc in lightrag_client.iter_documents(page_size=10, prefetch=1, max_items=15)]
+        
+        assert len(ids) == 15
+        assert max(requested) <= 3
+    
+    async def test_stream_documents(self, lightrag_client, mock_streaming_response):
+        """Test /documents entries are yielded one by one with their status group."""
+        body = json.dumps({"statuses": {"processed": [{"id": "doc_1"}, {"id": "doc_2"}], "failed": [{"id": "doc_3"}]}})
+        stream_context = AsyncMock()
+        stream_context.__aenter__ = AsyncMock(return_value=mock_streaming_response([body[:20], body[20:]]))
+        stream_context.__aexit__ = AsyncMock(return_value=None)
+        lightrag_client.client.stream = MagicMock(return_value=stream_context)
+        
+        documents = [document async for document in lightrag_client.stream_documents()]
+        
+        assert documents == [
+            {"status": "processed", "id": "doc_1"},
+            {"status": "processed", "id": "doc_2"},
+            {"status": "failed", "id": "doc_3"},
+        ]
+    
+    async def test_iter_documents_negative_prefetch(self, lightrag_client):
+        """Test a negative prefetch depth is rejected."""
+        with pytest.raises(LightRAGValidationError, match="Prefetch"):
+            async for _ in lightrag_client.iter_documents(prefetch=-1):
+                pass
+    
+    async def test_get_document_inventory(self, lightrag_client, mock_response):
+        """Test the inventory fetch requests every page once and merges the results."""
+        requested = []
+        lightrag_client.client.post = self._paged_post(mock_response, 45, 10, requested)
+        
+        result = await lightrag_client.get_document_inventory(page_size=10, concurrency=2)
+        
+        assert result.total_count == 45
+        assert result.pages_fetched == 5
+        assert [doc.id for doc in result.documents] == [f"doc_{i}" for i in range(45)]
+        assert sorted(requested) == [1, 2, 3, 4, 5]
+    
+    async def test_get_document_inventory_invalid_concurrency(self, lightrag_client):
+        """Test the inventory fetch rejects a concurrency below one."""
+        with pytest.raises(LightRAGValidationError, match="Concurrency"):
+            await lightrag_client.get_document_inventory(concurrency=0)
+
+
 @pytest.mark.asyncio
 class TestQueryMethods:
     """Test query client methods."""
@@ -381,6 +550,69 @@ class TestKnowledgeGraphMethods:
             "http://localhost:9621/graphs", params=None
         )
     
+    async def test_get_knowledge_graph_subgraph_params(self, lightrag_client, mock_response):
+        """Test label and limits are sent as query parameters only when set."""
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"nodes": [], "edges": []}))
+        
+        await lightrag_client.get_knowledge_graph(label="OpenAI", max_depth=2, max_nodes=100)
+        
+        assert lightrag_client.client.get.call_args.kwargs["params"] == {
+            "label": "OpenAI", "max_depth": 2, "max_nodes": 100
+        }
+        with pytest.raises(LightRAGValidationError):
+            await lightrag_client.get_knowledge_graph(max_depth=0)
+    
+    async def test_get_knowledge_graph_delta(self, lightrag_client, mock_response):
+        """Test successive delta calls report only what changed upstream."""
+        first_graph = {"nodes": [{"id": "A"}, {"id": "B"}], "edges": []}
+        second_graph = {"nodes": [{"id": "A"}, {"id": "C"}], "edges": []}
+        lightrag_client.client.get = AsyncMock(side_effect=[
+            mock_response(200, first_graph), mock_response(200, second_graph)
+        ])
+        
+        first = await lightrag_client.get_knowledge_graph_delta()
+        second = await lightrag_client.get_knowledge_graph_delta(since_version=first.version)
+        
+        assert len(first.added_nodes) == 2
+        assert second.base_found is True
+        assert second.added_nodes == [{"id": "C"}]
+        assert second.removed_node_ids == ["B"]
+    
+    async def test_get_knowledge_graph_trusted_responses(self, mock_response):
+        """Test trusted mode keeps the response's node list instead of validating a copy."""
+        client = LightRAGClient(trusted_responses=True)
+        body = {"nodes": [{"id": "A"}], "edges": [], "is_truncated": False}
+        client.client.get = AsyncMock(return_value=mock_response(200, body))
+        
+        with patch.object(client.codec, "loads", return_value=body):
+            graph = await client.get_knowledge_graph()
+        
+        assert graph.nodes is body["nodes"]
+        assert graph.is_truncated is False
+    
+    async def test_get_knowledge_graph_compact_streams_body(self, lightrag_client, mock_streaming_response):
+        """Test the compact graph is built from a body parsed chunk by chunk."""
+        body = json.dumps({
+            "nodes": [{"id": "A", "properties": {"entity_type": "org", "description": 'say "hi" ]}'}}, {"id": "B"}],
+            "edges": [{"source": "A", "target": "B", "properties": {"weight": 2.0}}],
+            "is_truncated": True,
+        })
+        chunks = [body[i:i + 7] for i in range(0, len(body), 7)]
+        stream_context = AsyncMock()
+        stream_context.__aenter__ = AsyncMock(return_value=mock_streaming_response(chunks))
+        stream_context.__aexit__ = AsyncMock(return_value=None)
+        lightrag_client.client.stream = MagicMock(return_value=stream_context)
+        
+        graph = await lightrag_client.get_knowledge_graph_compact(label="A", max_depth=2)
+        
+        assert graph.node_ids == ["A", "B"]
+        assert graph.node_properties(0)["description"] == 'say "hi" ]}'
+        assert graph.weights.tolist() == [2.0]
+        assert graph.is_truncated is True
+        lightrag_client.client.stream.assert_called_once_with(
+            "GET", "http://localhost:9621/graphs", params={"label": "A", "max_depth": 2}
+        )
+    
     async def test_get_graph_labels_success(self, lightrag_client, mock_response):
         """Test successful graph labels retrieval."""
         # Setup mock
@@ -403,6 +635,15 @@ class TestKnowledgeGraphMethods:
             "http://localhost:9621/graph/label/list", params=None
         )
     
+    async def test_get_graph_labels_list_response(self, lightrag_client, mock_response):
+        """Test the plain label list returned by LightRAG is kept as entity labels."""
+        response = mock_response(200, ["Person", "Organization"])
+        lightrag_client.client.get = AsyncMock(return_value=response)
+        
+        result = await lightrag_client.get_graph_labels()
+        
+        assert result.entity_labels == ["Person", "Organization"]
+    
     async def test_check_entity_exists_success(self, lightrag_client, mock_response):
         """Test successful entity existence check."""
         # Setup mock
@@ -422,6 +663,77 @@ class TestKnowledgeGraphMethods:
             params={"entity_name": "Test Entity"}
         )
     
+    async def test_check_entities_exist_dedupes_and_caches(self, lightrag_client, mock_response):
+        """Test batched existence checks deduplicate names and reuse cached answers."""
+        async def get(url, params=None):
+            return mock_response(200, {"exists": params["name"].startswith("known")})
+        lightrag_client.client.get = AsyncMock(side_effect=get)
+        
+        first = await lightrag_client.check_entities_exist(["known_a", "other", "known_a"])
+        second = await lightrag_client.check_entities_exist(["known_a", "known_b"])
+        
+        assert first.results == {"known_a": True, "other": False}
+        assert first.requests_made == 2
+        assert second.results == {"known_a": True, "known_b": True}
+        assert second.cache_hits == 1
+        assert lightrag_client.client.get.await_count == 3
+    
+    async def test_check_entities_exist_cache_invalidated_by_delete(self, lightrag_client, mock_response):
+        """Test deleting an entity drops its cached existence answer."""
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"exists": True}))
+        lightrag_client.client.request = AsyncMock(
+            return_value=mock_response(200, {"deleted": True, "id": "ent", "type": "entity"})
+        )
+        await lightrag_client.check_entities_exist(["ent"])
+        
+        await lightrag_client.delete_entity("ent")
+        result = await lightrag_client.check_entities_exist(["ent"])
+        
+        assert result.cache_hits == 0
+        assert result.requests_made == 1
+    
+    async def test_check_entities_exist_negative_answers_dropped_by_ingestion(self, lightrag_client, mock_response):
+        """Test "does not exist" answers are forgotten once documents are inserted."""
+        async def get(url, params=None):
+            return mock_response(200, {"exists": params["name"] == "known"})
+        lightrag_client.client.get = AsyncMock(side_effect=get)
+        lightrag_client.client.post = AsyncMock(
+            return_value=mock_response(200, {"status": "success", "message": "ok", "track_id": "t1"})
+        )
+        await lightrag_client.check_entities_exist(["known", "new"])
+        
+        await lightrag_client.insert_text("text mentioning new")
+        result = await lightrag_client.check_entities_exist(["known", "new"])
+        
+        assert result.cache_hits == 1
+        assert result.requests_made == 1
+    
+    async def test_check_entities_exist_cache_cleared_by_clear_documents(self, lightrag_client, mock_response):
+        """Test clearing every document drops positive existence answers too."""
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"exists": True}))
+        lightrag_client.client.delete = AsyncMock(
+            return_value=mock_response(200, {"status": "success", "message": "cleared"})
+        )
+        await lightrag_client.check_entities_exist(["a", "b"])
+        
+        await lightrag_client.clear_documents()
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"exists": False}))
+        result = await lightrag_client.check_entities_exist(["a", "b"])
+        
+        assert result.cache_hits == 0
+        assert result.results == {"a": False, "b": False}
+    
+    async def test_check_entities_exist_cache_is_bounded(self, lightrag_client, mock_response):
+        """Test the least recently used answers are evicted beyond entity_cache_size."""
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"exists": True}))
+        lightrag_client.entity_cache_size = 2
+        
+        await lightrag_client.check_entities_exist(["a", "b"])
+        await lightrag_client.check_entities_exist(["a"])
+        await lightrag_client.check_entities_exist(["c"])
+        
+        assert list(lightrag_client._entity_exists_cache) == ["a", "c"]
+    
     async def test_update_entity_success(self, lightrag_client, mock_response):
         """Test successful entity update."""
         # Setup mock
@@ -460,6 +772,220 @@ class TestKnowledgeGraphMethods:
         assert result.relation_id == "rel_123"
         lightrag_client.client.post.assert_called_once()
     
+    async def test_update_entities_orders_edits_per_entity(self, lightrag_client, mock_response):
+        """Test edits to one entity are applied in request order while others run concurrently."""
+        applied = []
+        
+        async def post(url, json=None):
+            applied.append((json["entity_name"], json["updated_data"]))
+            await asyncio.sleep(0.01 if json["updated_data"].get("slow") else 0)
+            return mock_response(200, {"status": "success", "message": "ok", "data": json["updated_data"]})
+        lightrag_client.client.post = AsyncMock(side_effect=post)
+        
+        result = await lightrag_client.update_entities([
+            {"entity_name": "A", "updated_data": {"step": 1, "slow": True}},
+            {"entity_name": "B", "updated_data": {"step": 1}},
+            {"entity_name": "A", "updated_data": {"step": 2}},
+        ])
+        
+        assert result.succeeded == 3
+        assert [data["step"] for name, data in applied if name == "A"] == [1, 2]
+        assert [item.index for item in result.results] == [0, 1, 2]
+    
+    async def test_update_entities_skips_after_failure(self, lightrag_client, mock_response):
+        """Test a failed edit skips later edits to the same entity only."""
+        async def post(url, json=None):
+            if json["updated_data"].get("fail"):
+                return mock_response(500, {"detail": "boom"}, "boom")
+            return mock_response(200, {"status": "success", "message": "ok", "data": {}})
+        lightrag_client.client.post = AsyncMock(side_effect=post)
+        
+        result = await lightrag_client.update_entities([
+            {"entity_name": "A", "updated_data": {"fail": True}},
+            {"entity_name": "A", "updated_data": {"description": "x"}},
+            {"entity_name": "B", "updated_data": {"description": "y"}},
+        ])
+        
+        assert [item.status for item in result.results] == ["error", "skipped", "success"]
+        assert result.failed == 2
+    
+    async def test_update_relations_groups_by_pair(self, lightrag_client, mock_response):
+        """Test relation edits report the source/target pair as their key."""
+        response = mock_response(200, {"status": "success", "message": "ok", "data": {}})
+        lightrag_client.client.post = AsyncMock(return_value=response)
+        
+        result = await lightrag_client.update_relations([
+            {"source_id": "A", "target_id": "B", "updated_data": {"weight": 1.0}},
+            {"source_id": "B", "target_id": "A", "updated_data": {"weight": 2.0}},
+        ])
+        
+        assert result.succeeded == 2
+        assert [item.key for item in result.results] == ["A -> B", "B -> A"]
+    
+    async def test_write_combining_merges_edits(self, lightrag_client, mock_response):
+        """Test buffered edits to one entity are sent as a single merged edit."""
+        response = mock_response(200, {"status": "success", "message": "ok", "data": {}})
+        lightrag_client.client.post = AsyncMock(return_value=response)
+        lightrag_client.write_combine_window = 60.0
+        
+        first = await lightrag_client.update_entity("A", {"description": "old", "type": "person"})
+        second = await lightrag_client.update_entity("A", {"description": "new"})
+        
+        assert first.status == "buffered"
+        assert second.data["combined_edits"] == 2
+        lightrag_client.client.post.assert_not_called()
+        
+        result = await lightrag_client.flush_entity_edits()
+        
+        assert result.flushed == 1
+        sent = lightrag_client.client.post.call_args.kwargs["json"]
+        assert sent["updated_data"] == {"description": "new", "type": "person"}
+    
+    async def test_write_combining_flushes_after_window(self, lightrag_client, mock_response):
+        """Test the combine window timer sends pending edits without an explicit flush."""
+        response = mock_response(200, {"status": "success", "message": "ok", "data": {}})
+        lightrag_client.client.post = AsyncMock(return_value=response)
+        lightrag_client.write_combine_window = 0.01
+        
+        await lightrag_client.update_entity("A", {"description": "x"})
+        await asyncio.sleep(0.05)
+        
+        lightrag_client.client.post.assert_called_once()
+        assert lightrag_client._pending_entity_edits == {}
+    
+    async def test_write_combining_flushes_before_read(self, lightrag_client, mock_response):
+        """Test reads see buffered edits, and renames are sent immediately."""
+        response = mock_response(200, {"status": "success", "message": "ok", "data": {}})
+        lightrag_client.client.post = AsyncMock(return_value=response)
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"exists": True}))
+        lightrag_client.write_combine_window = 60.0
+        
+        await lightrag_client.update_entity("A", {"description": "x"})
+        await lightrag_client.check_entity_exists("A")
+        assert lightrag_client.client.post.call_count == 1
+        
+        await lightrag_client.update_entity("B", {"description": "y"})
+        renamed = await lightrag_client.update_entity("B", {"entity_name": "C"})
+        
+        assert renamed.status == "success"
+        assert lightrag_client.client.post.call_count == 2
+        assert lightrag_client.client.post.call_args.kwargs["json"]["updated_data"] == {
+            "description": "y", "entity_name": "C"
+        }
+    
+    async def test_write_combining_rename_taken_by_concurrent_flush(self, lightrag_client):
+        """Test a rename swept up by an already queued flush still returns a response."""
+        lightrag_client.write_combine_window = 60.0
+        release = asyncio.Event()
+        sent = []
+        
+        async def send(entity_id, entity_name, updated_data):
+            sent.append(dict(updated_data))
+            await release.wait()
+            return EntityUpdateResponse(status="success", message="ok", data={})
+        
+        async def settle():
+            for _ in range(5):
+                await asyncio.sleep(0)
+        
+        with patch.object(lightrag_client, "_send_entity_update", side_effect=send):
+            await lightrag_client.update_entity("A", {"description": "x"})
+            first = asyncio.ensure_future(lightrag_client.flush_entity_edits())
+            await settle()
+            await lightrag_client.update_entity("A", {"description": "y"})
+            queued = asyncio.ensure_future(lightrag_client.flush_entity_edits())
+            await settle()
+            rename = asyncio.ensure_future(lightrag_client.update_entity("A", {"entity_name": "B"}))
+            await settle()
+            release.set()
+            result = await rename
+            await asyncio.gather(first, queued)
+        
+        assert sent == [{"description": "x"}, {"description": "y", "entity_name": "B"}]
+        assert result.status == "flushed"
+        assert result.data == {"entity_name": "A", "new_name": "B"}
+    
+    async def test_write_combining_flushed_on_close(self, lightrag_client, mock_response):
+        """Test closing the client sends pending edits and leaves no per-entity locks behind."""
+        response = mock_response(200, {"status": "success", "message": "ok", "data": {}})
+        lightrag_client.client.post = AsyncMock(return_value=response)
+        lightrag_client.client.aclose = AsyncMock()
+        lightrag_client.write_combine_window = 60.0
+        
+        await lightrag_client.update_entity("A", {"description": "x"})
+        await lightrag_client.update_entity("B", {"description": "y"})
+        await lightrag_client.__aexit__(None, None, None)
+        
+        assert lightrag_client.client.post.call_count == 2
+        assert lightrag_client._pending_entity_edits == {}
+        assert lightrag_client._entity_flush_locks == {}
+        lightrag_client.client.aclose.assert_called_once()
+    
+    async def test_update_entity_skips_unchanged_fields(self, lightrag_client, mock_response):
+        """Test edits are diffed against properties seen in the knowledge graph."""
+        lightrag_client.edit_state_ttl = 300.0
+        graph = {
+            "nodes": [{"id": "A", "labels": ["A"], "properties": {"description": "same", "entity_type": "person"}}],
+            "edges": [{"source": "A", "target": "B", "properties": {"weight": 1.0}}],
+        }
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, graph))
+        lightrag_client.client.post = AsyncMock(
+            return_value=mock_response(200, {"status": "success", "message": "ok", "data": {}})
+        )
+        await lightrag_client.get_knowledge_graph()
+        
+        unchanged = await lightrag_client.update_entity("A", {"description": "same"})
+        partial = await lightrag_client.update_entity("A", {"description": "same", "entity_type": "org"})
+        relation = await lightrag_client.update_relation("B", "A", {"weight": 1.0})
+        
+        assert unchanged.status == "unchanged"
+        assert relation.status == "unchanged"
+        assert partial.status == "success"
+        lightrag_client.client.post.assert_called_once()
+        assert lightrag_client.client.post.call_args.kwargs["json"]["updated_data"] == {"entity_type": "org"}
+    
+    async def test_update_entities_reports_unchanged_edits(self, lightrag_client, mock_response):
+        """Test repeating an applied edit is skipped and counted as unchanged."""
+        lightrag_client.edit_state_ttl = 300.0
+        lightrag_client.client.post = AsyncMock(
+            return_value=mock_response(200, {"status": "success", "message": "ok", "data": {}})
+        )
+        
+        result = await lightrag_client.update_entities([
+            {"entity_name": "A", "updated_data": {"description": "x"}},
+            {"entity_name": "A", "updated_data": {"description": "x"}},
+        ])
+        
+        assert result.succeeded == 2
+        assert result.unchanged == 1
+        lightrag_client.client.post.assert_called_once()
+    
+    async def test_edits_sent_by_default(self, lightrag_client, mock_response):
+        """Test no-op skipping is off by default, so a repeated edit is still sent."""
+        lightrag_client.client.post = AsyncMock(
+            return_value=mock_response(200, {"status": "success", "message": "ok", "data": {}})
+        )
+        
+        await lightrag_client.update_entity("A", {"description": "x"})
+        result = await lightrag_client.update_entity("A", {"description": "x"})
+        
+        assert result.status == "success"
+        assert lightrag_client.client.post.call_count == 2
+    
+    async def test_edit_state_dropped_after_ingestion(self, lightrag_client, mock_response):
+        """Test known properties are forgotten when documents change."""
+        lightrag_client.edit_state_ttl = 300.0
+        lightrag_client.client.post = AsyncMock(
+            return_value=mock_response(200, {"status": "success", "message": "ok", "data": {}, "track_id": "t"})
+        )
+        await lightrag_client.update_entity("A", {"description": "x"})
+        await lightrag_client.insert_text("new facts about A")
+        
+        result = await lightrag_client.update_entity("A", {"description": "x"})
+        
+        assert result.status == "success"
+        assert lightrag_client.client.post.call_count == 3
+    
     async def test_delete_entity_success(self, lightrag_client, mock_response):
         """Test successful entity deletion."""
         # Setup mock
@@ -606,6 +1132,80 @@ class TestSystemManagementMethods:
         )
 
 
+@pytest.mark.asyncio
+class TestIngestionWaitMethods:
+    """Test insert/upload methods that wait for ingestion to finish."""
+    
+    async def test_wait_for_track_until_processed(self, lightrag_client, mock_response):
+        """Test waiting polls track status until every document is processed."""
+        pending = {"track_id": "track_123", "documents": [{"id": "doc_1", "status": "processing"}], "total_count": 1}
+        done = {"track_id": "track_123", "documents": [{"id": "doc_1", "status": "processed"}], "total_count": 1}
+        lightrag_client.client.get = AsyncMock(side_effect=[mock_response(200, pending), mock_response(200, done)])
+        
+        with patch("daniel_lightrag_mcp.client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = await lightrag_client.wait_for_track("track_123", timeout=10.0)
+        
+        assert result.completed is True
+        assert result.status == "processed"
+        assert result.polls == 2
+        mock_sleep.assert_awaited_once()
+    
+    async def test_ingestion_invalidates_graph_state(self, lightrag_client, mock_response):
+        """Test known graph state is dropped on scan and again when a waited track finishes."""
+        lightrag_client.edit_state_ttl = 300.0
+        done = {"track_id": "track_123", "documents": [{"id": "doc_1", "status": "processed"}], "total_count": 1}
+        lightrag_client.client.post = AsyncMock(
+            return_value=mock_response(200, {"status": "scanning_started", "message": "ok", "track_id": "scan_1"})
+        )
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, done))
+        
+        lightrag_client._remember_state(lightrag_client._entity_state, "A", {"description": "old"})
+        await lightrag_client.scan_documents()
+        assert lightrag_client._entity_state == {}
+        
+        lightrag_client._remember_state(lightrag_client._entity_state, "A", {"description": "old"})
+        generation = lightrag_client.graph_generation
+        await lightrag_client.wait_for_track("track_123", timeout=10.0)
+        assert lightrag_client._entity_state == {}
+        assert lightrag_client.graph_generation > generation
+    
+    async def test_wait_for_track_reports_failure(self, lightrag_client, mock_response):
+        """Test a failed document ends the wait with a failed status."""
+        failed = {"track_id": "track_123", "documents": [{"id": "doc_1", "status": "failed"}], "total_count": 1}
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, failed))
+        
+        result = await lightrag_client.wait_for_track("track_123")
+        
+        assert result.completed is True
+        assert result.status == "failed"
+    
+    async def test_wait_for_track_timeout(self, lightrag_client, mock_response):
+        """Test the wait returns a timeout status once the deadline passes."""
+        pending = {"track_id": "track_123", "documents": [], "total_count": 0}
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, pending))
+        
+        result = await lightrag_client.wait_for_track("track_123", timeout=0.0)
+        
+        assert result.completed is False
+        assert result.status == "timeout"
+        assert result.polls == 1
+    
+    async def test_insert_text_and_wait(self, lightrag_client, mock_response):
+        """Test inserting text waits on the returned track ID."""
+        insert = {"status": "success", "message": "ok", "track_id": "track_123"}
+        done = {"track_id": "track_123", "documents": [{"id": "doc_1", "status": "processed"}], "total_count": 1}
+        lightrag_client.client.post = AsyncMock(return_value=mock_response(200, insert))
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, done))
+        
+        result = await lightrag_client.insert_text_and_wait("test content")
+        
+        assert result.track_id == "track_123"
+        assert result.status == "processed"
+        lightrag_client.client.get.assert_called_once_with(
+            "http://localhost:9621/documents/track_status/track_123", params=None
+        )
+
+
 @pytest.mark.asyncio
 class TestErrorHandling:
     """Test error handling in client methods."""
@@ -649,6 +1249,7 @@ class TestErrorHandling:
         response.status_code = 200
         response.raise_for_status = MagicMock()
         response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        response.content = b"Invalid JSON response"
         response.text = "Invalid JSON response"
         response.headers = {}  # Add proper headers mock
         
@@ -658,6 +1259,16 @@ class TestErrorHandling:
         with pytest.raises(LightRAGError, match="Invalid JSON response"):
             await lightrag_client.get_health()
     
+    async def test_streamed_json_truncated_body(self, lightrag_client, mock_streaming_response):
+        """Test a truncated streamed JSON body raises an API error."""
+        stream_context = AsyncMock()
+        stream_context.__aenter__ = AsyncMock(return_value=mock_streaming_response(['{"nodes": [{"id": "A"}, {"id"']))
+        stream_context.__aexit__ = AsyncMock(return_value=None)
+        lightrag_client.client.stream = MagicMock(return_value=stream_context)
+        
+        with pytest.raises(LightRAGAPIError, match="Invalid JSON response"):
+            await lightrag_client.get_knowledge_graph_compact()
+    
     async def test_streaming_error_handling(self, lightrag_client):
         """Test error handling in streaming requests."""
         # Setup mock to raise HTTP error in streaming
@@ -0,0 +1,110 @@
+"""
+Unit tests for the pluggable JSON codec.
+"""
+
+import json
+
+import pytest
+
+from daniel_lightrag_mcp import codec as codec_module
+from daniel_lightrag_mcp.codec import JSONCodec, dump_plain
+from daniel_lightrag_mcp.models import DocumentInfo, GraphResponse, PagedResultResponse, PaginatedDocsResponse
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def codec(request):
+    if request.param != "json" and getattr(codec_module, request.param) is None:
+        pytest.skip(f"{request.param} is not installed")
+    return JSONCodec(request.param)
+
+
+class TestJSONCodec:
+    """Test every installed backend produces the same JSON."""
+
+    def test_compact_by_default(self, codec):
+        """Test default output is minified UTF-8 that round-trips."""
+        value = {"id": "Zürich", "nodes": [1, 2.5, None, True], "nested": {"a": "b"}}
+
+        text = codec.dumps(value)
+
+        assert text == '{"id":"Zürich","nodes":[1,2.5,null,true],"nested":{"a":"b"}}'
+        assert codec.loads(text) == value
+        assert codec.loads(text.encode("utf-8")) == value
+
+    def test_indent(self, codec):
+        """Test indented output matches the stdlib layout."""
+        value = {"a": [1, {"b": "c"}]}
+
+        assert codec.dumps(value, indent=True) == json.dumps(value, indent=2)
+
+    def test_non_string_keys_and_big_ints(self, codec):
+        """Test integer keys are stringified and huge integers still encode."""
+        assert codec.loads(codec.dumps({1: 2})) == {"1": 2}
+        assert codec.loads(codec.dumps({"n": 2 ** 70})) == {"n": 2 ** 70}
+
+    def test_invalid_input_raises_json_decode_error(self, codec):
+        """Test every backend reports invalid JSON as JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b'{"a": ')
+
+    def test_unknown_codec(self):
+        """Test unknown codec names are rejected."""
+        with pytest.raises(ValueError):
+            JSONCodec("yaml")
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch):
+        """Test auto falls back to the stdlib when no fast backend is installed."""
+        monkeypatch.setattr(codec_module, "orjson", None)
+        monkeypatch.setattr(codec_module, "msgspec", None)
+
+        assert JSONCodec("auto").name == "json"
+
+
+def _sample_results():
+    graph = GraphResponse(
+        nodes=[{"id": f"n{i}", "properties": {"tags": ["a", "b"], "extra": {}}} for i in range(7)],
+        edges=[],
+    )
+    documents = PaginatedDocsResponse(
+        documents=[DocumentInfo(id=f"doc_{i}", status="processed", metadata={"pages": [1]}) for i in range(5)],
+        pagination={"page": 1, "page_size": 10, "total_count": 5, "total_pages": 1, "has_next": False, "has_prev": False},
+    )
+    page = PagedResultResponse(tool="get_knowledge_graph", items={"nodes": [{"id": "A"}] * 4, "edges": []})
+    return [graph, documents, page]
+
+
+class TestIterencode:
+    """Test incremental encoding matches encoding a full model_dump()."""
+
+    @pytest.mark.parametrize("indent", [False, True])
+    @pytest.mark.parametrize("chunk_items", [1, 2, 1000])
+    def test_matches_dumps_of_model_dump(self, codec, indent, chunk_items):
+        """Test the joined pieces equal dumps() of the dumped model."""
+        for result in _sample_results():
+            expected = codec.dumps(result.model_dump(), indent=indent)
+
+            assert "".join(codec.iterencode(result, indent=indent, chunk_items=chunk_items)) == expected
+
+    def test_plain_values(self, codec):
+        """Test non-model values, including empty containers."""
+        for value in ([1, 2, 3, 4, 5], [], {}, {"a": [1, 2, 3]}, "text"):
+            for indent in (False, True):
+                assert "".join(codec.iterencode(value, indent=indent, chunk_items=2)) == codec.dumps(value, indent=indent)
+
+    def test_long_lists_yield_several_pieces(self):
+        """Test long lists are encoded a chunk at a time."""
+        graph = GraphResponse(nodes=[{"id": str(i)} for i in range(10)])
+
+        assert len(list(JSONCodec("json").iterencode(graph, chunk_items=3))) > 4
+
+
+class TestDumpPlain:
+    """Test copy-free dumping of models."""
+
+    def test_matches_model_dump_without_copying(self):
+        """Test plain containers are shared with the model."""
+        for result in _sample_results():
+            assert dump_plain(result) == result.model_dump()
+
+        graph = _sample_results()[0]
+        assert dump_plain(graph)["nodes"] is graph.nodes
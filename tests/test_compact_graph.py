@@ -0,0 +1,78 @@
+"""
+Unit tests for the columnar compact graph representation.
+"""
+
+import pytest
+
+from daniel_lightrag_mcp.compact_graph import CompactGraph, DEFAULT_EDGE_WEIGHT
+from daniel_lightrag_mcp.models import GraphResponse
+
+
+@pytest.fixture
+def graph_data():
+    return {
+        "nodes": [
+            {"id": "A", "labels": ["A"], "properties": {"entity_type": "person", "description": "a"}},
+            {"id": "B", "labels": ["B"], "properties": {"entity_type": "person"}},
+        ],
+        "edges": [
+            {"id": "A-B", "type": "DIRECTED", "source": "A", "target": "B", "properties": {"weight": 2.5}},
+            {"id": "B-C", "type": "DIRECTED", "source": "B", "target": "C", "properties": {}},
+        ],
+        "is_truncated": True,
+    }
+
+
+class TestCompactGraph:
+    """Test columnar storage and conversion."""
+
+    def test_columns_and_interning(self, graph_data):
+        """Test endpoints, weights and types are stored as integer/float columns."""
+        graph = CompactGraph.from_response(graph_data)
+
+        assert graph.node_ids == ["A", "B", "C"]
+        assert list(graph.sources) == [0, 1]
+        assert list(graph.targets) == [1, 2]
+        assert list(graph.weights) == [2.5, DEFAULT_EDGE_WEIGHT]
+        assert graph.strings == ["person", "DIRECTED"]
+        assert list(graph.node_types) == [0, 0, -1]
+        assert list(graph.edge_types) == [1, 1]
+
+    def test_lazy_properties(self, graph_data):
+        """Test properties are decoded on access."""
+        graph = CompactGraph.from_response(graph_data)
+
+        assert graph.node_properties(0) == {"entity_type": "person", "description": "a"}
+        assert graph.node_properties(graph.node_position("C")) == {}
+        assert graph.edge_properties(0) == {"weight": 2.5}
+
+    def test_structure_only(self, graph_data):
+        """Test a graph built without properties keeps columns but encodes no blobs."""
+        graph = CompactGraph.from_response(graph_data, include_properties=False)
+
+        assert list(graph.sources) == [0, 1]
+        assert list(graph.weights) == [2.5, DEFAULT_EDGE_WEIGHT]
+        assert list(graph.node_types) == [0, 0, -1]
+        assert graph.node_properties(0) == {}
+        assert graph.edge(0) == {"source": "A", "target": "B"}
+        assert graph.nbytes() < CompactGraph.from_response(graph_data).nbytes()
+
+    def test_round_trip(self, graph_data):
+        """Test materializing returns the original nodes and edges."""
+        original = GraphResponse(**graph_data)
+
+        restored = CompactGraph.from_graph(original).to_graph_response()
+
+        assert restored.nodes[:2] == original.nodes
+        assert restored.nodes[2] == {"id": "C"}
+        assert restored.edges == original.edges
+        assert restored.is_truncated is True
+
+    def test_columnar_output(self, graph_data):
+        """Test the JSON-ready columnar encoding."""
+        columnar = CompactGraph.from_response(graph_data).to_columnar(include_properties=False)
+
+        assert columnar["format"] == "columnar"
+        assert columnar["nodes"] == {"id": ["A", "B", "C"], "entity_type": [0, 0, -1]}
+        assert columnar["edges"]["source"] == [0, 1]
+        assert "properties" not in columnar["edges"]
@@ -0,0 +1,69 @@
+"""
+Unit tests for near-duplicate entity detection.
+"""
+
+import pytest
+
+from daniel_lightrag_mcp import entity_dedup
+from daniel_lightrag_mcp.entity_dedup import choose_bands, find_duplicates, minhash_signatures, shingles
+
+
+LABELS = [
+    "OpenAI", "Open AI", "OpenAI Inc.",
+    "Anthropic", "Anthropic PBC",
+    "Microsoft", "LightRAG", "Google", "!!!",
+]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(entity_dedup, "np", None)
+    elif entity_dedup.np is None:
+        pytest.skip("numpy is not installed")
+    return request.param
+
+
+class TestEntityDedup:
+    """Test MinHash/LSH duplicate grouping on both backends."""
+
+    def test_groups_variants(self, backend):
+        """Test spelling variants are grouped and unrelated labels are not."""
+        result = find_duplicates(LABELS, threshold=0.5)
+
+        assert result.backend == backend
+        assert [group.labels for group in result.groups] == [
+            ["Open AI", "OpenAI", "OpenAI Inc."],
+            ["Anthropic", "Anthropic PBC"],
+        ]
+        assert result.groups[0].max_similarity == 1.0
+        assert 0.5 <= result.groups[1].pairs[0].similarity < 1.0
+        assert result.total_labels == len(LABELS)
+
+    def test_high_threshold_keeps_exact_normalized_matches(self, backend):
+        """Test a threshold of 1.0 only groups labels that normalize identically."""
+        result = find_duplicates(LABELS, threshold=1.0)
+
+        assert [group.labels for group in result.groups] == [["Open AI", "OpenAI"]]
+
+    def test_limit(self, backend):
+        """Test the limit caps returned groups but not the total."""
+        result = find_duplicates(LABELS, limit=1)
+
+        assert len(result.groups) == 1
+        assert result.total_groups == 2
+
+    def test_backends_agree(self, monkeypatch):
+        """Test NumPy and pure-Python signatures are identical."""
+        if entity_dedup.np is None:
+            pytest.skip("numpy is not installed")
+        sets = [shingles(label) for label in LABELS if shingles(label)]
+        vectorized = minhash_signatures(sets, num_perm=32)
+        monkeypatch.setattr(entity_dedup, "np", None)
+
+        assert minhash_signatures(sets, num_perm=32) == vectorized
+
+    def test_choose_bands(self):
+        """Test the band layout puts the LSH threshold at or below the target."""
+        assert choose_bands(64, 0.5) == (16, 4)
+        assert choose_bands(64, 0.9) == (8, 8)
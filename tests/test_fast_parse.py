@@ -0,0 +1,46 @@
+"""
+Unit tests for trusted fast-path response parsing.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from daniel_lightrag_mcp.fast_parse import parse_trusted
+from daniel_lightrag_mcp.models import DocStatus, GraphResponse, LabelsResponse, PaginatedDocsResponse
+
+
+class TestParseTrusted:
+    """Test top-level validation and fallback to full validation."""
+
+    def test_untyped_lists_kept_without_copying(self):
+        """Test graph node and edge lists are taken as-is."""
+        data = {"nodes": [{"id": "A"}], "edges": [], "is_truncated": "true"}
+
+        graph = parse_trusted(GraphResponse, data)
+
+        assert graph.nodes is data["nodes"]
+        assert graph.is_truncated is True
+        assert graph == GraphResponse(**data)
+
+    def test_nested_models_still_validated(self):
+        """Test typed nested models and scalar fields are validated."""
+        data = {
+            "documents": [{"id": "doc_1", "status": "processed"}],
+            "pagination": {"page": 1, "page_size": 10, "total_count": 1, "total_pages": 1, "has_next": False, "has_prev": False},
+        }
+
+        result = parse_trusted(PaginatedDocsResponse, data)
+
+        assert result.documents[0].status is DocStatus.PROCESSED
+        assert result.pagination.total_count == 1
+
+    def test_defaults_for_missing_optional_fields(self):
+        """Test omitted optional fields get their defaults."""
+        assert parse_trusted(LabelsResponse, {"entity_labels": ["A"]}).relation_labels == []
+
+    def test_invalid_top_level_falls_back_to_validation(self):
+        """Test bad top-level data raises the usual validation error."""
+        with pytest.raises(ValidationError):
+            parse_trusted(GraphResponse, {"nodes": "not a list"})
+        with pytest.raises(ValidationError):
+            parse_trusted(PaginatedDocsResponse, {"documents": []})
@@ -0,0 +1,95 @@
+"""
+Unit tests for graph snapshot versioning and deltas.
+"""
+
+from daniel_lightrag_mcp.graph_delta import GraphSnapshotStore, fingerprint
+from daniel_lightrag_mcp.models import GraphResponse
+
+
+def make_graph(nodes, edges):
+    return GraphResponse(
+        nodes=[{"id": node_id, "properties": {"description": description}} for node_id, description in nodes],
+        edges=[{"source": source, "target": target, "properties": {}} for source, target in edges],
+    )
+
+
+class TestFingerprint:
+    """Test element fingerprints."""
+
+    def test_key_order_does_not_matter(self):
+        """Test fingerprints are computed from canonical JSON."""
+        assert fingerprint({"a": 1, "b": {"c": 2}}) == fingerprint({"b": {"c": 2}, "a": 1})
+        assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+class TestGraphSnapshotStore:
+    """Test snapshot recording and diffing."""
+
+    def test_first_call_reports_everything_added(self):
+        """Test a delta without a base version returns the full graph."""
+        store = GraphSnapshotStore()
+
+        delta = store.diff("*", make_graph([("A", "a")], [("A", "B")]))
+
+        assert delta.version == 1
+        assert delta.base_found is False
+        assert [node["id"] for node in delta.added_nodes] == ["A"]
+        assert len(delta.added_edges) == 1
+
+    def test_added_changed_and_removed(self):
+        """Test each kind of change is reported against the base version."""
+        store = GraphSnapshotStore()
+        base = store.diff("*", make_graph([("A", "a"), ("B", "b"), ("C", "c")], [("A", "B"), ("B", "C")]))
+
+        delta = store.diff(
+            "*", make_graph([("A", "a"), ("B", "b2"), ("D", "d")], [("A", "B"), ("A", "D")]), base.version
+        )
+
+        assert delta.base_found is True
+        assert delta.version == base.version + 1
+        assert [node["id"] for node in delta.added_nodes] == ["D"]
+        assert [node["id"] for node in delta.changed_nodes] == ["B"]
+        assert delta.removed_node_ids == ["C"]
+        assert [(edge["source"], edge["target"]) for edge in delta.added_edges] == [("A", "D")]
+        assert delta.removed_edges == [{"source": "B", "target": "C"}]
+
+    def test_swapped_edge_endpoints_are_unchanged(self):
+        """Test an undirected edge returned with its endpoints swapped is not reported as a change."""
+        store = GraphSnapshotStore()
+        base = store.diff("*", make_graph([("A", "a"), ("B", "b")], [("A", "B")]))
+
+        delta = store.diff("*", make_graph([("A", "a"), ("B", "b")], [("B", "A")]), base.version)
+
+        assert delta.version == base.version
+        assert delta.added_edges == [] and delta.changed_edges == [] and delta.removed_edges == []
+
+    def test_unchanged_graph_keeps_version(self):
+        """Test refetching an unchanged graph reuses the latest version."""
+        store = GraphSnapshotStore()
+        graph = make_graph([("A", "a")], [])
+        first = store.diff("*", graph)
+
+        second = store.diff("*", graph, first.version)
+
+        assert second.version == first.version
+        assert second.added_nodes == [] and second.changed_nodes == []
+
+    def test_evicted_version_falls_back_to_full(self):
+        """Test a base version older than the retained history is treated as unknown."""
+        store = GraphSnapshotStore(max_versions=1)
+        first = store.diff("*", make_graph([("A", "a")], []))
+        store.diff("*", make_graph([("A", "a2")], []))
+
+        delta = store.diff("*", make_graph([("A", "a3")], []), first.version)
+
+        assert delta.base_found is False
+        assert [node["id"] for node in delta.added_nodes] == ["A"]
+
+    def test_versions_are_tracked_per_query(self):
+        """Test snapshots for different labels do not mix."""
+        store = GraphSnapshotStore()
+        whole = store.diff("*", make_graph([("A", "a")], []))
+
+        delta = store.diff("B", make_graph([("B", "b")], []), whole.version)
+
+        assert delta.base_found is False
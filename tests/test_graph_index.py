@@ -0,0 +1,110 @@
+"""
+Unit tests for the local knowledge graph index.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from daniel_lightrag_mcp.graph_index import GraphIndex, GraphIndexCache
+from daniel_lightrag_mcp.models import GraphResponse
+
+
+@pytest.fixture
+def graph():
+    return GraphResponse(
+        nodes=[
+            {"id": "A", "properties": {"entity_type": "person"}},
+            {"id": "B", "properties": {"entity_type": "org"}},
+            {"id": "C", "properties": {"entity_type": "place"}},
+        ],
+        edges=[
+            {"id": "A-B", "source": "A", "target": "B"},
+            {"id": "A-C", "source": "A", "target": "C"},
+            {"id": "C-B", "source": "C", "target": "B"},
+            {"id": "B-D", "source": "B", "target": "D"},
+        ],
+        is_truncated=True,
+    )
+
+
+class TestGraphIndex:
+    """Test CSR adjacency lookups."""
+
+    def test_neighbors_by_direction(self, graph):
+        """Test outgoing, incoming and combined neighbor lists."""
+        index = GraphIndex(graph)
+
+        assert index.neighbors("A", "out") == ["B", "C"]
+        assert index.neighbors("B", "in") == ["A", "C"]
+        assert index.neighbors("B") == ["D", "A", "C"]
+        assert index.neighbors("missing") == []
+
+    def test_degree(self, graph):
+        """Test degree counts per direction."""
+        index = GraphIndex(graph)
+
+        assert index.degree("B") == 3
+        assert index.degree("B", "out") == 1
+        assert index.degree("missing") == 0
+
+    def test_edge_lookup(self, graph):
+        """Test edges are found in either orientation unless directed."""
+        index = GraphIndex(graph)
+
+        assert index.edge("A", "B")["id"] == "A-B"
+        assert index.edge("B", "A")["id"] == "A-B"
+        assert index.edge("B", "A", directed=True) is None
+
+    def test_edges_to_unlisted_nodes_are_interned(self, graph):
+        """Test edge endpoints missing from the node list still get an index entry."""
+        index = GraphIndex(graph)
+
+        assert "D" in index
+        assert index.node("D") == {"id": "D"}
+        assert index.node_count == 4
+        assert index.edge_count == 4
+
+    def test_invalid_direction(self, graph):
+        """Test an unknown direction is rejected."""
+        with pytest.raises(ValueError):
+            GraphIndex(graph).degree("A", "sideways")
+
+
+@pytest.mark.asyncio
+class TestGraphIndexCache:
+    """Test snapshot refresh and local queries."""
+
+    @pytest.fixture
+    def fake_client(self, graph):
+        client = MagicMock()
+        client.graph_generation = 0
+        client.get_knowledge_graph = AsyncMock(return_value=graph)
+        return client
+
+    async def test_snapshot_reused_until_stale(self, fake_client):
+        """Test lookups share one snapshot until the client edits the graph."""
+        cache = GraphIndexCache(fake_client, refresh_interval=60)
+
+        await cache.neighbors("A")
+        await cache.degrees(["A", "B"])
+        assert fake_client.get_knowledge_graph.await_count == 1
+
+        fake_client.graph_generation += 1
+        await cache.lookup_edge("A", "B")
+        assert fake_client.get_knowledge_graph.await_count == 2
+
+    async def test_query_responses(self, fake_client):
+        """Test the response models built from the snapshot."""
+        cache = GraphIndexCache(fake_client)
+
+        neighbors = await cache.neighbors("A", direction="out", limit=1)
+        degrees = await cache.degrees(["B", "Z"])
+        edge = await cache.lookup_edge("C", "A")
+
+        assert neighbors.degree == 2
+        assert [node["id"] for node in neighbors.neighbors] == ["B"]
+        assert neighbors.is_truncated is True
+        assert degrees.degrees == {"B": 3}
+        assert degrees.missing == ["Z"]
+        assert edge.found is True
+        assert edge.edge["id"] == "A-C"
@@ -0,0 +1,75 @@
+"""
+Unit tests for local graph analytics.
+"""
+
+import pytest
+
+from daniel_lightrag_mcp import graph_stats
+from daniel_lightrag_mcp.compact_graph import CompactGraph
+from daniel_lightrag_mcp.graph_stats import compute_graph_stats
+
+
+@pytest.fixture
+def graph():
+    # Triangle A-B-C with a tail to D, plus isolated E
+    return CompactGraph.from_response({
+        "nodes": [{"id": node_id} for node_id in "ABCDE"],
+        "edges": [
+            {"source": "A", "target": "B"},
+            {"source": "B", "target": "C"},
+            {"source": "A", "target": "C"},
+            {"source": "C", "target": "D"},
+        ],
+    })
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(graph_stats, "np", None)
+    elif graph_stats.np is None:
+        pytest.skip("numpy is not installed")
+    return request.param
+
+
+class TestGraphStats:
+    """Test degree, component and PageRank metrics on both backends."""
+
+    def test_degree_distribution(self, graph, backend):
+        """Test degree summary, histogram and top nodes."""
+        stats = compute_graph_stats(graph, metrics=["degree"], top_k=2)
+
+        assert stats.backend == backend
+        assert stats.degree.histogram == {0: 1, 1: 1, 2: 2, 3: 1}
+        assert stats.degree.max == 3
+        assert stats.degree.median == 2.0
+        assert stats.degree.top[0] == {"id": "C", "degree": 3}
+        assert stats.pagerank is None
+
+    def test_components(self, graph, backend):
+        """Test component count, sizes and isolated nodes."""
+        stats = compute_graph_stats(graph, metrics=["components"])
+
+        assert stats.components.count == 2
+        assert stats.components.sizes == [4, 1]
+        assert stats.components.isolated_nodes == 1
+
+    def test_pagerank(self, graph, backend):
+        """Test PageRank converges, sums to one and ranks the hub first."""
+        stats = compute_graph_stats(graph, metrics=["pagerank"], top_k=5)
+
+        assert stats.pagerank.converged is True
+        assert stats.pagerank.top[0]["id"] == "C"
+        assert sum(item["score"] for item in stats.pagerank.top) == pytest.approx(1.0)
+
+    def test_time_budget_stops_pagerank(self, graph, backend):
+        """Test an exhausted budget is reported instead of running PageRank to convergence."""
+        stats = compute_graph_stats(graph, metrics=["pagerank"], time_budget=1e-9, tolerance=0)
+
+        assert stats.budget_exhausted is True
+        assert stats.pagerank is None or stats.pagerank.converged is False
+
+    def test_unknown_metric(self, graph):
+        """Test unknown metric names are rejected."""
+        with pytest.raises(ValueError):
+            compute_graph_stats(graph, metrics=["betweenness"])
@@ -0,0 +1,78 @@
+"""
+Unit tests for incremental JSON parsing of large response bodies.
+"""
+
+import json
+
+import pytest
+
+from daniel_lightrag_mcp.json_stream import JSONStreamParser
+
+
+GRAPH = {
+    "nodes": [
+        {"id": f"node_{i}", "properties": {"description": 'quote " backslash \\ brackets ]} {[ é'}}
+        for i in range(20)
+    ],
+    "edges": [{"source": "node_1", "target": "node_2", "properties": {"weight": 1.5}}],
+    "is_truncated": False,
+    "meta": {"nested": [1, 2, {"deep": None}]},
+}
+
+
+def parse(body: bytes, stream_paths, chunk_size: int):
+    parser = JSONStreamParser(stream_paths)
+    events = []
+    for start in range(0, len(body), chunk_size):
+        events.extend(parser.feed(body[start:start + chunk_size]))
+    events.extend(parser.close())
+    return events
+
+
+class TestJSONStreamParser:
+    """Test streamed elements and whole values across chunk boundaries."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 16, 1 << 20])
+    def test_graph_elements_any_chunking(self, chunk_size):
+        """Test nodes and edges are emitted in order however the body is split."""
+        body = json.dumps(GRAPH, ensure_ascii=False, indent=2).encode("utf-8")
+
+        events = parse(body, [("nodes",), ("edges",)], chunk_size)
+
+        assert [event.value for event in events if event.path == ("nodes",)] == GRAPH["nodes"]
+        assert [event.value for event in events if event.path == ("edges",)] == GRAPH["edges"]
+        assert {event.path: event.value for event in events if not event.item} == {
+            ("is_truncated",): False,
+            ("meta",): GRAPH["meta"],
+        }
+
+    def test_elements_emitted_before_body_ends(self):
+        """Test a complete element is emitted without waiting for the rest of the body."""
+        parser = JSONStreamParser([("nodes",)])
+
+        events = parser.feed(b'{"nodes": [{"id": "A"}, {"id": "B"')
+
+        assert [event.value for event in events] == [{"id": "A"}]
+
+    def test_wildcard_path(self):
+        """Test a wildcard streams every per-status document list."""
+        body = json.dumps({"statuses": {"processed": [{"id": "a"}], "failed": [{"id": "b"}, {"id": "c"}]}}).encode()
+
+        events = parse(body, [("statuses", "*")], 5)
+
+        assert [(event.path, event.value["id"]) for event in events] == [
+            (("statuses", "processed"), "a"),
+            (("statuses", "failed"), "b"),
+            (("statuses", "failed"), "c"),
+        ]
+
+    def test_scalar_elements_and_root(self):
+        """Test arrays of scalars stream and an unstreamed root is decoded whole."""
+        assert [event.value for event in parse(b'{"labels": ["a", 1, true, null]}', [("labels",)], 2)] == ["a", 1, True, None]
+        assert [event.value for event in parse(b"[1, 2]", [("nodes",)], 1)] == [[1, 2]]
+
+    @pytest.mark.parametrize("body", [b'{"nodes": [{"id": "A"}', b'{"nodes": []} extra', b'{"nodes": [{"id": x}]}'])
+    def test_malformed_body(self, body):
+        """Test truncated, trailing and invalid data raise JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            parse(body, [("nodes",)], 4)
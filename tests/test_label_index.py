@@ -0,0 +1,69 @@
+"""
+Unit tests for the local label search index.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from daniel_lightrag_mcp.label_index import LabelIndex, LabelIndexCache, trigrams
+from daniel_lightrag_mcp.models import LabelsResponse
+
+
+LABELS = ["OpenAI", "Open Source", "Anthropic", "openai research", "Microsoft", "LightRAG"]
+
+
+class TestLabelIndex:
+    """Test prefix and fuzzy lookups."""
+
+    def test_prefix_is_case_insensitive_and_sorted(self):
+        """Test prefix search returns matching labels in sorted order."""
+        index = LabelIndex(LABELS)
+
+        matches = index.prefix("open", limit=10)
+
+        assert [match.label for match in matches] == ["Open Source", "OpenAI", "openai research"]
+        assert all(match.match_type == "prefix" for match in matches)
+
+    def test_exact_prefix_scores_one(self):
+        """Test an exact match scores 1.0 and is respected by the limit."""
+        matches = LabelIndex(LABELS).prefix("openai", limit=1)
+
+        assert [(match.label, match.score) for match in matches] == [("OpenAI", 1.0)]
+
+    def test_fuzzy_tolerates_typos(self):
+        """Test trigram similarity finds labels despite misspellings."""
+        matches = LabelIndex(LABELS).fuzzy("Antropic", limit=3)
+
+        assert matches[0].label == "Anthropic"
+        assert 0 < matches[0].score < 1
+
+    def test_auto_tops_up_prefix_with_fuzzy(self):
+        """Test auto mode appends fuzzy matches after prefix matches."""
+        matches = LabelIndex(LABELS).search("Light RAG", limit=3, mode="auto")
+
+        assert matches[0].label == "LightRAG"
+        assert matches[0].match_type == "fuzzy"
+
+    def test_trigrams_padded(self):
+        """Test trigrams include word-boundary padding."""
+        assert trigrams("ab") == {"  a", " ab", "ab "}
+
+
+@pytest.mark.asyncio
+class TestLabelIndexCache:
+    """Test index refresh."""
+
+    async def test_rebuilt_after_client_edit(self):
+        """Test the index is reused until the client reports a graph change."""
+        client = MagicMock()
+        client.graph_generation = 0
+        client.get_graph_labels = AsyncMock(return_value=LabelsResponse(entity_labels=LABELS))
+        cache = LabelIndexCache(client, refresh_interval=60)
+
+        first = await cache.search("open")
+        await cache.search("micro")
+        client.graph_generation += 1
+        await cache.search("micro")
+
+        assert first.total_labels == len(LABELS)
+        assert client.get_graph_labels.await_count == 2
@@ -0,0 +1,132 @@
+"""
+Unit tests for the local document status mirror.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from daniel_lightrag_mcp.mirror import DocumentStatusMirror
+from daniel_lightrag_mcp.models import (
+    DocumentInfo,
+    DocumentInventoryResponse,
+    StatusCountsResponse,
+)
+
+
+class FakeDocumentStore:
+    """Serve status counts and filtered inventories from an in-memory document map."""
+
+    def __init__(self, documents):
+        self.documents = dict(documents)
+        self.inventory_calls = []
+
+    async def status_counts(self):
+        counts = {}
+        for status in self.documents.values():
+            counts[status] = counts.get(status, 0) + 1
+        counts["all"] = len(self.documents)
+        return StatusCountsResponse(status_counts=counts)
+
+    async def inventory(self, page_size=100, status_filter=None, concurrency=8):
+        self.inventory_calls.append(status_filter)
+        docs = [
+            DocumentInfo(id=doc_id, status=status)
+            for doc_id, status in self.documents.items()
+            if status_filter is None or status == status_filter
+        ]
+        return DocumentInventoryResponse(documents=docs, total_count=len(docs), pages_fetched=1)
+
+
+@pytest.fixture
+def store():
+    return FakeDocumentStore({"doc_1": "processed", "doc_2": "processed", "doc_3": "pending"})
+
+
+@pytest.fixture
+def fake_client(store):
+    client = MagicMock()
+    client.get_document_status_counts = AsyncMock(side_effect=store.status_counts)
+    client.get_document_inventory = AsyncMock(side_effect=store.inventory)
+    return client
+
+
+@pytest.mark.asyncio
+class TestDocumentStatusMirror:
+    """Test incremental refresh and local queries."""
+
+    async def test_initial_refresh_loads_every_status(self, fake_client, store):
+        """Test the first refresh fetches each status bucket."""
+        mirror = DocumentStatusMirror(fake_client, refresh_interval=0)
+
+        assert await mirror.refresh() is True
+
+        assert sorted(store.inventory_calls) == ["pending", "processed"]
+        assert mirror.count() == 3
+        assert mirror.status_counts() == {"processed": 2, "pending": 1, "all": 3}
+        assert [doc.id for doc in mirror.list_documents(status="processed")] == ["doc_1", "doc_2"]
+
+    async def test_unchanged_counts_skip_fetch(self, fake_client, store):
+        """Test no documents are fetched when status counts are unchanged."""
+        mirror = DocumentStatusMirror(fake_client, refresh_interval=0)
+        await mirror.refresh()
+        store.inventory_calls.clear()
+
+        assert await mirror.refresh() is False
+        assert store.inventory_calls == []
+
+    async def test_only_changed_statuses_refetched(self, fake_client, store):
+        """Test a status transition re-fetches only the affected buckets."""
+        store.documents["doc_4"] = "failed"
+        store.documents["doc_5"] = "failed"
+        mirror = DocumentStatusMirror(fake_client, refresh_interval=0)
+        await mirror.refresh()
+        store.inventory_calls.clear()
+
+        store.documents["doc_3"] = "processed"
+        assert await mirror.refresh() is True
+
+        assert sorted(store.inventory_calls) == ["processed"]
+        assert mirror.get("doc_3").status.value == "processed"
+        assert mirror.count("pending") == 0
+        assert mirror.count("failed") == 2
+
+    async def test_refresh_interval_throttles_upstream_checks(self, fake_client):
+        """Test calls within the refresh interval are answered without upstream requests."""
+        mirror = DocumentStatusMirror(fake_client, refresh_interval=60)
+        await mirror.query()
+        await mirror.query(status="pending")
+
+        assert fake_client.get_document_status_counts.await_count == 1
+
+    async def test_forced_query_reports_refresh(self, fake_client):
+        """Test a forced query refreshes within the interval and says so."""
+        mirror = DocumentStatusMirror(fake_client, refresh_interval=60)
+        await mirror.query()
+
+        result = await mirror.query(force=True)
+
+        assert result.refreshed is True
+        assert fake_client.get_document_status_counts.await_count == 2
+
+    async def test_query_pagination_and_id_filter(self, fake_client):
+        """Test query applies offset/limit and document ID filters locally."""
+        mirror = DocumentStatusMirror(fake_client, refresh_interval=0)
+
+        page = await mirror.query(offset=1, limit=1)
+        by_id = await mirror.query(document_ids=["doc_3", "missing"])
+
+        assert page.total_count == 3
+        assert len(page.documents) == 1
+        assert [doc.id for doc in by_id.documents] == ["doc_3"]
+
+    async def test_sqlite_warm_start(self, fake_client, store, tmp_path):
+        """Test a new mirror reloads persisted documents and refreshes incrementally."""
+        db_path = str(tmp_path / "mirror.db")
+        await DocumentStatusMirror(fake_client, sqlite_path=db_path, refresh_interval=0).refresh()
+        store.inventory_calls.clear()
+
+        mirror = DocumentStatusMirror(fake_client, sqlite_path=db_path, refresh_interval=0)
+        assert await mirror.refresh() is False
+
+        assert store.inventory_calls == []
+        assert mirror.count() == 3
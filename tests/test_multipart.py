@@ -0,0 +1,74 @@
+"""
+Unit tests for streamed multipart uploads.
+"""
+
+import os
+from email import policy
+from email.parser import BytesParser
+
+import pytest
+
+from daniel_lightrag_mcp.multipart import MultipartFileBody, file_info
+
+
+async def _read_body(body):
+    return b"".join([chunk async for chunk in body])
+
+
+def _parse(body, data):
+    message = BytesParser(policy=policy.HTTP).parsebytes(
+        b"Content-Type: " + body.headers["Content-Type"].encode("ascii") + b"\r\n\r\n" + data
+    )
+    return list(message.iter_parts())
+
+
+class TestFileInfo:
+    """Test checking a file before upload."""
+
+    def test_existing_and_missing(self, tmp_path):
+        """Test size and readability are reported, and missing files are flagged."""
+        path = tmp_path / "doc.txt"
+        path.write_bytes(b"x" * 10)
+
+        assert file_info(str(path)) == (True, True, 10)
+        assert file_info(str(tmp_path / "missing.txt")) == (False, False, 0)
+
+
+class TestMultipartFileBody:
+    """Test the multipart body."""
+
+    def test_headers(self, tmp_path):
+        """Test the quoted filename, boundary and exact content length."""
+        body = MultipartFileBody(str(tmp_path / 'a "b".txt'), 100)
+
+        assert body.headers["Content-Type"] == f"multipart/form-data; boundary={body.boundary}"
+        assert b'filename="a %22b%22.txt"' in body._head
+        assert int(body.headers["Content-Length"]) == len(body._head) + 100 + len(body._tail)
+
+    @pytest.mark.asyncio
+    async def test_streams_file_in_chunks(self, tmp_path):
+        """Test the body parses as form data holding the whole file, and can be sent twice."""
+        data = os.urandom(10_000)
+        path = tmp_path / "doc.bin"
+        path.write_bytes(data)
+        body = MultipartFileBody(str(path), len(data), chunk_size=1024)
+
+        chunks = [chunk async for chunk in body]
+        encoded = b"".join(chunks)
+
+        assert len(chunks) == 12
+        assert len(encoded) == body.content_length
+        parts = _parse(body, encoded)
+        assert parts[0].get_filename() == "doc.bin"
+        assert parts[0].get_payload(decode=True) == data
+        assert await _read_body(body) == encoded
+
+    @pytest.mark.asyncio
+    async def test_file_changed_size(self, tmp_path):
+        """Test a file that grew after its size was taken fails instead of sending a bad body."""
+        path = tmp_path / "doc.txt"
+        path.write_bytes(b"x" * 10)
+        body = MultipartFileBody(str(path), 5)
+
+        with pytest.raises(OSError, match="changed size"):
+            await _read_body(body)
@@ -0,0 +1,95 @@
+"""
+Unit tests for cursor-based pagination of large tool results.
+"""
+
+import pytest
+
+from daniel_lightrag_mcp.client import LightRAGValidationError
+from daniel_lightrag_mcp.pagination import ResultPageCache
+
+
+@pytest.fixture
+def graph_data():
+    return {
+        "nodes": [{"id": f"n{i}"} for i in range(3)],
+        "edges": [{"id": f"e{i}"} for i in range(2)],
+        "is_truncated": True,
+    }
+
+
+class TestResultPageCache:
+    """Test paging through cached results."""
+
+    def test_pages_span_sections(self, graph_data):
+        """Test pages walk nodes then edges and carry scalar fields as metadata."""
+        cache = ResultPageCache()
+
+        first = cache.first_page("get_knowledge_graph", graph_data, page_size=2)
+        second = cache.next_page("get_knowledge_graph", first.next_cursor, page_size=2)
+        last = cache.next_page("get_knowledge_graph", second.next_cursor, page_size=2)
+
+        assert first.items == {"nodes": [{"id": "n0"}, {"id": "n1"}]}
+        assert second.items == {"nodes": [{"id": "n2"}], "edges": [{"id": "e0"}]}
+        assert last.items == {"edges": [{"id": "e1"}]}
+        assert last.next_cursor is None
+        assert first.total_items == 5
+        assert first.section_totals == {"nodes": 3, "edges": 2}
+        assert first.metadata == {"is_truncated": True}
+
+    def test_finished_result_is_released(self, graph_data):
+        """Test the cached result is dropped once its last page is served."""
+        cache = ResultPageCache()
+
+        page = cache.first_page("get_knowledge_graph", graph_data, page_size=5)
+
+        assert page.next_cursor is None
+        assert len(cache) == 0
+
+    def test_documents_flattened_with_status(self):
+        """Test /documents status groups are paged as one list tagged with status."""
+        cache = ResultPageCache()
+        data = {"statuses": {"processed": [{"id": "d1"}], "failed": [{"id": "d2"}]}}
+
+        page = cache.first_page("get_documents", data, page_size=10)
+
+        assert page.items["documents"] == [
+            {"status": "processed", "id": "d1"},
+            {"status": "failed", "id": "d2"},
+        ]
+
+    def test_invalid_and_expired_cursors(self, graph_data):
+        """Test malformed, foreign and expired cursors are rejected."""
+        cache = ResultPageCache(ttl=0)
+        page = cache.first_page("get_knowledge_graph", graph_data, page_size=1)
+
+        with pytest.raises(LightRAGValidationError):
+            cache.next_page("get_knowledge_graph", "not-a-cursor", page_size=1)
+        with pytest.raises(LightRAGValidationError):
+            cache.next_page("get_knowledge_graph", page.next_cursor, page_size=1)
+
+    def test_oldest_result_evicted_when_full(self, graph_data):
+        """Test the cache holds at most max_entries results."""
+        cache = ResultPageCache(max_entries=1)
+        first = cache.first_page("get_knowledge_graph", graph_data, page_size=1)
+        cache.first_page("get_knowledge_graph", graph_data, page_size=1)
+
+        with pytest.raises(LightRAGValidationError):
+            cache.next_page("get_knowledge_graph", first.next_cursor, page_size=1)
+
+    def test_pages_cut_to_output_budget(self, graph_data):
+        """Test a page over the budget returns fewer items and its cursor resumes after the last one."""
+        cache = ResultPageCache()
+
+        def measure(page):
+            # 100 bytes per item
+            return 100 * page.returned
+
+        first = cache.first_page("get_knowledge_graph", graph_data, page_size=5, max_output_bytes=250, measure=measure)
+        second = cache.next_page("get_knowledge_graph", first.next_cursor, page_size=5, max_output_bytes=250, measure=measure)
+        last = cache.next_page("get_knowledge_graph", second.next_cursor, page_size=5, max_output_bytes=250, measure=measure)
+
+        assert first.items == {"nodes": [{"id": "n0"}, {"id": "n1"}]}
+        assert second.items == {"nodes": [{"id": "n2"}], "edges": [{"id": "e0"}]}
+        assert last.items == {"edges": [{"id": "e1"}]}
+        assert last.next_cursor is None
+        assert len(cache) == 0
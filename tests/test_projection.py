@@ -0,0 +1,106 @@
+"""
+Unit tests for field projection and output budgets.
+"""
+
+import json
+
+from daniel_lightrag_mcp.projection import fit_to_budget, project
+
+
+def _encode(value):
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _graph(count):
+    return {
+        "nodes": [
+            {"id": f"entity_{i}", "labels": ["x"], "properties": {"entity_type": "person", "description": "d" * 50}}
+            for i in range(count)
+        ],
+        "edges": [{"id": f"e{i}", "source": f"entity_{i}", "target": "entity_0", "properties": {}} for i in range(count)],
+        "is_truncated": False,
+    }
+
+
+class TestProject:
+    """Test projection of records."""
+
+    def test_graph_records_keep_selected_paths(self):
+        """Test nested paths select keys inside each node and edge, and the envelope stays."""
+        data = _graph(2)
+
+        result = project("get_knowledge_graph", data, ["id", "properties.entity_type", "source"])
+
+        assert result["nodes"][0] == {"id": "entity_0", "properties": {"entity_type": "person"}}
+        assert result["edges"][1] == {"id": "e1", "source": "entity_1"}
+        assert result["is_truncated"] is False
+        assert "description" in data["nodes"][0]["properties"]
+
+    def test_whole_value_wins_over_nested_path(self):
+        """Test selecting a key keeps all of it even when a nested path is also given."""
+        result = project("get_knowledge_graph", _graph(1), ["properties.entity_type", "properties"])
+
+        assert result["nodes"][0] == {"properties": {"entity_type": "person", "description": "d" * 50}}
+
+    def test_documents_grouped_by_status_and_pages(self):
+        """Test documents are projected in /documents status groups and in result pages."""
+        grouped = {"statuses": {"processed": [{"id": "doc_1", "metadata": {"size": 1}}]}}
+        page = {"tool": "get_documents", "items": {"documents": [{"id": "doc_1", "status": "processed", "title": "t"}]},
+                "next_cursor": None, "total_items": 1}
+
+        assert project("get_documents", grouped, ["id"]) == {"statuses": {"processed": [{"id": "doc_1"}]}}
+        assert project("get_documents", page, ["id", "status"])["items"]["documents"] == [{"id": "doc_1", "status": "processed"}]
+        assert project("get_documents", page, ["id"])["total_items"] == 1
+
+    def test_query_response_is_one_record(self):
+        """Test query_text fields select top-level keys of the response."""
+        data = {"response": "answer", "context": "long context", "results": [{"document_id": "d", "snippet": "s"}]}
+
+        assert project("query_text", data, ["response", "results.document_id"]) == {
+            "response": "answer", "results": [{"document_id": "d"}]
+        }
+
+
+class TestFitToBudget:
+    """Test trimming results to an output budget."""
+
+    def test_small_result_untouched(self):
+        """Test results within the budget are returned as-is."""
+        data = _graph(2)
+
+        assert fit_to_budget("get_knowledge_graph", data, 10_000, _encode) is data
+
+    def test_records_dropped_from_the_end(self):
+        """Test records are dropped until the output fits, and omissions are reported."""
+        data = _graph(200)
+
+        result = fit_to_budget("get_knowledge_graph", data, 4096, _encode)
+
+        assert len(_encode(result)) <= 4096
+        assert result["output_truncated"] is True
+        assert result["nodes"] == data["nodes"][:len(result["nodes"])]
+        assert result["omitted_items"] == {"nodes": 200 - len(result["nodes"]), "edges": 200 - len(result["edges"])}
+        assert len(data["nodes"]) == 200
+
+    def test_long_strings_shortened(self):
+        """Test a single-record result has its long strings shortened."""
+        data = {"response": "a" * 10_000, "query": "q"}
+
+        result = fit_to_budget("query_text", data, 1000, _encode)
+
+        assert len(_encode(result)) <= 1000
+        assert result["response"].startswith("aaa") and result["response"].endswith("...")
+        assert result["query"] == "q"
+        assert result["output_truncated"] is True
+
+    def test_pages_keep_records_and_cursor(self):
+        """Test cursor pages are never cut short, since dropped records could not be fetched."""
+        page = {"tool": "get_knowledge_graph", "items": {"nodes": [{"id": "n0", "description": "d" * 5000}]},
+                "next_cursor": "token.1", "returned": 1}
+
+        result = fit_to_budget("get_knowledge_graph", page, 1000, _encode)
+
+        assert len(_encode(result)) <= 1000
+        assert result["items"]["nodes"][0]["id"] == "n0"
+        assert result["next_cursor"] == "token.1"
+        assert result["omitted_items"] == {}
@@ -3,7 +3,9 @@ Unit tests for MCP server functionality.
 """
 
 import pytest
+import importlib
 import json
+import threading
 from unittest.mock import AsyncMock, patch, MagicMock
 from mcp.types import CallToolRequest, CallToolResult, ListToolsRequest
 
@@ -20,6 +22,11 @@ from daniel_lightrag_mcp.client import (
     LightRAGValidationError,
     LightRAGAPIError
 )
+from daniel_lightrag_mcp.compact_graph import CompactGraph
+from daniel_lightrag_mcp.models import GraphResponse, LabelsResponse, TrackWaitResponse
+
+# The package re-exports the Server instance as ``server``, so patch the module object directly
+server_module = importlib.import_module("daniel_lightrag_mcp.server")
 
 
 class TestServerToolListing:
@@ -770,4 +777,248 @@ class TestErrorHandling:
             assert result.isError
             content = json.loads(result.content[0].text)
             assert content["error_type"] == "LightRAGConnectionError"
-            assert "Failed to initialize LightRAG client" in content["message"]
\ No newline at end of file
+            assert "Failed to initialize LightRAG client" in content["message"]
+
+
+@pytest.mark.asyncio
+class TestIngestionWaitTools:
+    """Test MCP tools that wait for ingestion to finish."""
+    
+    async def test_insert_text_and_wait_success(self):
+        """Test insert_text_and_wait forwards the timeout and returns the wait result."""
+        wait_result = TrackWaitResponse(
+            track_id="track_123", status="processed", completed=True, elapsed_seconds=1.5, polls=3
+        )
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.insert_text_and_wait = AsyncMock(return_value=wait_result)
+            result = await handle_call_tool("insert_text_and_wait", {"text": "test", "timeout_seconds": 30})
+        
+        assert "isError" not in result
+        mock_client.insert_text_and_wait.assert_called_once_with("test", timeout=30.0)
+        content = json.loads(result["content"][0]["text"])
+        assert content["status"] == "processed"
+        assert content["elapsed_seconds"] == 1.5
+    
+    async def test_upload_document_and_wait_invalid_timeout(self):
+        """Test a non-positive timeout is rejected before any upload."""
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.upload_document_and_wait = AsyncMock()
+            result = await handle_call_tool("upload_document_and_wait", {"file_path": "/tmp/a.txt", "timeout_seconds": 0})
+        
+        assert result["isError"] is True
+        mock_client.upload_document_and_wait.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestKnowledgeGraphSubsetTools:
+    """Test fetching a labeled, size-limited subgraph."""
+    
+    async def test_get_knowledge_graph_forwards_limits(self):
+        """Test label, max_depth and max_nodes are passed through to the client."""
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.get_knowledge_graph = AsyncMock(return_value=GraphResponse(nodes=[{"id": "A"}]))
+            result = await handle_call_tool(
+                "get_knowledge_graph", {"label": "A", "max_depth": 2, "max_nodes": 50}
+            )
+        
+        assert "isError" not in result
+        mock_client.get_knowledge_graph.assert_called_once_with(label="A", max_depth=2, max_nodes=50)
+    
+    async def test_get_knowledge_graph_compact_format(self):
+        """Test the compact format returns minified columnar JSON."""
+        compact = CompactGraph.from_response({
+            "nodes": [{"id": "A"}, {"id": "B"}],
+            "edges": [{"source": "A", "target": "B"}],
+        })
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.get_knowledge_graph_compact = AsyncMock(return_value=compact)
+            result = await handle_call_tool("get_knowledge_graph", {"format": "compact"})
+        
+        text = result["content"][0]["text"]
+        assert "\n" not in text
+        content = json.loads(text)
+        assert content["nodes"]["id"] == ["A", "B"]
+        assert content["edges"]["target"] == [1]
+    
+    async def test_get_knowledge_graph_invalid_max_nodes(self):
+        """Test a non-positive node cap is rejected before any request."""
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.get_knowledge_graph = AsyncMock()
+            result = await handle_call_tool("get_knowledge_graph", {"max_nodes": 0})
+        
+        assert result["isError"] is True
+        mock_client.get_knowledge_graph.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestPaginatedTools:
+    """Test cursor pagination of large tool results."""
+    
+    async def test_get_graph_labels_cursor_round_trip(self):
+        """Test later pages are served from the cursor without another upstream call."""
+        labels = LabelsResponse(entity_labels=[f"label_{i}" for i in range(5)])
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.get_graph_labels = AsyncMock(return_value=labels)
+            first = await handle_call_tool("get_graph_labels", {"page_size": 3})
+            first_page = json.loads(first["content"][0]["text"])
+            second = await handle_call_tool("get_graph_labels", {"cursor": first_page["next_cursor"], "page_size": 3})
+        
+        second_page = json.loads(second["content"][0]["text"])
+        assert first_page["items"]["entity_labels"] == ["label_0", "label_1", "label_2"]
+        assert second_page["items"]["entity_labels"] == ["label_3", "label_4"]
+        assert second_page["next_cursor"] is None
+        mock_client.get_graph_labels.assert_called_once()
+    
+    async def test_small_result_not_paginated(self):
+        """Test results within the default page size keep their original shape."""
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.get_knowledge_graph = AsyncMock(return_value=GraphResponse(nodes=[{"id": "A"}]))
+            result = await handle_call_tool("get_knowledge_graph", {})
+        
+        content = json.loads(result["content"][0]["text"])
+        assert content["nodes"] == [{"id": "A"}]
+
+
+class TestSerializationOffload:
+    """Test large results are serialized off the event loop."""
+    
+    @pytest.mark.asyncio
+    async def test_large_result_serialized_in_worker_thread(self, monkeypatch):
+        """Test results above the threshold are serialized outside the event loop thread."""
+        monkeypatch.setenv("LIGHTRAG_SERIALIZE_OFFLOAD_ITEMS", "3")
+        threads = []
+        original = server_module._create_success_response
+        
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return original(*args, **kwargs)
+        
+        with patch.object(server_module, "_create_success_response", side_effect=record_thread):
+            small = await server_module._create_success_response_async(GraphResponse(nodes=[{"id": "A"}]), "test_tool")
+            large = await server_module._create_success_response_async(
+                GraphResponse(nodes=[{"id": "A"}, {"id": "B"}, {"id": "C"}]), "test_tool"
+            )
+        
+        assert threads[0] is threading.main_thread()
+        assert threads[1] is not threading.main_thread()
+        assert json.loads(small["content"][0]["text"])["nodes"] == [{"id": "A"}]
+        assert len(json.loads(large["content"][0]["text"])["nodes"]) == 3
+    
+    def test_large_result_not_logged_in_full(self, monkeypatch):
+        """Test large results are logged by size instead of repr."""
+        monkeypatch.setenv("LIGHTRAG_SERIALIZE_OFFLOAD_ITEMS", "3")
+        
+        assert server_module._describe_result([1, 2]) == "[1, 2]"
+        assert server_module._describe_result([1, 2, 3]) == "not logged (3 items)"
+
+
+class TestResultSpilling:
+    """Test oversized results are written to disk and served as resources."""
+    
+    @pytest.mark.asyncio
+    async def test_large_result_spilled_and_readable(self, tmp_path, monkeypatch):
+        """Test output above the threshold is replaced by a summary pointing at a resource."""
+        monkeypatch.setenv("LIGHTRAG_SPILL_THRESHOLD", "100")
+        monkeypatch.setenv("LIGHTRAG_SPILL_DIR", str(tmp_path))
+        monkeypatch.setattr(server_module, "spill_store", None)
+        graph = GraphResponse(nodes=[{"id": f"entity_{i}"} for i in range(20)])
+        
+        response = _create_success_response(graph, "get_knowledge_graph")
+        summary = json.loads(response["content"][0]["text"])
+        
+        assert summary["section_totals"] == {"nodes": 20, "edges": 0}
+        assert summary["output_chars"] == len(json.dumps(graph.model_dump(), separators=(",", ":")))
+        resources = await server_module.handle_list_resources()
+        assert [str(resource.uri) for resource in resources] == [summary["uri"]]
+        contents = await server_module.handle_read_resource(summary["uri"])
+        assert json.loads(contents[0].content) == graph.model_dump()
+    
+    def test_small_result_returned_inline(self, tmp_path, monkeypatch):
+        """Test output within the threshold is not spilled."""
+        monkeypatch.setenv("LIGHTRAG_SPILL_THRESHOLD", "100")
+        monkeypatch.setenv("LIGHTRAG_SPILL_DIR", str(tmp_path))
+        monkeypatch.setattr(server_module, "spill_store", None)
+        
+        response = _create_success_response({"status": "ok"}, "test_tool")
+        
+        assert json.loads(response["content"][0]["text"]) == {"status": "ok"}
+        assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+class TestOutputShaping:
+    """Test fields projection and max_output_bytes on read tools."""
+    
+    async def test_get_knowledge_graph_fields_and_budget(self):
+        """Test only selected node fields are returned and output stays within the budget."""
+        graph = GraphResponse(
+            nodes=[{"id": f"entity_{i}", "properties": {"entity_type": "person", "description": "x" * 100}} for i in range(50)]
+        )
+        arguments = {"fields": ["id", "properties.entity_type"], "max_output_bytes": 1024, "page_size": 100}
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.get_knowledge_graph = AsyncMock(return_value=graph)
+            result = await handle_call_tool("get_knowledge_graph", arguments)
+        
+        text = result["content"][0]["text"]
+        content = json.loads(text)
+        assert len(text.encode("utf-8")) <= 1024
+        assert content["items"]["nodes"][0] == {"id": "entity_0", "properties": {"entity_type": "person"}}
+        assert "output_truncated" not in content
+        assert content["next_cursor"] == content["next_cursor"].rpartition(".")[0] + f".{content['returned']}"
+    
+    async def test_budget_pages_cover_every_record(self):
+        """Test walking cursor pages under a budget returns every record exactly once."""
+        graph = GraphResponse(
+            nodes=[{"id": f"entity_{i}", "properties": {"description": "x" * 100}} for i in range(500)],
+            edges=[{"id": f"e{i}", "source": f"entity_{i}", "target": "entity_0"} for i in range(300)],
+        )
+        arguments = {"max_output_bytes": 4000, "page_size": 200}
+        seen = {"nodes": [], "edges": []}
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.get_knowledge_graph = AsyncMock(return_value=graph)
+            result = await handle_call_tool("get_knowledge_graph", arguments)
+            while True:
+                text = result["content"][0]["text"]
+                content = json.loads(text)
+                assert len(text.encode("utf-8")) <= 4000
+                for name, items in content["items"].items():
+                    seen[name].extend(item["id"] for item in items)
+                if not content["next_cursor"]:
+                    break
+                result = await handle_call_tool("get_knowledge_graph", {**arguments, "cursor": content["next_cursor"]})
+        
+        assert seen["nodes"] == [f"entity_{i}" for i in range(500)]
+        assert seen["edges"] == [f"e{i}" for i in range(300)]
+    
+    async def test_budget_pages_small_result(self):
+        """Test a result that fits one page but not the budget is paged instead of losing records."""
+        graph = GraphResponse(nodes=[{"id": f"entity_{i}", "properties": {"description": "x" * 100}} for i in range(50)])
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.get_knowledge_graph = AsyncMock(return_value=graph)
+            result = await handle_call_tool("get_knowledge_graph", {"max_output_bytes": 1024})
+        
+        content = json.loads(result["content"][0]["text"])
+        assert content["next_cursor"]
+        assert content["total_items"] == 50
+        assert "omitted_items" not in content
+    
+    async def test_query_text_fields(self):
+        """Test query_text returns only the selected response fields."""
+        with patch.object(server_module, "lightrag_client") as mock_client:
+            mock_client.query_text = AsyncMock(return_value={"response": "answer", "context": "long context"})
+            result = await handle_call_tool("query_text", {"query": "q", "fields": ["response"]})
+        
+        assert json.loads(result["content"][0]["text"]) == {"response": "answer"}
+    
+    async def test_invalid_shaping_arguments(self):
+        """Test malformed fields and budgets are rejected."""
+        with pytest.raises(LightRAGValidationError, match="fields"):
+            _validate_tool_arguments("get_documents", {"fields": ["id", "properties..type"]})
+        with pytest.raises(LightRAGValidationError, match="max_output_bytes"):
+            _validate_tool_arguments("query_text", {"query": "q", "max_output_bytes": 10})
+        with pytest.raises(LightRAGValidationError, match="compact"):
+            _validate_tool_arguments("get_knowledge_graph", {"format": "compact", "fields": ["id"]})
+        with pytest.raises(LightRAGValidationError, match="compact"):
+            _validate_tool_arguments("get_knowledge_graph", {"format": "compact", "page_size": 200})
+        with pytest.raises(LightRAGValidationError, match="compact"):
+            _validate_tool_arguments("get_knowledge_graph", {"format": "compact", "cursor": "token.200"})
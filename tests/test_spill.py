@@ -0,0 +1,75 @@
+"""
+Unit tests for spilling large tool results to disk.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from daniel_lightrag_mcp.client import LightRAGValidationError
+from daniel_lightrag_mcp.models import GraphResponse
+from daniel_lightrag_mcp.spill import SPILL_URI_PREFIX, SpillStore, summarize
+
+
+class TestSpillStore:
+    """Test writing, reading and evicting spill files."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_round_trip(self, tmp_path, compress):
+        """Test pieces are written as one file and read back by URI or name."""
+        store = SpillStore(str(tmp_path), compress=compress)
+
+        spilled = store.spill("get_knowledge_graph", ['{"nodes":', "[1,2,3]", "}"])
+
+        assert spilled.uri == SPILL_URI_PREFIX + spilled.name
+        assert spilled.name.endswith(".json.gz" if compress else ".json")
+        assert spilled.file_bytes == os.path.getsize(spilled.path)
+        assert json.loads(store.read(spilled.uri)) == {"nodes": [1, 2, 3]}
+        assert store.read(spilled.name) == '{"nodes":[1,2,3]}'
+
+    def test_unknown_names_rejected(self, tmp_path):
+        """Test only spill file names are readable, so paths cannot escape the directory."""
+        store = SpillStore(str(tmp_path))
+
+        with pytest.raises(LightRAGValidationError, match="Unknown"):
+            store.read(SPILL_URI_PREFIX + "../secret.json")
+        with pytest.raises(LightRAGValidationError, match="expired"):
+            store.read("query_text-AAAAAAAAAAAAAAAA.json")
+
+    def test_evicts_oldest_beyond_max_files(self, tmp_path):
+        """Test the oldest files are removed once max_files is exceeded."""
+        store = SpillStore(str(tmp_path), max_files=2)
+        first = store.spill("query_text", ["1"])
+        os.utime(first.path, (time.time() - 10, time.time() - 10))
+        second = store.spill("query_text", ["2"])
+        third = store.spill("query_text", ["3"])
+
+        assert [spilled.name for spilled in store.list()] == [third.name, second.name]
+        assert not os.path.exists(first.path)
+
+    def test_evicts_expired_and_keeps_foreign_files(self, tmp_path):
+        """Test expired files are removed and unrelated files are left alone."""
+        store = SpillStore(str(tmp_path), ttl=60.0)
+        spilled = store.spill("query_text", ["1"])
+        os.utime(spilled.path, (time.time() - 120, time.time() - 120))
+        other = tmp_path / "notes.json"
+        other.write_text("{}")
+
+        assert store.evict() == 1
+        assert store.list() == []
+        assert other.exists()
+
+
+class TestSummarize:
+    """Test the inline summary of a spilled result."""
+
+    def test_summarize_model(self):
+        """Test list fields are counted and long strings shortened."""
+        graph = GraphResponse(nodes=[{"id": "A"}, {"id": "B"}], edges=[], is_truncated=True)
+
+        assert summarize(graph) == ({"nodes": 2, "edges": 0}, {"is_truncated": True})
+        section_totals, metadata = summarize({"streaming_response": "x" * 500})
+        assert section_totals == {}
+        assert metadata["streaming_response"] == "x" * 200 + "..."